@@ -0,0 +1,90 @@
+"""Throughput benchmark for authenticated endpoints.
+
+Fires concurrent authenticated requests at GET /api/contacts/ through an
+in-process ASGI transport and reports requests per second and latency
+percentiles. Pass ``--blocking-redis`` to swap the asyncio Redis client for
+the synchronous one, which reproduces the behaviour before the switch.
+
+Requires a running Redis server (see docker-compose.yml).
+
+Usage:
+    poetry run python -m benchmarks.auth_throughput --requests 2000 --concurrency 50
+    poetry run python -m benchmarks.auth_throughput --blocking-redis
+"""
+
+import argparse
+import asyncio
+import time
+
+import redis
+
+from benchmarks.common import BENCH_USERNAME, client, report, setup_app
+from src.conf.config import settings
+from src.database.redis import redis_manager
+from src.services.auth import create_access_token
+
+
+class BlockingRedis:
+    """Async facade over the synchronous client that blocks the event loop."""
+
+    def __init__(self):
+        self._client = redis.Redis(
+            host=settings.REDIS_HOST, port=settings.REDIS_PORT, db=settings.REDIS_DB
+        )
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if not callable(attr):
+            return attr
+
+        async def call(*args, **kwargs):
+            return attr(*args, **kwargs)
+
+        return call
+
+
+async def run(total: int, concurrency: int) -> list[float]:
+    token = await create_access_token({"sub": BENCH_USERNAME})
+    headers = {"Authorization": f"Bearer {token}"}
+    latencies: list[float] = []
+    remaining = iter(range(total))
+
+    async with client() as http:
+
+        async def worker():
+            for _ in remaining:
+                start = time.perf_counter()
+                response = await http.get("/api/contacts/", headers=headers)
+                latencies.append(time.perf_counter() - start)
+                response.raise_for_status()
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies
+
+
+async def main(args):
+    engine, _ = await setup_app()
+    if args.blocking_redis:
+        redis_manager._client = BlockingRedis()
+    else:
+        await redis_manager.connect()
+
+    await run(min(100, args.requests), args.concurrency)  # warm-up
+    started = time.perf_counter()
+    latencies = await run(args.requests, args.concurrency)
+    elapsed = time.perf_counter() - started
+
+    mode = "blocking" if args.blocking_redis else "asyncio"
+    report(f"redis client: {mode} (concurrency {args.concurrency})", latencies, elapsed)
+
+    if not args.blocking_redis:
+        await redis_manager.close()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--blocking-redis", action="store_true")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,88 @@
+"""Shared helpers for the benchmark scripts.
+
+Each benchmark runs the FastAPI app in-process through an httpx ASGI
+transport against a throw-away SQLite database seeded with one confirmed
+user, so no server or Postgres instance is needed.
+"""
+
+import statistics
+
+import httpx
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from main import app
+from src.database.db import get_db, get_read_db, get_read_db_context
+from src.database.models import Base, User, UserRole
+from src.services.auth import Hash
+
+BENCH_DB_URL = "sqlite+aiosqlite:///./bench.db"
+BENCH_USERNAME = "bench"
+BENCH_PASSWORD = "bench-password"
+
+
+async def setup_app(db_url: str = BENCH_DB_URL, reuse: bool = False):
+    """Create a fresh schema with one confirmed user and route the app to it.
+
+    Args:
+        db_url (str): Database URL for the benchmark database.
+        reuse (bool): Keep an already seeded database instead of recreating it.
+
+    Returns:
+        tuple: The engine and session maker bound to the benchmark database.
+    """
+    engine = create_async_engine(db_url)
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    if not reuse:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+        async with session_maker() as session:
+            session.add(
+                User(
+                    username=BENCH_USERNAME,
+                    email=f"{BENCH_USERNAME}@example.com",
+                    hashed_password=Hash().get_password_hash(BENCH_PASSWORD),
+                    confirmed=True,
+                    avatar="bench-avatar",
+                    role=UserRole.USER,
+                )
+            )
+            await session.commit()
+
+    async def override_get_db():
+        async with session_maker() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_read_db_context] = lambda: session_maker()
+    return engine, session_maker
+
+
+def client() -> httpx.AsyncClient:
+    """Return an HTTP client bound to the in-process app.
+
+    Returns:
+        httpx.AsyncClient: Client using an ASGI transport.
+    """
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench"
+    )
+
+
+def report(label: str, latencies: list[float], elapsed: float | None = None) -> None:
+    """Print throughput and latency percentiles for a run.
+
+    Args:
+        label (str): Name of the measured scenario.
+        latencies (list[float]): Per-request latencies in seconds.
+        elapsed (float | None): Wall-clock duration of the run in seconds.
+    """
+    latencies = sorted(latencies)
+    p99 = latencies[max(int(len(latencies) * 0.99) - 1, 0)]
+    print(f"{label}")
+    print(f"  requests:    {len(latencies)}")
+    if elapsed:
+        print(f"  throughput:  {len(latencies) / elapsed:.1f} req/s")
+    print(f"  p50 latency: {statistics.median(latencies) * 1000:.2f} ms")
+    print(f"  p99 latency: {p99 * 1000:.2f} ms")
@@ -0,0 +1,140 @@
+"""Memory use of the streaming contact export.
+
+Seeds one user with many contacts, then streams
+``GET /api/contacts/export`` through the ASGI app, discarding chunks as they
+arrive, while sampling the process RSS. For comparison it then loads and
+serializes all contacts at once, as a non-streaming endpoint would.
+
+The app is driven directly rather than through httpx, whose ASGI transport
+buffers the whole response body. RSS is read from ``/proc``, so the numbers
+are only reported on Linux.
+
+Seeding a million contacts takes a few minutes; pass ``--reuse`` to run
+again on an already seeded database.
+
+Usage:
+    poetry run python -m benchmarks.contact_export --contacts 1000000
+    poetry run python -m benchmarks.contact_export --reuse --format csv
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from sqlalchemy import func, select
+
+from benchmarks.common import BENCH_DB_URL, BENCH_USERNAME, setup_app
+from benchmarks.contact_search import seed
+from main import app
+from src.database.models import Contact, User
+from src.services.auth import create_access_token
+from src.services.contacts import dump_contacts
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+
+def rss() -> int:
+    """Return the resident set size of this process in bytes."""
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * PAGE_SIZE
+
+
+async def sample_rss(peak: list[int], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        peak[0] = max(peak[0], rss())
+        await asyncio.sleep(0.01)
+
+
+async def export(token: str, fmt: str) -> tuple[int, int]:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/contacts/export",
+        "raw_path": b"/api/contacts/export",
+        "query_string": f"format={fmt}".encode(),
+        "root_path": "",
+        "headers": [(b"host", b"bench"), (b"authorization", f"Bearer {token}".encode())],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+    received = {"bytes": 0, "lines": 0, "status": None}
+    requested = asyncio.Event()
+
+    async def receive():
+        if requested.is_set():
+            # Starlette listens for a disconnect until the body is sent.
+            await asyncio.Event().wait()
+        requested.set()
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            received["status"] = message["status"]
+        elif message["type"] == "http.response.body":
+            body = message.get("body", b"")
+            received["bytes"] += len(body)
+            received["lines"] += body.count(b"\n")
+
+    await app(scope, receive, send)
+    assert received["status"] == 200, received["status"]
+    return received["bytes"], received["lines"]
+
+
+async def measure(label: str, run) -> None:
+    baseline = rss()
+    peak, stop = [baseline], asyncio.Event()
+    sampler = asyncio.create_task(sample_rss(peak, stop))
+    started = time.perf_counter()
+    size, rows = await run()
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await sampler
+    peak[0] = max(peak[0], rss())
+    print(f"{label}")
+    print(f"  rows:          {rows}")
+    print(f"  bytes:         {size / 2**20:.1f} MiB")
+    print(f"  duration:      {elapsed:.1f} s ({rows / elapsed:.0f} rows/s)")
+    print(f"  peak RSS:      {peak[0] / 2**20:.1f} MiB")
+    print(f"  RSS growth:    {(peak[0] - baseline) / 2**20:.1f} MiB")
+
+
+async def main(args):
+    engine, session_maker = await setup_app(args.db_url, reuse=args.reuse)
+    async with session_maker() as session:
+        user = (
+            await session.execute(select(User).filter_by(username=BENCH_USERNAME))
+        ).scalar_one()
+        existing = (
+            await session.execute(select(func.count()).select_from(Contact))
+        ).scalar_one()
+    if not existing:
+        await seed(session_maker, user.id, args.contacts)
+
+    token = await create_access_token({"sub": BENCH_USERNAME})
+    await measure(
+        f"streaming export ({args.format})", lambda: export(token, args.format)
+    )
+
+    async def load_all():
+        async with session_maker() as session:
+            contacts = (
+                await session.execute(select(Contact).filter_by(user_id=user.id))
+            ).scalars().all()
+            payload = dump_contacts(contacts)
+        return len(payload), len(contacts)
+
+    await measure("load and serialize all at once", load_all)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--contacts", type=int, default=1_000_000)
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    parser.add_argument("--db-url", default=BENCH_DB_URL)
+    parser.add_argument("--reuse", action="store_true")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,68 @@
+"""Throughput of the bulk contact import against one POST per contact.
+
+Uploads generated contacts to ``POST /api/contacts/import`` as NDJSON, then
+creates a smaller sample one ``POST /api/contacts`` request at a time, and
+reports contacts created per second for both.
+
+Usage:
+    poetry run python -m benchmarks.contact_import --contacts 100000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from benchmarks.common import BENCH_USERNAME, client, setup_app
+from src.services.auth import create_access_token
+
+
+def contact(i: int) -> dict:
+    return {
+        "first_name": "Imported",
+        "last_name": f"Contact{i % 1000}",
+        "email": f"import{i}@example.com",
+        "phone": f"+380{i:09d}",
+        "birthday": f"{1970 + i % 40}-{1 + i % 12:02d}-{1 + i % 28:02d}",
+        "additional_info": "",
+    }
+
+
+async def main(args):
+    engine, _ = await setup_app()
+    token = await create_access_token({"sub": BENCH_USERNAME})
+    headers = {"Authorization": f"Bearer {token}"}
+    upload = "\n".join(json.dumps(contact(i)) for i in range(args.contacts)).encode()
+
+    async with client() as http:
+        started = time.perf_counter()
+        response = await http.post(
+            "/api/contacts/import",
+            content=upload,
+            headers={**headers, "Content-Type": "application/x-ndjson"},
+            timeout=None,
+        )
+        elapsed = time.perf_counter() - started
+        response.raise_for_status()
+        imported = response.json()["imported"]
+        print("bulk import (NDJSON)")
+        print(f"  contacts:    {imported}")
+        print(f"  throughput:  {imported / elapsed:.0f} contacts/s")
+
+        started = time.perf_counter()
+        for i in range(args.contacts, args.contacts + args.single):
+            response = await http.post("/api/contacts/", json=contact(i), headers=headers)
+            response.raise_for_status()
+        elapsed = time.perf_counter() - started
+        print("one POST per contact")
+        print(f"  contacts:    {args.single}")
+        print(f"  throughput:  {args.single / elapsed:.0f} contacts/s")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--contacts", type=int, default=100_000)
+    parser.add_argument("--single", type=int, default=1000)
+    asyncio.run(main(parser.parse_args()))
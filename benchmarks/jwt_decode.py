@@ -0,0 +1,41 @@
+"""Microbenchmark of access-token verification with and without the cache.
+
+Compares a full python-jose ``jwt.decode`` (parse, HMAC check, claim
+validation) with :func:`src.services.auth.decode_access_token`, which
+serves repeat tokens from the verified-token cache.
+
+Usage:
+    poetry run python -m benchmarks.jwt_decode --iterations 100000
+"""
+
+import argparse
+import asyncio
+import timeit
+
+from jose import jwt
+
+from src.conf.config import settings
+from src.services.auth import create_access_token, decode_access_token
+
+
+def main(args):
+    token = asyncio.run(create_access_token({"sub": "bench"}))
+    decode_access_token(token)  # populate the cache
+
+    uncached = timeit.timeit(
+        lambda: jwt.decode(
+            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
+        ),
+        number=args.iterations,
+    )
+    cached = timeit.timeit(lambda: decode_access_token(token), number=args.iterations)
+
+    for label, total in (("jwt.decode", uncached), ("decode_access_token", cached)):
+        print(f"{label:<20} {total / args.iterations * 1e6:8.2f} us/call")
+    print(f"speed-up: {uncached / cached:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=100000)
+    main(parser.parse_args())
@@ -0,0 +1,91 @@
+"""Latency of GET /api/contacts/ while a burst of logins is in progress.
+
+A steady probe requests GET /api/contacts/ one at a time while a burst of
+concurrent POST /api/auth/login calls runs bcrypt. With hashing on the
+executor the probe's p99 stays close to its idle value. Pass
+``--inline-hash`` to run bcrypt on the event loop again for comparison.
+
+Requires a running Redis server (see docker-compose.yml).
+
+Usage:
+    poetry run python -m benchmarks.login_burst_latency --logins 40
+    poetry run python -m benchmarks.login_burst_latency --logins 40 --inline-hash
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks.common import (
+    BENCH_PASSWORD,
+    BENCH_USERNAME,
+    client,
+    report,
+    setup_app,
+)
+from src.database.redis import redis_manager
+from src.services.auth import Hash, create_access_token
+
+
+async def probe(http, headers, stop: asyncio.Event) -> list[float]:
+    latencies = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        response = await http.get("/api/contacts/", headers=headers)
+        latencies.append(time.perf_counter() - start)
+        response.raise_for_status()
+    return latencies
+
+
+async def login_burst(http, logins: int) -> None:
+    form = {"username": BENCH_USERNAME, "password": BENCH_PASSWORD}
+    responses = await asyncio.gather(
+        *(http.post("/api/auth/login", data=form) for _ in range(logins)),
+        return_exceptions=True,
+    )
+    failed = [r for r in responses if isinstance(r, Exception) or r.status_code != 200]
+    if failed:
+        print(f"  {len(failed)} of {logins} logins failed, e.g. {failed[0]!r}")
+
+
+async def measure(http, headers, logins: int) -> list[float]:
+    stop = asyncio.Event()
+    probe_task = asyncio.create_task(probe(http, headers, stop))
+    if logins:
+        await login_burst(http, logins)
+    else:
+        await asyncio.sleep(2)
+    stop.set()
+    return await probe_task
+
+
+async def main(args):
+    engine, _ = await setup_app()
+    await redis_manager.connect()
+    if args.inline_hash:
+
+        async def inline_verify(self, plain_password, hashed_password):
+            return self.verify_password(plain_password, hashed_password)
+
+        Hash.verify_password_async = inline_verify
+
+    token = await create_access_token({"sub": BENCH_USERNAME})
+    headers = {"Authorization": f"Bearer {token}"}
+    async with client() as http:
+        report("idle probe", await measure(http, headers, 0))
+        mode = "inline" if args.inline_hash else "executor"
+        report(
+            f"probe during {args.logins} logins (bcrypt {mode})",
+            await measure(http, headers, args.logins),
+        )
+
+    Hash.shutdown_executor()
+    await redis_manager.close()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=40)
+    parser.add_argument("--inline-hash", action="store_true")
+    asyncio.run(main(parser.parse_args()))
@@ -9,26 +9,65 @@ The application provides:
 - Rate limiting
 - CORS support
 - Health checking utilities
+- Shared Redis connection pool opened on startup and closed on shutdown
+- Warm-up of database, Redis and mail clients before the first request
+- Per-worker principal cache kept coherent through Redis pub/sub
+- Password hashing on a dedicated executor, shut down with the app
+- Bounded database pool checkout that fails fast with 503
+- Read-replica routing with read-your-writes stickiness
 
 Environment variables required:
-- Database configuration (see config.py)
+- Database configuration and pool settings (see config.py)
+- Redis connection and pool settings
 - JWT settings for authentication
 - Cloudinary settings for avatar storage
 """
 
+from contextlib import asynccontextmanager
+
 from src.api import auth
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi import FastAPI, Request, status
 from starlette.responses import JSONResponse
 from slowapi.errors import RateLimitExceeded
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 
 from src.api import utils, contacts, users
+from src.conf.config import settings
+from src.database.db import ReadYourWritesMiddleware, sessionmanager
+from src.database.redis import redis_manager
+from src.services.auth import Hash
+from src.services.email import mailer
+from src.services.user_cache import user_cache
+from src.services.warmup import warm_up
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open and warm shared clients on startup and release them on shutdown.
+
+    Args:
+        app (FastAPI): The application instance.
+
+    Yields:
+        None: Control to the running application.
+    """
+    await redis_manager.connect()
+    await warm_up()
+    user_cache.start_listener()
+    yield
+    await user_cache.stop_listener()
+    await redis_manager.close()
+    await sessionmanager.close()
+    mailer.close()
+    Hash.shutdown_executor()
 
 
 app = FastAPI(
     title="Contact Management API",
     description="REST API for managing contacts with user authentication",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -40,6 +79,7 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(ReadYourWritesMiddleware)
 
 
 @app.exception_handler(RateLimitExceeded)
@@ -62,6 +102,28 @@ async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
     )
 
 
+@app.exception_handler(PoolTimeoutError)
+async def pool_timeout_handler(request: Request, exc: PoolTimeoutError):
+    """Handle database connection pool checkout timeouts.
+
+    When every pooled connection is busy for longer than the pool timeout,
+    the request is rejected quickly with 503 Service Unavailable instead of
+    queueing behind the saturated pool.
+
+    Args:
+        request (Request): The request that could not get a connection.
+        exc (PoolTimeoutError): The pool timeout exception.
+
+    Returns:
+        JSONResponse: Error response with 503 status code and Retry-After.
+    """
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "База даних перевантажена, спробуйте пізніше"},
+        headers={"Retry-After": str(settings.DB_RETRY_AFTER_SECONDS)},
+    )
+
+
 # Include routers with /api prefix
 app.include_router(utils.router, prefix="/api")
 app.include_router(contacts.router, prefix="/api")
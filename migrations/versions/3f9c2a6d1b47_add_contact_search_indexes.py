@@ -0,0 +1,83 @@
+"""Add contact search indexes
+
+Trigram GIN indexes on PostgreSQL and an FTS5 trigram table on SQLite, so
+substring searches by first name, last name and email no longer scan the
+contacts table.
+
+Revision ID: 3f9c2a6d1b47
+Revises: 7e1816da878f
+Create Date: 2026-10-17 09:12:40.318204
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9c2a6d1b47"
+down_revision: Union[str, None] = "7e1816da878f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_COLUMNS = ("first_name", "last_name", "email")
+
+SQLITE_FTS = (
+    "CREATE VIRTUAL TABLE contacts_fts USING fts5("
+    "first_name, last_name, email, content='contacts', content_rowid='id', "
+    "tokenize='trigram')",
+    "CREATE TRIGGER contacts_fts_insert AFTER INSERT ON contacts BEGIN "
+    "INSERT INTO contacts_fts(rowid, first_name, last_name, email) "
+    "VALUES (new.id, new.first_name, new.last_name, new.email); END",
+    "CREATE TRIGGER contacts_fts_delete AFTER DELETE ON contacts BEGIN "
+    "INSERT INTO contacts_fts(contacts_fts, rowid, first_name, last_name, email) "
+    "VALUES ('delete', old.id, old.first_name, old.last_name, old.email); END",
+    "CREATE TRIGGER contacts_fts_update AFTER UPDATE OF first_name, last_name, email "
+    "ON contacts BEGIN "
+    "INSERT INTO contacts_fts(contacts_fts, rowid, first_name, last_name, email) "
+    "VALUES ('delete', old.id, old.first_name, old.last_name, old.email); "
+    "INSERT INTO contacts_fts(rowid, first_name, last_name, email) "
+    "VALUES (new.id, new.first_name, new.last_name, new.email); END",
+    # Index the rows that already exist.
+    "INSERT INTO contacts_fts(contacts_fts) VALUES ('rebuild')",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+        with op.get_context().autocommit_block():
+            for column in SEARCH_COLUMNS:
+                op.create_index(
+                    f"ix_contacts_{column}_trgm",
+                    "contacts",
+                    [column],
+                    postgresql_using="gin",
+                    postgresql_ops={column: "gin_trgm_ops"},
+                    postgresql_concurrently=True,
+                    if_not_exists=True,
+                )
+    elif dialect == "sqlite":
+        for statement in SQLITE_FTS:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        with op.get_context().autocommit_block():
+            for column in SEARCH_COLUMNS:
+                op.drop_index(
+                    f"ix_contacts_{column}_trgm",
+                    table_name="contacts",
+                    postgresql_concurrently=True,
+                    if_exists=True,
+                )
+    elif dialect == "sqlite":
+        for trigger in ("insert", "delete", "update"):
+            op.execute(f"DROP TRIGGER IF EXISTS contacts_fts_{trigger}")
+        op.execute("DROP TABLE IF EXISTS contacts_fts")
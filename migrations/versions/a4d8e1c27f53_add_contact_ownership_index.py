@@ -0,0 +1,52 @@
+"""Add contact ownership index
+
+Index contacts by (user_id, id). Every contact query filters by owner, the
+list endpoint pages by ID, and the ON DELETE CASCADE from users looks rows
+up by user_id. On PostgreSQL the index is built CONCURRENTLY, outside the
+migration transaction, so the table stays writable while it builds.
+
+Revision ID: a4d8e1c27f53
+Revises: 3f9c2a6d1b47
+Create Date: 2026-10-17 10:02:11.540392
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a4d8e1c27f53"
+down_revision: Union[str, None] = "3f9c2a6d1b47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+        with op.get_context().autocommit_block():
+            op.create_index(
+                "ix_contacts_user_id_id",
+                "contacts",
+                ["user_id", "id"],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+    else:
+        op.create_index("ix_contacts_user_id_id", "contacts", ["user_id", "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                "ix_contacts_user_id_id",
+                table_name="contacts",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+    else:
+        op.drop_index("ix_contacts_user_id_id", table_name="contacts")
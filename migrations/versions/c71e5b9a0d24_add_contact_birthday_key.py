@@ -0,0 +1,72 @@
+"""Add contact birthday key
+
+Store each contact's birthday as ``month * 100 + day`` and index it with
+the owner, so upcoming birthdays are an index range instead of a scan with
+EXTRACT on every row.
+
+Revision ID: c71e5b9a0d24
+Revises: a4d8e1c27f53
+Create Date: 2026-10-17 10:48:27.906115
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c71e5b9a0d24"
+down_revision: Union[str, None] = "a4d8e1c27f53"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL = {
+    "postgresql": "UPDATE contacts SET birthday_key = "
+    "EXTRACT(MONTH FROM birthday) * 100 + EXTRACT(DAY FROM birthday)",
+    "sqlite": "UPDATE contacts SET birthday_key = "
+    "CAST(strftime('%m', birthday) AS INTEGER) * 100 "
+    "+ CAST(strftime('%d', birthday) AS INTEGER)",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    # A constant default keeps ADD COLUMN NOT NULL cheap on existing rows;
+    # the real values are backfilled right after.
+    op.add_column(
+        "contacts",
+        sa.Column("birthday_key", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.execute(BACKFILL[dialect])
+
+    if dialect == "postgresql":
+        op.alter_column("contacts", "birthday_key", server_default=None)
+        with op.get_context().autocommit_block():
+            op.create_index(
+                "ix_contacts_user_id_birthday_key",
+                "contacts",
+                ["user_id", "birthday_key"],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+    else:
+        op.create_index(
+            "ix_contacts_user_id_birthday_key", "contacts", ["user_id", "birthday_key"]
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                "ix_contacts_user_id_birthday_key",
+                table_name="contacts",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+    else:
+        op.drop_index("ix_contacts_user_id_birthday_key", table_name="contacts")
+    op.drop_column("contacts", "birthday_key")
@@ -5,6 +5,7 @@ This module provides endpoints for user authentication and account management:
 - Login with JWT token generation
 - Email confirmation
 - Password reset functionality
+- Logout with access-token revocation
 """
 
 from fastapi import (
@@ -16,6 +17,7 @@ from fastapi import (
     Request,
 )
 from fastapi.responses import JSONResponse
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from fastapi.security import OAuth2PasswordRequestForm
 from src.schemas import (
@@ -25,17 +27,18 @@ from src.schemas import (
     RequestEmail,
     PasswordResetRequest,
     PasswordReset,
+    TokenClaims,
 )
 from src.services.auth import (
-    create_access_token,
     Hash,
     get_email_from_token,
     create_password_reset_token,
     get_current_admin_user,
-    create_refresh_token,
+    create_token_pair,
     refresh_access_token,
     get_current_user,
-    r,
+    revoke_session,
+    oauth2_scheme,
 )
 from src.services.users import UserService
 from src.database.db import get_db
@@ -78,24 +81,31 @@ async def register_user(
         HTTPException:
             - 409: If username or email already exists
             - 422: If validation fails
+            - 503: If too many password hashes are already queued
     """
     user_service = UserService(db)
 
-    email_user = await user_service.get_user_by_email(user_data.email)
-    if email_user:
+    existing_user = await user_service.get_conflicting_user(
+        user_data.email, user_data.username
+    )
+    if existing_user:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
-            detail="Користувач з таким email вже існує",
+            detail=(
+                "Користувач з таким email вже існує"
+                if existing_user.email == user_data.email
+                else "Користувач з таким іменем вже існує"
+            ),
         )
-
-    username_user = await user_service.get_user_by_username(user_data.username)
-    if username_user:
+    user_data.password = await Hash().get_password_hash_async(user_data.password)
+    try:
+        new_user = await user_service.create_user(user_data)
+    except IntegrityError:
+        # A concurrent registration took the email or username meanwhile.
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
-            detail="Користувач з таким іменем вже існує",
+            detail="Користувач з таким email або іменем вже існує",
         )
-    user_data.password = Hash().get_password_hash(user_data.password)
-    new_user = await user_service.create_user(user_data)
     background_tasks.add_task(
         send_email, new_user.email, new_user.username, request.base_url
     )
@@ -107,11 +117,21 @@ async def login_user(
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db),
 ):
-    """Authenticate user and return JWT access and refresh tokens."""
+    """Authenticate user and return JWT access and refresh tokens.
+
+    Every login starts a new refresh-token family, so sessions on different
+    devices do not overwrite each other.
+
+    Raises:
+        HTTPException:
+            - 401: Invalid credentials
+            - 403: Email is not confirmed
+            - 503: Too many password checks are already queued
+    """
     user_service = UserService(db)
     user = await user_service.get_user_by_username(form_data.username)
 
-    if user is None or not Hash().verify_password(
+    if user is None or not await Hash().verify_password_async(
         form_data.password, user.hashed_password
     ):
         raise HTTPException(
@@ -125,14 +145,7 @@ async def login_user(
             detail="Підтвердіть вашу електронну адресу для входу",
         )
 
-    access_token = await create_access_token({"sub": user.username})
-    refresh_token = await create_refresh_token(user.username)
-
-    return {
-        "access_token": access_token,
-        "refresh_token": refresh_token,
-        "token_type": "bearer",
-    }
+    return await create_token_pair(user)
 
 
 @router.post("/refresh", response_model=Token)
@@ -140,19 +153,18 @@ async def refresh_token(
     request: Request,
     db: Session = Depends(get_db),
 ):
-    """Refresh access token using a valid refresh token from Authorization header."""
+    """Refresh access token using a valid refresh token from Authorization header.
+
+    The refresh token is rotated on every use: the response carries a new
+    refresh token and the presented one stops working. Presenting an already
+    rotated token revokes the whole session.
+    """
     auth_header = request.headers.get("Authorization")
     if not auth_header or not auth_header.startswith("Bearer "):
         raise HTTPException(status_code=401, detail="Refresh токен відсутній")
 
     refresh_token_str = auth_header.split(" ")[1]
-    new_access_token = await refresh_access_token(refresh_token_str, db=db)
-
-    return {
-        "access_token": new_access_token,
-        "refresh_token": refresh_token_str,
-        "token_type": "bearer",
-    }
+    return await refresh_access_token(refresh_token_str, db=db)
 
 
 @router.get("/confirmed_email/{token}")
@@ -310,6 +322,7 @@ async def reset_password(
     Raises:
         HTTPException:
             - 400: Invalid token or user not found
+            - 503: If too many password hashes are already queued
     """
     try:
         email = await get_email_from_token(body.token)
@@ -327,41 +340,28 @@ async def reset_password(
             status_code=status.HTTP_400_BAD_REQUEST, detail="User not found"
         )
 
-    hashed_password = Hash().get_password_hash(body.new_password)
+    hashed_password = await Hash().get_password_hash_async(body.new_password)
     await user_service.update_password(user.email, hashed_password)
     return {"message": "Password has been reset successfully"}
 
 
 @router.get("/admin")
-def read_admin(current_user: User = Depends(get_current_admin_user)):
+def read_admin(current_user: TokenClaims = Depends(get_current_admin_user)):
     return {"message": f"Вітаємо, {current_user.username}! Це адміністративний маршрут"}
 
 
-# @router.post("/logout")
-# # async def logout(current_user: User = Depends(get_current_user)):
-# async def logout(request: Request, current_user: User = Depends(get_current_user)):
-#
-#     # redis_key = f"refresh:{current_user.username}"
-#     # removed = r.delete(redis_key)
-#     token = request.headers.get("Authorization", "").replace("Bearer ", "")
-#     removed = r.delete(token)  # або твій метод типу remove_refresh_token(token)
+@router.post("/logout")
+async def logout(token: str = Depends(oauth2_scheme)):
+    """Log out the current device.
 
-#     redis_key_refresh = f"refresh:{current_user.username}"
-#     removed_refresh = r.delete(redis_key_refresh)
+    The presented access token is revoked until it expires and the refresh
+    token issued with it stops working.
 
-#     if not token:
-#         raise HTTPException(status_code=400, detail="Токен відсутній у запиті")
-
-#     if not removed:
-#         raise HTTPException(status_code=400, detail="Токен не знайдений у Redis")
-
-#     if removed_refresh:
-#         return {"message": "Користувач успішно вийшов із системи"}
-#     else:
-#         return JSONResponse(
-#             status_code=400,
-#             content={"detail": "Немає активного токена для відкликання"},
-#         )
+    Raises:
+        HTTPException: 401 if token is invalid, expired or already revoked.
+    """
+    await revoke_session(token)
+    return {"message": "Користувач успішно вийшов із системи"}
 
 
 # @router.post("/login", response_model=Token)
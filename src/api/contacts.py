@@ -1,15 +1,27 @@
-from typing import List
+import contextlib
+from typing import List, Literal
 
-from fastapi import APIRouter, HTTPException, Depends, status, Query
+from fastapi import APIRouter, HTTPException, Depends, status, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database.db import get_db
+from src.database.db import get_db, get_read_db, get_read_db_context
 from src.schemas import (
+    ContactBatchResult,
+    ContactBatchUpdate,
+    ContactIds,
+    ContactImportReport,
     ContactModel,
     ContactUpdate,
     ContactResponse,
 )
-from src.services.contacts import ContactService
+from src.services.contacts import (
+    ContactService,
+    contact_etag,
+    decode_cursor,
+    parse_contact_etag,
+)
+from src.services.etags import content_etag, none_match, strong_tags
 from src.database.models import User
 from src.services.auth import get_current_user
 
@@ -18,59 +30,266 @@ router = APIRouter(prefix="/contacts")
 
 @router.get("/", response_model=List[ContactResponse])
 async def read_contacts(
+    request: Request,
     skip: int = 0,
     limit: int = 10,
     q: str | None = Query(None, max_length=50),
-    db: AsyncSession = Depends(get_db),
+    after: str | None = Query(None, max_length=64),
+    db: AsyncSession = Depends(get_read_db),
     user: User = Depends(get_current_user),
 ):
-    """Retrieve a paginated list of contacts for the authenticated user.
+    """Retrieve a page of contacts for the authenticated user, ordered by ID.
+
+    Pass the ``X-Next-Cursor`` value of a response as ``after`` to fetch the
+    next page; the ``Link`` header carries the same URL with ``rel="next"``.
+    Neither header is sent on the last page. Offset paging with ``skip``
+    keeps working but gets slower the deeper it goes. Pages are served from
+    a per-user cache that any change to the user's contacts invalidates.
+    Responses carry an ETag; a matching ``If-None-Match`` gets 304.
 
     Args:
-        skip (int, optional): Number of contacts to skip. Defaults to 0.
+        request (Request): Incoming request, used to build the next link.
+        skip (int, optional): Number of contacts to skip. Ignored when
+            ``after`` is given. Defaults to 0.
         limit (int, optional): Maximum number of contacts to return. Defaults to 10.
         q (str | None, optional): Search query string. Defaults to None.
-        db (AsyncSession): Database session dependency.
+        after (str | None, optional): Cursor from a previous page. Defaults to None.
+        db (AsyncSession): Read-only database session dependency.
         user (User): Current authenticated user.
 
+    Raises:
+        HTTPException: If the cursor is malformed (400).
+
     Returns:
         List[ContactResponse]: List of contacts matching the query parameters.
     """
+    try:
+        after_id = decode_cursor(after) if after is not None else None
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+
     contact_service = ContactService(db)
-    contacts = await contact_service.get_contacts(skip, limit, q, user)
-    return contacts
+    payload, cursor = await contact_service.get_contacts_page_json(
+        skip, limit, user, q=q, after=after_id
+    )
+    headers = {"ETag": content_etag(payload)}
+    if cursor is not None:
+        next_url = request.url.remove_query_params("skip").include_query_params(
+            after=cursor
+        )
+        headers["X-Next-Cursor"] = cursor
+        headers["Link"] = f'<{next_url}>; rel="next"'
+    if none_match(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
 
 
 @router.get("/birthdays", response_model=List[ContactResponse])
 async def birthdays_now(
-    db: AsyncSession = Depends(get_db),
+    days: int = Query(7, ge=0, le=365),
+    db: AsyncSession = Depends(get_read_db),
     user: User = Depends(get_current_user),
 ):
     """Get a list of contacts who have birthdays in the current period.
 
+    The serialized response is cached per user and day, and invalidated by
+    any change to the user's contacts.
+
     Args:
+        days (int, optional): Length of the window after today, in days.
+            Defaults to 7.
+        db (AsyncSession): Read-only database session dependency.
+        user (User): Current authenticated user.
+
+    Returns:
+        List[ContactResponse]: List of contacts with upcoming birthdays,
+            soonest first.
+    """
+    contact_service = ContactService(db)
+    payload = await contact_service.get_birthday_list_json(user, days)
+    return Response(content=payload, media_type="application/json")
+
+
+BULK_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {media_type: {} for media_type in BULK_MEDIA_TYPES.values()}}
+    },
+)
+async def export_contacts(
+    fmt: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    db_context: contextlib.AbstractAsyncContextManager[AsyncSession] = Depends(
+        get_read_db_context
+    ),
+    user: User = Depends(get_current_user),
+):
+    """Download all contacts of the authenticated user.
+
+    The export is streamed as it is read from the database, ordered by ID,
+    as newline-delimited JSON objects or as CSV with a header row.
+
+    Args:
+        fmt (str, optional): ``ndjson`` or ``csv``, passed as ``format``.
+            Defaults to ``ndjson``.
+        db_context (AbstractAsyncContextManager[AsyncSession]): Read-only
+            session opened while the response is streamed.
+        user (User): Current authenticated user.
+
+    Returns:
+        StreamingResponse: The contacts, as an attachment.
+    """
+
+    async def body():
+        async with db_context as db:
+            async for chunk in ContactService(db).export_contacts(user, fmt):
+                yield chunk
+
+    return StreamingResponse(
+        body(),
+        media_type=BULK_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="contacts.{fmt}"'},
+    )
+
+
+@router.post(
+    "/import",
+    response_model=ContactImportReport,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                media_type: {"schema": {"type": "string"}}
+                for media_type in BULK_MEDIA_TYPES.values()
+            },
+        }
+    },
+)
+async def import_contacts(
+    request: Request,
+    fmt: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    """Create contacts in bulk from an NDJSON or CSV upload.
+
+    The request body is read as it arrives: one JSON object per line, or
+    CSV with a header row, in the format of ``GET /contacts/export``.
+    Columns other than the :class:`ContactModel` fields are ignored. Rows
+    that fail validation, or whose email or phone already exists, are
+    reported and skipped; the other rows are imported.
+
+    Args:
+        request (Request): Incoming request, whose body is the upload.
+        fmt (str, optional): ``ndjson`` or ``csv``, passed as ``format``.
+            Defaults to ``ndjson``.
         db (AsyncSession): Database session dependency.
         user (User): Current authenticated user.
 
     Returns:
-        List[ContactResponse]: List of contacts with upcoming birthdays.
+        ContactImportReport: Counts, and an error for every skipped row.
+    """
+    contact_service = ContactService(db)
+    return await contact_service.import_contacts(user, request.stream(), fmt)
+
+
+@router.post("/batch/get", response_model=ContactBatchResult)
+async def read_contacts_batch(
+    body: ContactIds,
+    db: AsyncSession = Depends(get_read_db),
+    user: User = Depends(get_current_user),
+):
+    """Retrieve several contacts by ID with one query.
+
+    IDs that match no contact of the user are listed in ``missing``
+    instead of failing the request.
+
+    Args:
+        body (ContactIds): IDs of the contacts to retrieve.
+        db (AsyncSession): Read-only database session dependency.
+        user (User): Current authenticated user.
+
+    Returns:
+        ContactBatchResult: Contacts found, and the IDs that were not.
     """
     contact_service = ContactService(db)
-    contacts = await contact_service.get_birthday_list(user)
-    return contacts
+    return await contact_service.get_contacts_by_ids(body.ids, user)
+
+
+@router.post("/batch/update", response_model=ContactBatchResult)
+async def update_contacts_batch(
+    body: ContactBatchUpdate,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    """Apply the same partial update to several contacts with one statement.
+
+    IDs that match no contact of the user are listed in ``missing``; the
+    other contacts are updated. ``email`` and ``phone`` are unique and
+    cannot be set in a batch.
+
+    Args:
+        body (ContactBatchUpdate): IDs of the contacts and the fields to set.
+        db (AsyncSession): Database session dependency.
+        user (User): Current authenticated user.
+
+    Returns:
+        ContactBatchResult: Contacts updated, and the IDs not found.
+    """
+    contact_service = ContactService(db)
+    return await contact_service.update_contacts(body.ids, body.changes, user)
+
+
+@router.post("/batch/delete", response_model=ContactBatchResult)
+async def remove_contacts_batch(
+    body: ContactIds,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    """Delete several contacts with one statement.
+
+    IDs that match no contact of the user are listed in ``missing``; the
+    other contacts are deleted.
+
+    Args:
+        body (ContactIds): IDs of the contacts to delete.
+        db (AsyncSession): Database session dependency.
+        user (User): Current authenticated user.
+
+    Returns:
+        ContactBatchResult: Contacts deleted, and the IDs not found.
+    """
+    contact_service = ContactService(db)
+    return await contact_service.remove_contacts(body.ids, user)
 
 
 @router.get("/{contact_id}", response_model=ContactResponse)
 async def read_contact(
     contact_id: int,
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
     user: User = Depends(get_current_user),
 ):
     """Retrieve a specific contact by ID.
 
+    The response carries a strong ETag. When ``If-None-Match`` is sent,
+    only the contact's last update time is read, and a matching tag gets
+    304 without loading the contact.
+
     Args:
         contact_id (int): ID of the contact to retrieve.
-        db (AsyncSession): Database session dependency.
+        request (Request): Incoming request, for conditional headers.
+        response (Response): Outgoing response, for the ETag header.
+        db (AsyncSession): Read-only database session dependency.
         user (User): Current authenticated user.
 
     Raises:
@@ -80,17 +299,32 @@ async def read_contact(
         ContactResponse: Contact details if found.
     """
     contact_service = ContactService(db)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        updated_at = await contact_service.get_contact_updated_at(contact_id, user)
+        if updated_at is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Contact not found"
+            )
+        etag = contact_etag(contact_id, updated_at)
+        if none_match(if_none_match, etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+            )
+
     contact = await contact_service.get_contact(contact_id, user)
     if contact is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Contact not found"
         )
+    response.headers["ETag"] = contact_etag(contact.id, contact.updated_at)
     return contact
 
 
 @router.post("/", response_model=ContactResponse, status_code=status.HTTP_201_CREATED)
 async def create_contact(
     body: ContactModel,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
@@ -98,6 +332,7 @@ async def create_contact(
 
     Args:
         body (ContactModel): Contact data to create.
+        response (Response): Outgoing response, for the ETag header.
         db (AsyncSession): Database session dependency.
         user (User): Current authenticated user.
 
@@ -105,67 +340,115 @@ async def create_contact(
         ContactResponse: Newly created contact details.
     """
     contact_service = ContactService(db)
-    return await contact_service.create_contact(body, user)
+    contact = await contact_service.create_contact(body, user)
+    response.headers["ETag"] = contact_etag(contact.id, contact.updated_at)
+    return contact
+
+
+async def _update_contact(
+    contact_id: int,
+    body: ContactUpdate,
+    request: Request,
+    response: Response,
+    db: AsyncSession,
+    user: User,
+):
+    """Apply an update, honouring ``If-Match`` as an optimistic lock."""
+    if_updated_at = None
+    if_match = request.headers.get("if-match")
+    if if_match and if_match.strip() != "*":
+        if_updated_at = []
+        for tag in strong_tags(if_match):
+            try:
+                tag_contact_id, updated_at = parse_contact_etag(tag)
+            except ValueError:
+                continue
+            if tag_contact_id == contact_id:
+                if_updated_at.append(updated_at)
+
+    contact_service = ContactService(db)
+    contact = None
+    if if_updated_at != []:
+        contact = await contact_service.update_contact(
+            contact_id, body, user, if_updated_at=if_updated_at
+        )
+    if contact is None:
+        if if_updated_at is not None and (
+            await contact_service.get_contact_updated_at(contact_id, user) is not None
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_412_PRECONDITION_FAILED,
+                detail="Contact was modified",
+            )
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Contact not found"
+        )
+    response.headers["ETag"] = contact_etag(contact.id, contact.updated_at)
+    return contact
 
 
 @router.put("/{contact_id}", response_model=ContactResponse)
 async def update_contact(
     body: ContactModel,
     contact_id: int,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
     """Update all fields of an existing contact.
 
+    Send the contact's ETag in ``If-Match`` to update it only if nobody
+    changed it since it was read.
+
     Args:
         body (ContactModel): Updated contact data.
         contact_id (int): ID of the contact to update.
+        request (Request): Incoming request, for conditional headers.
+        response (Response): Outgoing response, for the ETag header.
         db (AsyncSession): Database session dependency.
         user (User): Current authenticated user.
 
     Raises:
-        HTTPException: If contact is not found (404).
+        HTTPException: If contact is not found (404), or if ``If-Match``
+            does not match its current ETag (412).
 
     Returns:
         ContactResponse: Updated contact details.
     """
-    contact_service = ContactService(db)
-    contact = await contact_service.update_contact(contact_id, body, user)
-    if contact is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Contact not found"
-        )
-    return contact
+    return await _update_contact(contact_id, body, request, response, db, user)
 
 
 @router.patch("/{contact_id}", response_model=ContactResponse)
 async def update_contact(
     body: ContactUpdate,
     contact_id: int,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
     """Partially update an existing contact.
 
+    Send the contact's ETag in ``If-Match`` to update it only if nobody
+    changed it since it was read.
+
     Args:
         body (ContactUpdate): Partial contact data to update.
         contact_id (int): ID of the contact to update.
+        request (Request): Incoming request, for conditional headers.
+        response (Response): Outgoing response, for the ETag header.
         db (AsyncSession): Database session dependency.
         user (User): Current authenticated user.
 
     Raises:
-        HTTPException: If contact is not found (404).
+        HTTPException: If contact is not found (404), or if ``If-Match``
+            does not match its current ETag (412).
 
     Returns:
         ContactResponse: Updated contact details.
     """
-    contact_service = ContactService(db)
-    contact = await contact_service.update_contact(contact_id, body, user)
-    if contact is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Contact not found"
-        )
-    return contact
+    return await _update_contact(contact_id, body, request, response, db, user)
 
 
 @router.delete("/{contact_id}", response_model=ContactResponse)
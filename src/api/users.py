@@ -1,7 +1,17 @@
-from fastapi import APIRouter, Depends, Request, UploadFile, File, HTTPException, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    Request,
+    Response,
+    UploadFile,
+    File,
+    HTTPException,
+    status,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.schemas import User
-from src.services.auth import get_current_user, get_current_admin_user
+from src.schemas import TokenClaims, User
+from src.services.auth import get_current_user, get_principal, get_token_claims
+from src.services.etags import make_etag, none_match
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from src.conf.config import settings
@@ -20,24 +30,45 @@ limiter = Limiter(key_func=get_remote_address)
     description="No more than 5 requests per minute",
 )
 @limiter.limit("5/minute")
-async def me(request: Request, user: User = Depends(get_current_user)):
+async def me(
+    request: Request, response: Response, user: User = Depends(get_current_user)
+):
+    """Return the current user's profile.
+
+    The response carries a strong ETag of the profile fields; a matching
+    ``If-None-Match`` gets 304 without a body.
+
+    Args:
+        request (Request): Incoming request, for conditional headers.
+        response (Response): Outgoing response, for the ETag header.
+        user (User): Current authenticated user.
+
+    Returns:
+        User: The current user's profile.
+    """
+    etag = make_etag(user.id, user.username, user.email, user.avatar, user.role.value)
+    if none_match(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     return user
 
 
 @router.patch("/avatar", response_model=User)
 async def update_avatar_user(
     file: UploadFile = File(),
-    user: User = Depends(get_current_user),
+    claims: TokenClaims = Depends(get_token_claims),
     db: AsyncSession = Depends(get_db),
 ):
     """Update user's avatar.
     
     Only administrators can change their avatars. Regular users will keep their default Gravatar.
     The new avatar will be uploaded to Cloudinary and resized to 250x250 pixels.
+    The role check uses the claims carried by the token, so non-admins are
+    rejected without loading the user.
     
     Args:
         file (UploadFile): New avatar image file. Supported formats: JPG, PNG, GIF
-        user (User): Current authenticated user from token
+        claims (TokenClaims): Identity and role of the current user from token
         db (AsyncSession): Database session for user updates
         
     Returns:
@@ -53,12 +84,19 @@ async def update_avatar_user(
             - 403: If non-admin user tries to change avatar
             - 422: If file upload fails or format is not supported
     """
-    if user.role != UserRole.ADMIN:
+    if claims.role != UserRole.ADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only administrators can change their avatar"
         )
 
+    user = await get_principal(claims.username, db)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+        )
+
     avatar_url = UploadFileService(
         settings.CLD_NAME, settings.CLD_API_KEY, settings.CLD_API_SECRET
     ).upload_file(file, user.username)
@@ -3,6 +3,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
 from src.database.db import get_db
+from src.schemas import TokenClaims
+from src.services.auth import get_current_admin_user
+from src.services.metrics import metrics
 
 router = APIRouter(tags=["utils"])
 
@@ -44,3 +47,20 @@ async def healthchecker(db: AsyncSession = Depends(get_db)):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error connecting to the database",
         )
+
+
+@router.get("/metrics")
+async def read_metrics(admin: TokenClaims = Depends(get_current_admin_user)):
+    """Return a snapshot of the in-process application metrics.
+
+    Metrics are kept per worker process, so each worker reports its own
+    counters (for example the user cache hit ratio). Only administrators
+    may read them.
+
+    Args:
+        admin (TokenClaims): Claims of the authenticated administrator.
+
+    Returns:
+        dict: Counters, gauges, timings and collected values.
+    """
+    return metrics.snapshot()
@@ -1,12 +1,38 @@
+from typing import Literal
+
 from pydantic import ConfigDict, EmailStr
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
     DB_URL: str
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 5
+    DB_POOL_TIMEOUT_SECONDS: float = 1.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_RETRY_AFTER_SECONDS: int = 1
+    DB_REPLICA_URLS: list[str] = []
+    DB_READ_STICKINESS_SECONDS: float = 5.0
+    DB_WARM_CONNECTIONS: int = 2
+    WARMUP_STEP_TIMEOUT_SECONDS: float = 5.0
     JWT_SECRET: str
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION_SECONDS: int = 3600
+    TOKEN_CACHE_SIZE: int = 10000
+
+    # Token revocation settings
+    REVOCATION_SYNC_INTERVAL_SECONDS: float = 1.0
+    REVOCATION_FILTER_CAPACITY: int = 100000
+    REVOCATION_FILTER_ERROR_RATE: float = 0.001
+
+    # Password hashing settings
+    HASH_EXECUTOR: Literal["thread", "process"] = "thread"
+    HASH_POOL_SIZE: int = 4
+    HASH_MAX_CONCURRENCY: int = 4
+    HASH_MAX_QUEUE: int = 32
+    HASH_QUEUE_TIMEOUT_SECONDS: float = 2.0
+    HASH_RETRY_AFTER_SECONDS: int = 1
 
     # Email settings
     MAIL_USERNAME: EmailStr
@@ -20,6 +46,29 @@ class Settings(BaseSettings):
     USE_CREDENTIALS: bool = True
     VALIDATE_CERTS: bool = True
 
+    # Redis settings
+    REDIS_HOST: str = "localhost"
+    REDIS_PORT: int = 6379
+    REDIS_DB: int = 0
+    REDIS_PASSWORD: str | None = None
+    REDIS_POOL_SIZE: int = 50
+    REDIS_POOL_TIMEOUT: float = 0.2
+    REDIS_SOCKET_TIMEOUT: float = 0.1
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = 0.1
+    REDIS_BREAKER_FAILURE_THRESHOLD: int = 5
+    REDIS_BREAKER_RESET_SECONDS: float = 5.0
+    REDIS_BREAKER_CALL_TIMEOUT_SECONDS: float = 0.25
+    REDIS_WARM_CONNECTIONS: int = 2
+    USER_CACHE_TTL_SECONDS: int = 900
+    USER_CACHE_L1_SIZE: int = 10000
+    USER_CACHE_L1_TTL_SECONDS: float = 30.0
+    USER_CACHE_INVALIDATION_CHANNEL: str = "user-cache:invalidate"
+    CONTACT_CACHE_TTL_SECONDS: int = 300
+    CONTACT_LIST_CACHE_TTL_SECONDS: int = 60
+    CONTACT_EXPORT_BATCH_SIZE: int = 1000
+    CONTACT_IMPORT_BATCH_SIZE: int = 1000
+    CONTACT_BATCH_MAX_IDS: int = 5000
+
     # Cloudinary settings
     CLD_NAME: str
     CLD_API_KEY: int
@@ -4,19 +4,66 @@ This module provides database connection and session management functionality us
 async features. It includes a session manager class that handles connection pooling,
 session creation, and automatic cleanup of database resources.
 
+Read-only routes use :func:`get_read_db`, which spreads sessions over the
+configured read replicas. A user who has just written is pinned to the
+primary for ``DB_READ_STICKINESS_SECONDS`` (see
+:class:`ReadYourWritesMiddleware`), so they always read their own writes
+despite replication lag. The pin is a short-lived Redis key, so it holds
+whichever worker serves the next read.
+
 The module uses environment variables for database configuration (see config.py).
 """
 
 import contextlib
+import itertools
+import time
+from typing import Sequence
 
+from fastapi import Request
+from jose import JWTError, jwt
+from redis.exceptions import RedisError
+from sqlalchemy import exc, text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
+    AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from src.conf.config import settings
+from src.database.redis import redis_manager
+from src.services.cache import TTLCache
+from src.services.circuit_breaker import redis_breaker
+from src.services.metrics import metrics
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that reports checkout waits and timeouts.
+
+    Attributes:
+        metrics_prefix (str): Prefix of the metrics reported by this pool.
+    """
+
+    metrics_prefix = "db_pool"
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            metrics.inc(f"{self.metrics_prefix}_timeouts")
+            raise
+        finally:
+            metrics.observe(
+                f"{self.metrics_prefix}_checkout_wait", time.perf_counter() - started
+            )
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        pool = super().recreate()
+        pool.metrics_prefix = self.metrics_prefix
+        return pool
 
 
 class DatabaseSessionManager:
@@ -26,20 +73,111 @@ class DatabaseSessionManager:
     ensuring proper resource cleanup and transaction management.
 
     Attributes:
+        name (str): Prefix of the pool metrics reported by this manager.
         _engine (AsyncEngine | None): SQLAlchemy async engine instance.
         _session_maker (async_sessionmaker): Factory for creating new database sessions.
+        _replica_makers (list[async_sessionmaker]): Session factories bound to
+            the read replicas.
     """
 
-    def __init__(self, url: str):
+    def __init__(
+        self,
+        url: str,
+        name: str = "db",
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout: float = 30.0,
+        pool_recycle: int = -1,
+        pool_pre_ping: bool = False,
+        replica_urls: Sequence[str] = (),
+    ):
         """Initialize the database session manager.
 
         Args:
             url (str): Database connection URL.
+            name (str): Prefix of the pool metrics reported by this manager.
+            pool_size (int): Number of connections kept open in the pool.
+            max_overflow (int): Connections allowed beyond ``pool_size`` under load.
+            pool_timeout (float): Seconds to wait for a free connection before
+                ``sqlalchemy.exc.TimeoutError`` is raised.
+            pool_recycle (int): Seconds after which a connection is replaced,
+                -1 to keep connections indefinitely.
+            pool_pre_ping (bool): Test connections for liveness on checkout.
+            replica_urls (Sequence[str]): Connection URLs of read replicas. Each
+                replica gets its own pool with the same settings.
         """
-        self._engine: AsyncEngine | None = create_async_engine(url)
+        self.name = name
+        pool_options = dict(
+            poolclass=InstrumentedQueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+        )
+        self._engine: AsyncEngine | None = self._create_engine(
+            url, f"{name}_pool", pool_options
+        )
         self._session_maker: async_sessionmaker = async_sessionmaker(
-            autoflush=False, autocommit=False, bind=self._engine
+            autoflush=False, autocommit=False, expire_on_commit=False, bind=self._engine
         )
+        self._replica_engines: list[AsyncEngine] = [
+            self._create_engine(replica_url, f"{name}_replica{index}_pool", pool_options)
+            for index, replica_url in enumerate(replica_urls)
+        ]
+        self._replica_makers: list[async_sessionmaker] = [
+            async_sessionmaker(
+                autoflush=False,
+                autocommit=False,
+                expire_on_commit=False,
+                bind=engine,
+                info={"replica": True},
+            )
+            for engine in self._replica_engines
+        ]
+        self._replica_cycle = itertools.cycle(self._replica_makers)
+
+    @staticmethod
+    def _create_engine(url: str, metrics_prefix: str, pool_options: dict) -> AsyncEngine:
+        engine = create_async_engine(url, **pool_options)
+        engine.pool.metrics_prefix = metrics_prefix
+        metrics.register_collector(metrics_prefix, lambda: _pool_stats(engine))
+        return engine
+
+    def pool_stats(self) -> dict:
+        """Return the current occupancy of the primary connection pool.
+
+        Returns:
+            dict: Pool ``size``, ``checked_out`` and ``checked_in`` connections,
+            and ``overflow`` connections opened beyond the pool size.
+        """
+        return _pool_stats(self._engine)
+
+    @property
+    def replica_count(self) -> int:
+        """Number of configured read replicas."""
+        return len(self._replica_engines)
+
+    async def warm_up(self, connections: int) -> None:
+        """Open connections on the primary and every replica ahead of traffic.
+
+        The connections are returned to their pools, so the first requests
+        do not pay for connection setup.
+
+        Args:
+            connections (int): Connections to open per engine, capped at the
+                pool size.
+        """
+        for engine in [self._engine, *self._replica_engines]:
+            async with contextlib.AsyncExitStack() as stack:
+                for _ in range(min(connections, engine.pool.size())):
+                    connection = await stack.enter_async_context(engine.connect())
+                    await connection.execute(text("SELECT 1"))
+
+    async def close(self) -> None:
+        """Close every pooled connection of the primary and the replicas."""
+        for engine in [self._engine, *self._replica_engines]:
+            await engine.dispose()
 
     @contextlib.asynccontextmanager
     async def session(self):
@@ -59,7 +197,34 @@ class DatabaseSessionManager:
         """
         if self._session_maker is None:
             raise Exception("Database session is not initialized")
-        session = self._session_maker()
+        async with self._managed(self._session_maker) as session:
+            yield session
+
+    @contextlib.asynccontextmanager
+    async def read_session(self):
+        """Create a read-only session on the next read replica.
+
+        Replicas are used round-robin. Without replicas the session is opened
+        on the primary. Replica sessions carry ``info["replica"] = True``.
+
+        Yields:
+            AsyncSession: An active database session.
+
+        Raises:
+            SQLAlchemyError: If a database error occurs
+        """
+        if not self._replica_makers:
+            async with self.session() as session:
+                yield session
+            return
+        metrics.inc(f"{self.name}_replica_sessions")
+        async with self._managed(next(self._replica_cycle)) as session:
+            yield session
+
+    @staticmethod
+    @contextlib.asynccontextmanager
+    async def _managed(session_maker: async_sessionmaker):
+        session = session_maker()
         try:
             yield session
         except SQLAlchemyError as e:
@@ -69,8 +234,158 @@ class DatabaseSessionManager:
             await session.close()
 
 
+def _pool_stats(engine: AsyncEngine) -> dict:
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+    }
+
+
 # Global session manager instance
-sessionmanager = DatabaseSessionManager(settings.DB_URL)
+sessionmanager = DatabaseSessionManager(
+    settings.DB_URL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    replica_urls=settings.DB_REPLICA_URLS,
+)
+
+# Users who wrote recently, pinned to the primary for reads. The marks live
+# in Redis so every worker sees them; this cache keeps each worker's own
+# marks so its writers' reads skip the Redis lookup.
+recent_writers = TTLCache(
+    "db_recent_writers",
+    maxsize=settings.USER_CACHE_L1_SIZE,
+    ttl=settings.DB_READ_STICKINESS_SECONDS,
+)
+
+
+def recent_writer_key(key: str) -> str:
+    """Return the Redis key marking a user as a recent writer.
+
+    Args:
+        key (str): User key from :func:`writer_key`.
+
+    Returns:
+        str: Redis key.
+    """
+    return f"recent_writer:{key}"
+
+
+async def mark_recent_writer(key: str) -> None:
+    """Pin a user's reads to the primary, on every worker.
+
+    The mark expires after ``DB_READ_STICKINESS_SECONDS``. Failing to store
+    it in Redis is counted but does not fail the request.
+
+    Args:
+        key (str): User key from :func:`writer_key`.
+    """
+    recent_writers.set(key, True)
+    try:
+        await redis_breaker.call(
+            redis_manager.client.set,
+            recent_writer_key(key),
+            1,
+            px=int(settings.DB_READ_STICKINESS_SECONDS * 1000),
+        )
+    except (RedisError, OSError):
+        metrics.inc("db_sticky_mark_failures")
+
+
+async def is_recent_writer(key: str) -> bool:
+    """Check whether a user wrote within ``DB_READ_STICKINESS_SECONDS``.
+
+    When Redis cannot be asked, the answer is yes: reading from the primary
+    is always correct, only more expensive.
+
+    Args:
+        key (str): User key from :func:`writer_key`.
+
+    Returns:
+        bool: True if the user's reads must go to the primary.
+    """
+    if key in recent_writers:
+        return True
+    try:
+        return bool(
+            await redis_breaker.call(redis_manager.client.exists, recent_writer_key(key))
+        )
+    except (RedisError, OSError):
+        metrics.inc("db_sticky_fallbacks")
+        return True
+
+
+def writer_key(authorization: str | None) -> str | None:
+    """Return the user a request acts for, as used for read stickiness.
+
+    The token is not verified here: the key only routes reads, and
+    authentication happens in the route's own dependencies.
+
+    Args:
+        authorization (str | None): Value of the Authorization header.
+
+    Returns:
+        str | None: The token subject, or None for anonymous requests.
+    """
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        return jwt.get_unverified_claims(token).get("sub")
+    except JWTError:
+        return None
+
+
+class ReadYourWritesMiddleware:
+    """ASGI middleware that pins users to the primary after they write.
+
+    Every request with a method other than GET, HEAD or OPTIONS marks its
+    user with :func:`mark_recent_writer` before the response starts, so
+    the mark is in place by the time the client can send its next request.
+    """
+
+    SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+    def __init__(self, app):
+        """Wrap an ASGI application.
+
+        Args:
+            app: The ASGI application.
+        """
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in self.SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+        authorization = dict(scope["headers"]).get(b"authorization")
+        key = writer_key(authorization.decode("latin-1") if authorization else None)
+        if key is None:
+            await self.app(scope, receive, send)
+            return
+
+        marked = False
+
+        async def send_after_marking(message):
+            nonlocal marked
+            if message["type"] == "http.response.start" and not marked:
+                marked = True
+                await mark_recent_writer(key)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_after_marking)
+        except BaseException:
+            # The write may have committed before the error.
+            if not marked:
+                await mark_recent_writer(key)
+            raise
 
 
 async def get_db():
@@ -90,3 +405,44 @@ async def get_db():
     """
     async with sessionmanager.session() as session:
         yield session
+
+
+async def get_read_db(request: Request):
+    """FastAPI dependency for read-only database sessions.
+
+    Yields a session on a read replica, or on the primary if the requesting
+    user wrote within the last ``DB_READ_STICKINESS_SECONDS``.
+
+    Args:
+        request (Request): The incoming request.
+
+    Yields:
+        AsyncSession: A database session for read-only route handlers.
+    """
+    async with await get_read_db_context(request) as session:
+        yield session
+
+
+async def get_read_db_context(
+    request: Request,
+) -> contextlib.AbstractAsyncContextManager[AsyncSession]:
+    """FastAPI dependency for read-only sessions that outlive the route handler.
+
+    Dependencies with ``yield`` are closed before a streaming response body
+    is sent, so streaming routes open the session themselves, inside the
+    body iterator, with the context manager returned here. It is routed
+    like :func:`get_read_db`.
+
+    Args:
+        request (Request): The incoming request.
+
+    Returns:
+        AbstractAsyncContextManager[AsyncSession]: Unopened session context.
+    """
+    if not sessionmanager.replica_count:
+        return sessionmanager.session()
+    key = writer_key(request.headers.get("Authorization"))
+    if key is not None and await is_recent_writer(key):
+        metrics.inc("db_sticky_reads")
+        return sessionmanager.session()
+    return sessionmanager.read_session()
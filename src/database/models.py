@@ -1,5 +1,15 @@
 from datetime import date, datetime
-from sqlalchemy import String, Integer, Date, DateTime, func, Boolean, Enum as SqlEnum
+from sqlalchemy import (
+    DDL,
+    String,
+    Integer,
+    Date,
+    DateTime,
+    Index,
+    event,
+    Boolean,
+    Enum as SqlEnum,
+)
 from sqlalchemy.orm import mapped_column, Mapped, DeclarativeBase, relationship
 from sqlalchemy.sql.schema import ForeignKey
 from enum import Enum
@@ -19,6 +29,26 @@ class UserRole(str, Enum):
     ADMIN = "admin"
 
 
+# Columns searched by the contacts ``q`` parameter.
+CONTACT_SEARCH_COLUMNS = ("first_name", "last_name", "email")
+
+
+def birthday_key(birthday: date) -> int:
+    """Return the month-and-day ordinal of a date, e.g. 1017 for 17 October.
+
+    Args:
+        birthday (date): Date to convert.
+
+    Returns:
+        int: ``month * 100 + day``.
+    """
+    return birthday.month * 100 + birthday.day
+
+
+def _default_birthday_key(context) -> int:
+    return birthday_key(context.get_current_parameters()["birthday"])
+
+
 class Contact(Base):
     """Model representing a contact in the address book.
 
@@ -32,6 +62,8 @@ class Contact(Base):
         email (str): Contact's email address, must be unique, limited to 100 characters.
         phone (str): Contact's phone number, must be unique, limited to 20 characters.
         birthday (date): Contact's birth date.
+        birthday_key (int): Month and day of the birthday as ``month * 100 + day``,
+            derived from ``birthday`` so upcoming birthdays are an index range.
         additional_info (str): Optional additional information about the contact.
         created_at (datetime): Timestamp of when the contact was created.
         updated_at (datetime): Timestamp of the last update to the contact.
@@ -40,6 +72,22 @@ class Contact(Base):
     """
 
     __tablename__ = "contacts"
+    __table_args__ = (
+        # Every query is scoped by owner: serves per-user listing in ID
+        # order, lookups by ID and the ON DELETE CASCADE from users.
+        Index("ix_contacts_user_id_id", "user_id", "id"),
+        Index("ix_contacts_user_id_birthday_key", "user_id", "birthday_key"),
+        # Trigram indexes serve ILIKE '%q%' searches on PostgreSQL.
+        *(
+            Index(
+                f"ix_contacts_{column}_trgm",
+                column,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+            ).ddl_if(dialect="postgresql")
+            for column in CONTACT_SEARCH_COLUMNS
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     first_name: Mapped[str] = mapped_column(String(25), nullable=False)
@@ -47,10 +95,15 @@ class Contact(Base):
     email: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
     phone: Mapped[str] = mapped_column(String(20), nullable=False, unique=True)
     birthday: Mapped[date] = mapped_column(Date, nullable=False)
+    birthday_key: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=_default_birthday_key
+    )
     additional_info: Mapped[str] = mapped_column(String(255), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+    # Set in Python with microsecond precision: it versions the contact
+    # for ETags, so two updates within one second must not share a value.
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.now, onupdate=func.now()
+        DateTime, default=datetime.now, onupdate=datetime.now
     )
     user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True
@@ -85,3 +138,39 @@ class User(Base):
     role: Mapped[UserRole] = mapped_column(
         SqlEnum(UserRole), default=UserRole.USER, nullable=False
     )
+
+
+# SQLite has no trigram indexes; an external-content FTS5 table with the
+# trigram tokenizer, kept in sync by triggers, serves the same searches.
+CONTACTS_FTS_DDL = (
+    "CREATE VIRTUAL TABLE contacts_fts USING fts5("
+    "first_name, last_name, email, content='contacts', content_rowid='id', "
+    "tokenize='trigram')",
+    "CREATE TRIGGER contacts_fts_insert AFTER INSERT ON contacts BEGIN "
+    "INSERT INTO contacts_fts(rowid, first_name, last_name, email) "
+    "VALUES (new.id, new.first_name, new.last_name, new.email); END",
+    "CREATE TRIGGER contacts_fts_delete AFTER DELETE ON contacts BEGIN "
+    "INSERT INTO contacts_fts(contacts_fts, rowid, first_name, last_name, email) "
+    "VALUES ('delete', old.id, old.first_name, old.last_name, old.email); END",
+    "CREATE TRIGGER contacts_fts_update AFTER UPDATE OF first_name, last_name, email "
+    "ON contacts BEGIN "
+    "INSERT INTO contacts_fts(contacts_fts, rowid, first_name, last_name, email) "
+    "VALUES ('delete', old.id, old.first_name, old.last_name, old.email); "
+    "INSERT INTO contacts_fts(rowid, first_name, last_name, email) "
+    "VALUES (new.id, new.first_name, new.last_name, new.email); END",
+)
+
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+for statement in CONTACTS_FTS_DDL:
+    event.listen(
+        Contact.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite")
+    )
+event.listen(
+    Contact.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS contacts_fts").execute_if(dialect="sqlite"),
+)
@@ -0,0 +1,120 @@
+"""Redis client management module.
+
+This module provides a shared asyncio Redis client backed by a bounded
+connection pool. The pool is opened when the application starts and closed
+on shutdown, so request handlers never block the event loop on Redis I/O.
+
+The module uses environment variables for Redis configuration (see config.py).
+"""
+
+import asyncio
+
+from redis.asyncio import BlockingConnectionPool, Redis
+
+from src.conf.config import settings
+
+
+class RedisClientManager:
+    """Manages the asyncio Redis client and its connection pool.
+
+    Attributes:
+        _pool (BlockingConnectionPool | None): Shared pool of Redis connections.
+        _client (Redis | None): Redis client bound to the pool.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        db: int = 0,
+        password: str | None = None,
+        max_connections: int = 50,
+        pool_timeout: float = 1.0,
+        socket_timeout: float = 1.0,
+        socket_connect_timeout: float = 1.0,
+    ):
+        """Initialize the Redis client manager.
+
+        Args:
+            host (str): Redis server host.
+            port (int): Redis server port.
+            db (int): Redis logical database number.
+            password (str | None): Optional Redis password.
+            max_connections (int): Maximum number of pooled connections.
+            pool_timeout (float): Seconds to wait for a free pooled connection.
+            socket_timeout (float): Seconds to wait for a reply on a socket.
+            socket_connect_timeout (float): Seconds to wait for a TCP connect.
+        """
+        self._pool_kwargs = dict(
+            host=host,
+            port=port,
+            db=db,
+            password=password,
+            max_connections=max_connections,
+            timeout=pool_timeout,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=socket_connect_timeout,
+        )
+        self._pool: BlockingConnectionPool | None = None
+        self._client: Redis | None = None
+
+    async def connect(self) -> Redis:
+        """Open the connection pool and create the shared client.
+
+        Returns:
+            Redis: The shared asyncio Redis client.
+        """
+        return self.client
+
+    async def warm_up(self, connections: int) -> None:
+        """Open pooled connections ahead of traffic.
+
+        Concurrent PINGs make the pool open one connection per command; the
+        connections stay in the pool afterwards.
+
+        Args:
+            connections (int): Number of connections to open.
+        """
+        await asyncio.gather(*(self.client.ping() for _ in range(connections)))
+
+    async def close(self) -> None:
+        """Close the client and disconnect every pooled connection."""
+        if self._client is not None:
+            await self._client.aclose()
+            await self._pool.disconnect()
+        self._client = None
+        self._pool = None
+
+    @property
+    def client(self) -> Redis:
+        """Return the shared client, creating the pool lazily if needed.
+
+        Returns:
+            Redis: The shared asyncio Redis client.
+        """
+        if self._client is None:
+            self._pool = BlockingConnectionPool(**self._pool_kwargs)
+            self._client = Redis(connection_pool=self._pool)
+        return self._client
+
+
+# Global Redis client manager instance
+redis_manager = RedisClientManager(
+    host=settings.REDIS_HOST,
+    port=settings.REDIS_PORT,
+    db=settings.REDIS_DB,
+    password=settings.REDIS_PASSWORD,
+    max_connections=settings.REDIS_POOL_SIZE,
+    pool_timeout=settings.REDIS_POOL_TIMEOUT,
+    socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+    socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+)
+
+
+async def get_redis() -> Redis:
+    """FastAPI dependency that returns the shared Redis client.
+
+    Returns:
+        Redis: The shared asyncio Redis client.
+    """
+    return redis_manager.client
@@ -3,15 +3,100 @@
 This module provides the data access layer for contact-related operations,
 implementing CRUD operations and specialized queries for contact management.
 It uses SQLAlchemy for database interactions and provides type-safe operations.
+
+Every mutation is a single ``INSERT/UPDATE/DELETE ... RETURNING`` statement
+scoped by ``user_id``, so it costs one round-trip besides the commit.
+
+Every successful mutation bumps the owner's contacts version, which
+invalidates the owner's cached contact responses. The bump goes through
+the Redis circuit breaker and never fails a committed write.
+
+Searches by ``q`` are served by trigram indexes: GIN ``pg_trgm`` indexes on
+PostgreSQL and an FTS5 trigram table on SQLite.
 """
 
+import logging
 from typing import List
-from sqlalchemy import select, and_, extract
+
+from redis.exceptions import RedisError
+from sqlalchemy import (
+    ARRAY,
+    Integer,
+    and_,
+    any_,
+    bindparam,
+    column,
+    delete,
+    insert,
+    or_,
+    select,
+    table,
+    true,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
+
+from src.database.models import Contact, User, birthday_key
+from src.schemas import ContactBatchChanges, ContactModel, ContactUpdate
+from src.services.circuit_breaker import redis_breaker
+from src.services.contact_cache import contact_cache
+from src.services.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Columns of a contact as returned by the API, in export order.
+EXPORT_COLUMNS = (
+    "id",
+    "first_name",
+    "last_name",
+    "email",
+    "phone",
+    "birthday",
+    "additional_info",
+    "created_at",
+    "updated_at",
+)
+
+# FTS5 index of contact names and emails on SQLite (see models.CONTACTS_FTS_DDL).
+contacts_fts = table("contacts_fts", column("rowid"), column("contacts_fts"))
+
+
+async def _invalidate_contacts(user_id: int) -> None:
+    """Bump the owner's contacts version after a committed write.
+
+    The write is already committed, so an unavailable Redis must not fail
+    the request. The failure is counted and logged instead, and cached
+    responses of the user may then be served until their short TTL ends.
+
+    Args:
+        user_id (int): ID of the contacts owner.
+    """
+    try:
+        await redis_breaker.call(contact_cache.bump, user_id)
+    except (RedisError, OSError):
+        metrics.inc("contact_cache_invalidation_failures")
+        logger.warning(
+            "Could not invalidate cached contacts of user %s", user_id, exc_info=True
+        )
 
-from src.database.models import Contact, User
-from src.schemas import ContactModel, ContactUpdate
+
+def _update_values(body: ContactUpdate | ContactBatchChanges) -> dict:
+    """Return the column values a contact update sets.
+
+    Args:
+        body (ContactUpdate | ContactBatchChanges): Fields sent by the client.
+
+    Returns:
+        dict: The fields, plus ``birthday_key`` when ``birthday`` changes.
+    """
+    values = body.model_dump(exclude_unset=True)
+    if values.get("birthday") is not None:
+        values["birthday_key"] = birthday_key(values["birthday"])
+    return values
 
 
 class ContactRepository:
@@ -38,32 +123,106 @@ class ContactRepository:
         self.db = session
 
     async def get_contacts(
-        self, skip: int, limit: int, user: User, q: str | None = None
+        self,
+        skip: int,
+        limit: int,
+        user: User,
+        q: str | None = None,
+        after: int | None = None,
     ) -> List[Contact]:
-        """Retrieve a paginated list of contacts with optional search.
+        """Retrieve a page of contacts ordered by ID, with optional search.
+
+        Pages are addressed either by offset (``skip``) or, preferably, by
+        keyset: ``after`` is the ID of the last contact of the previous page,
+        and the page starts right after it. A keyset page costs the same at
+        any depth, while an offset page scans every skipped row.
 
         Args:
-            skip (int): Number of records to skip (offset).
+            skip (int): Number of records to skip (offset). Ignored when
+                ``after`` is given.
             limit (int): Maximum number of records to return.
             user (User): User whose contacts to retrieve.
             q (str | None, optional): Search query for filtering contacts.
                 Searches in first_name, last_name, and email fields.
+            after (int | None, optional): ID of the last contact already seen.
 
         Returns:
             List[Contact]: List of contacts matching the criteria.
         """
-        stmt = select(Contact).filter_by(user=user).offset(skip).limit(limit)
-
+        stmt = select(Contact).filter_by(user_id=user.id)
+        order_key = Contact.id
         if q:
-            stmt = stmt.where(
-                (Contact.first_name.ilike(f"%{q}%"))
-                | (Contact.last_name.ilike(f"%{q}%"))
-                | (Contact.email.ilike(f"%{q}%"))
-            )
+            stmt, order_key = self._search(stmt, q)
+
+        stmt = stmt.order_by(order_key)
+        if after is None:
+            stmt = stmt.offset(skip)
+        else:
+            stmt = stmt.where(order_key > after)
+        stmt = stmt.limit(limit)
 
         contacts = await self.db.execute(stmt)
         return contacts.scalars().all()
 
+    async def stream_contacts(self, user: User, batch_size: int):
+        """Stream all of a user's contacts in batches, ordered by ID.
+
+        The rows are read through a server-side cursor (``yield_per``), so
+        only one batch is held in memory at a time. Plain rows of the
+        :class:`ContactResponse` columns are returned instead of ORM
+        objects, which keeps the session's identity map empty.
+
+        Args:
+            user (User): User whose contacts to stream.
+            batch_size (int): Number of rows fetched per batch.
+
+        Yields:
+            Sequence[Row]: The next batch of contact rows.
+        """
+        stmt = (
+            select(*(getattr(Contact, name) for name in EXPORT_COLUMNS))
+            .filter_by(user_id=user.id)
+            .order_by(Contact.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.db.stream(stmt)
+        try:
+            async for rows in result.partitions():
+                yield rows
+        finally:
+            await result.close()
+
+    def _search(self, stmt, q: str):
+        """Restrict a contacts query to substring matches of ``q``.
+
+        On PostgreSQL the ILIKE conditions are served by the trigram indexes.
+        On SQLite, queries of at least three characters (one trigram) are
+        joined to the ``contacts_fts`` index and ordered by its rowid, which
+        equals the contact ID; FTS5 yields rowids in order, so a page stops
+        reading after ``limit`` matches.
+
+        Args:
+            stmt: Select statement over contacts.
+            q (str): Search query.
+
+        Returns:
+            tuple: The filtered statement and the column to order and page by.
+        """
+        bind = getattr(self.db, "bind", None)
+        dialect = getattr(bind, "dialect", None)
+        if len(q) >= 3 and getattr(dialect, "name", None) == "sqlite":
+            phrase = '"' + q.replace('"', '""') + '"'
+            stmt = stmt.join(contacts_fts, contacts_fts.c.rowid == Contact.id).where(
+                contacts_fts.c.contacts_fts.op("MATCH")(phrase)
+            )
+            return stmt, contacts_fts.c.rowid
+        stmt = stmt.where(
+            (Contact.first_name.ilike(f"%{q}%"))
+            | (Contact.last_name.ilike(f"%{q}%"))
+            | (Contact.email.ilike(f"%{q}%"))
+        )
+        return stmt, Contact.id
+
     async def get_contact_by_id(self, contact_id: int, user: User) -> Contact | None:
         """Retrieve a specific contact by ID.
 
@@ -74,10 +233,30 @@ class ContactRepository:
         Returns:
             Contact | None: Contact if found and owned by user, None otherwise.
         """
-        stmt = select(Contact).filter_by(id=contact_id, user=user)
+        stmt = select(Contact).filter_by(id=contact_id, user_id=user.id)
         contact = await self.db.execute(stmt)
         return contact.scalar_one_or_none()
 
+    async def get_contact_updated_at(
+        self, contact_id: int, user: User
+    ) -> datetime | None:
+        """Retrieve only the last-modified time of a contact.
+
+        A cheap lookup for conditional requests: no row is loaded into the
+        session.
+
+        Args:
+            contact_id (int): ID of the contact.
+            user (User): User who owns the contact.
+
+        Returns:
+            datetime | None: Last update time if found and owned by user,
+                None otherwise.
+        """
+        stmt = select(Contact.updated_at).filter_by(id=contact_id, user_id=user.id)
+        updated_at = await self.db.execute(stmt)
+        return updated_at.scalar_one_or_none()
+
     async def create_contact(self, body: ContactModel, user: User) -> Contact:
         """Create a new contact.
 
@@ -88,11 +267,54 @@ class ContactRepository:
         Returns:
             Contact: Created contact instance with all fields populated.
         """
-        contact = Contact(**body.dict(exclude_unset=True), user=user)
-        self.db.add(contact)
+        stmt = (
+            insert(Contact)
+            .values(**body.model_dump(exclude_unset=True), user_id=user.id)
+            .returning(Contact)
+        )
+        result = await self.db.execute(stmt)
+        contact = result.scalar_one()
         await self.db.commit()
-        await self.db.refresh(contact)
-        return await self.get_contact_by_id(contact.id, user)
+        await _invalidate_contacts(user.id)
+        return contact
+
+    async def insert_contacts(self, rows: List[dict], user: User) -> set[str]:
+        """Create many contacts, skipping those whose email or phone is taken.
+
+        The rows are sent as one executemany ``INSERT ... ON CONFLICT DO
+        NOTHING RETURNING email``, which SQLAlchemy batches into multi-row
+        ``VALUES`` statements, and committed together.
+
+        Args:
+            rows (List[dict]): Validated contact fields, with distinct emails.
+            user (User): User who will own the contacts.
+
+        Returns:
+            set[str]: Emails of the contacts created.
+
+        Raises:
+            DBAPIError: If the database rejects the rows; the session is
+                rolled back and nothing is created.
+        """
+        if not rows:
+            return set()
+        if self.db.bind.dialect.name == "postgresql":
+            stmt = postgresql_insert(Contact)
+        else:
+            stmt = sqlite_insert(Contact)
+        stmt = stmt.on_conflict_do_nothing().returning(Contact.email)
+        try:
+            result = await self.db.execute(
+                stmt, [{**row, "user_id": user.id} for row in rows]
+            )
+            emails = set(result.scalars().all())
+        except DBAPIError:
+            await self.db.rollback()
+            raise
+        await self.db.commit()
+        if emails:
+            await _invalidate_contacts(user.id)
+        return emails
 
     async def remove_contact(self, contact_id: int, user: User) -> Contact | None:
         """Delete a contact.
@@ -104,63 +326,176 @@ class ContactRepository:
         Returns:
             Contact | None: Deleted contact if found and owned by user, None otherwise.
         """
-        contact = await self.get_contact_by_id(contact_id, user)
+        stmt = (
+            delete(Contact)
+            .where(Contact.id == contact_id, Contact.user_id == user.id)
+            .returning(Contact)
+        )
+        result = await self.db.execute(stmt)
+        contact = result.scalar_one_or_none()
         if contact:
-            await self.db.delete(contact)
             await self.db.commit()
+            await _invalidate_contacts(user.id)
         return contact
 
     async def update_contact(
-        self, contact_id: int, body: ContactUpdate, user: User
+        self,
+        contact_id: int,
+        body: ContactUpdate,
+        user: User,
+        if_updated_at: list[datetime] | None = None,
     ) -> Contact | None:
         """Update an existing contact.
 
+        With ``if_updated_at`` the update is a compare-and-set: it only
+        applies while the contact's ``updated_at`` is one of the given
+        values, checked by the same statement, so no row lock is taken.
+
         Args:
             contact_id (int): ID of the contact to update.
             body (ContactUpdate): Updated contact data.
             user (User): User who owns the contact.
+            if_updated_at (list[datetime] | None, optional): Versions the
+                caller expects the contact to be at. Defaults to None.
 
         Returns:
-            Contact | None: Updated contact if found and owned by user, None otherwise.
+            Contact | None: Updated contact if found, owned by user and at an
+                expected version, None otherwise.
         """
-        contact = await self.get_contact_by_id(contact_id, user)
+        values = _update_values(body)
+        if not values:
+            contact = await self.get_contact_by_id(contact_id, user)
+            if contact and if_updated_at is not None:
+                if contact.updated_at not in if_updated_at:
+                    return None
+            return contact
+
+        stmt = (
+            update(Contact)
+            .where(Contact.id == contact_id, Contact.user_id == user.id)
+            .values(**values)
+            .returning(Contact)
+        )
+        if if_updated_at is not None:
+            stmt = stmt.where(Contact.updated_at.in_(if_updated_at))
+        result = await self.db.execute(stmt)
+        contact = result.scalar_one_or_none()
         if contact:
-            for key, value in body.dict(exclude_unset=True).items():
-                setattr(contact, key, value)
+            await self.db.commit()
+            await _invalidate_contacts(user.id)
+        return contact
+
+    def _owned(self, ids: List[int], user: User):
+        """Return the condition matching the user's contacts among ``ids``.
+
+        On PostgreSQL the IDs are bound as one array (``id = ANY(:ids)``), so
+        the statement text, and its cached plan, do not depend on their
+        number.
+
+        Args:
+            ids (List[int]): Contact IDs.
+            user (User): User who owns the contacts.
+
+        Returns:
+            ColumnElement[bool]: The ``WHERE`` condition.
+        """
+        bind = getattr(self.db, "bind", None)
+        if getattr(getattr(bind, "dialect", None), "name", None) == "postgresql":
+            in_ids = Contact.id == any_(bindparam("ids", ids, type_=ARRAY(Integer)))
+        else:
+            in_ids = Contact.id.in_(ids)
+        return and_(Contact.user_id == user.id, in_ids)
+
+    async def get_contacts_by_ids(self, ids: List[int], user: User) -> List[Contact]:
+        """Retrieve the user's contacts among the given IDs.
 
+        Args:
+            ids (List[int]): IDs of the contacts to retrieve.
+            user (User): User who owns the contacts.
+
+        Returns:
+            List[Contact]: Contacts found, in no particular order.
+        """
+        result = await self.db.execute(select(Contact).where(self._owned(ids, user)))
+        return result.scalars().all()
+
+    async def update_contacts(
+        self, ids: List[int], body: ContactBatchChanges, user: User
+    ) -> List[Contact]:
+        """Apply the same update to the user's contacts among the given IDs.
+
+        Args:
+            ids (List[int]): IDs of the contacts to update.
+            body (ContactBatchChanges): Fields to set.
+            user (User): User who owns the contacts.
+
+        Returns:
+            List[Contact]: Updated contacts, in no particular order.
+        """
+        values = _update_values(body)
+        if not values:
+            return await self.get_contacts_by_ids(ids, user)
+        stmt = (
+            update(Contact)
+            .where(self._owned(ids, user))
+            .values(**values)
+            .returning(Contact)
+        )
+        result = await self.db.execute(stmt)
+        contacts = result.scalars().all()
+        if contacts:
             await self.db.commit()
-            await self.db.refresh(contact)
+            await _invalidate_contacts(user.id)
+        return contacts
 
-        return contact
+    async def remove_contacts(self, ids: List[int], user: User) -> List[Contact]:
+        """Delete the user's contacts among the given IDs.
+
+        Args:
+            ids (List[int]): IDs of the contacts to delete.
+            user (User): User who owns the contacts.
 
-    async def get_birthday_list(self, user: User) -> List[Contact]:
-        """Get contacts with birthdays in the next 7 days.
+        Returns:
+            List[Contact]: Deleted contacts, in no particular order.
+        """
+        stmt = delete(Contact).where(self._owned(ids, user)).returning(Contact)
+        result = await self.db.execute(stmt)
+        contacts = result.scalars().all()
+        if contacts:
+            await self.db.commit()
+            await _invalidate_contacts(user.id)
+        return contacts
 
-        This method finds contacts whose birthdays fall within the next week,
-        including today. It handles month transitions correctly.
+    async def get_birthday_list(self, user: User, days: int = 7) -> List[Contact]:
+        """Get contacts with birthdays from today through the next ``days`` days.
+
+        The window is matched against the precomputed ``birthday_key``
+        (``month * 100 + day``), so the query is one range on the
+        ``(user_id, birthday_key)`` index, or two when the window wraps
+        past the end of the year. Contacts are ordered by upcoming date.
 
         Args:
             user (User): User whose contacts to check.
+            days (int, optional): Length of the window after today. Defaults to 7.
 
         Returns:
             List[Contact]: List of contacts with upcoming birthdays.
         """
         today = date.today()
-        next_week = today + timedelta(days=7)
-
-        stmt = select(Contact).where(
-            and_(
-                Contact.user == user,
-                Contact.birthday.isnot(None),
-                (
-                    (extract("month", Contact.birthday) == today.month)
-                    & (extract("day", Contact.birthday) >= today.day)
-                )
-                | (
-                    (extract("month", Contact.birthday) == next_week.month)
-                    & (extract("day", Contact.birthday) <= next_week.day)
-                ),
-            )
+        start = birthday_key(today)
+        end = birthday_key(today + timedelta(days=days))
+
+        if days >= 365:
+            window = true()
+        elif end >= start:
+            window = Contact.birthday_key.between(start, end)
+        else:
+            window = or_(Contact.birthday_key >= start, Contact.birthday_key <= end)
+
+        stmt = (
+            select(Contact)
+            .where(Contact.user_id == user.id, window)
+            .order_by(Contact.birthday_key < start, Contact.birthday_key, Contact.id)
         )
 
         contacts = await self.db.execute(stmt)
@@ -3,13 +3,18 @@
 This module provides the data access layer for user-related operations,
 implementing user management functionality including registration,
 authentication, email confirmation, and profile updates.
+
+Writes are single ``INSERT``/``UPDATE ... RETURNING`` statements keyed by
+the user's email, so a one-column change costs one statement and a commit.
 """
 
-from sqlalchemy import select
+from sqlalchemy import insert, or_, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import User
 from src.schemas import UserCreate
+from src.services.user_cache import user_cache
 
 
 class UserRepository:
@@ -21,6 +26,10 @@ class UserRepository:
     - Avatar management
     - User lookup by various identifiers
 
+    Every write drops the user's cached principal so authenticated requests
+    never see stale data. Cache failures after a commit are queued for retry
+    rather than raised.
+
     Attributes:
         db (AsyncSession): SQLAlchemy async database session.
     """
@@ -72,6 +81,28 @@ class UserRepository:
         user = await self.db.execute(stmt)
         return user.scalar_one_or_none()
 
+    async def get_conflicting_user(self, email: str, username: str) -> User | None:
+        """Find a user that already holds the given email or username.
+
+        Both unique fields are checked with a single query. A user owning the
+        email is preferred over one owning the username.
+
+        Args:
+            email (str): Email address to check.
+            username (str): Username to check.
+
+        Returns:
+            User | None: Conflicting user if any, None otherwise.
+        """
+        stmt = (
+            select(User)
+            .where(or_(User.email == email, User.username == username))
+            .order_by((User.email == email).desc())
+            .limit(1)
+        )
+        user = await self.db.execute(stmt)
+        return user.scalar_one_or_none()
+
     async def create_user(self, body: UserCreate, avatar: str = None) -> User:
         """Create a new user.
 
@@ -84,32 +115,56 @@ class UserRepository:
 
         Returns:
             User: Created user instance with all fields populated.
+
+        Raises:
+            IntegrityError: If the username or email is already taken.
         """
-        user = User(
-            **body.model_dump(exclude_unset=True, exclude={"password"}),
-            hashed_password=body.password,
-            avatar=avatar,
+        stmt = (
+            insert(User)
+            .values(
+                **body.model_dump(exclude_unset=True, exclude={"password"}),
+                hashed_password=body.password,
+                avatar=avatar,
+            )
+            .returning(User)
         )
-        self.db.add(user)
+        try:
+            result = await self.db.execute(stmt)
+        except IntegrityError:
+            await self.db.rollback()
+            raise
+        user = result.scalar_one()
         await self.db.commit()
-        await self.db.refresh(user)
         return user
 
-    async def confirmed_email(self, email: str) -> None:
+    async def _update_by_email(self, email: str, **values) -> User | None:
+        stmt = (
+            update(User).where(User.email == email).values(**values).returning(User)
+        )
+        result = await self.db.execute(stmt)
+        user = result.scalar_one_or_none()
+        if user:
+            await self.db.commit()
+        return user
+
+    async def confirmed_email(self, email: str) -> User | None:
         """Mark a user's email as confirmed.
 
         Args:
             email (str): Email address of the user to confirm.
 
+        Returns:
+            User | None: Updated user instance, None if the email is unknown.
+
         Note:
-            This method assumes the email exists in the database.
             It should only be called after verifying the email token.
         """
-        user = await self.get_user_by_email(email)
-        user.confirmed = True
-        await self.db.commit()
+        user = await self._update_by_email(email, confirmed=True)
+        if user:
+            await user_cache.invalidate_after_write(user.username)
+        return user
 
-    async def update_avatar_url(self, email: str, url: str) -> User:
+    async def update_avatar_url(self, email: str, url: str) -> User | None:
         """Update a user's avatar URL.
 
         Args:
@@ -117,31 +172,31 @@ class UserRepository:
             url (str): New avatar URL.
 
         Returns:
-            User: Updated user instance.
+            User | None: Updated user instance, None if the email is unknown.
 
         Note:
-            This method assumes the email exists in the database.
             The URL should be validated before calling this method.
         """
-        user = await self.get_user_by_email(email)
-        user.avatar = url
-        await self.db.commit()
-        await self.db.refresh(user)
+        user = await self._update_by_email(email, avatar=url)
+        if user:
+            await user_cache.invalidate_after_write(user.username)
         return user
 
-    async def update_password(self, email: str, hashed_password: str) -> User:
+    async def update_password(self, email: str, hashed_password: str) -> User | None:
         """Update a user's password.
 
+        Bumps the user's token version, so access tokens issued with the
+        old password stop working immediately. If Redis is unreachable the
+        bump is queued and applied as soon as it recovers.
+
         Args:
             email (str): Email of the user to update.
             hashed_password (str): New hashed password to set.
 
         Returns:
-            User: Updated user instance.
+            User | None: Updated user instance, None if the email is unknown.
         """
-        user = await self.get_user_by_email(email)
+        user = await self._update_by_email(email, hashed_password=hashed_password)
         if user:
-            user.hashed_password = hashed_password
-            await self.db.commit()
-            await self.db.refresh(user)
+            await user_cache.invalidate_after_write(user.username, revoke_tokens=True)
         return user
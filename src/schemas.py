@@ -12,6 +12,7 @@ Each model includes field validations and type checking using Pydantic.
 from pydantic import BaseModel, Field, EmailStr, ConfigDict
 from datetime import date, datetime
 from typing import Optional
+from src.conf.config import settings
 from src.database.models import UserRole
 
 
@@ -78,6 +79,103 @@ class ContactUpdate(ContactModel):
     additional_info: Optional[str] = None
 
 
+class ContactIds(BaseModel):
+    """Model for operations on a set of contacts.
+
+    Attributes:
+        ids (list[int]): IDs of the contacts, at most ``CONTACT_BATCH_MAX_IDS``
+    """
+
+    ids: list[int] = Field(min_length=1, max_length=settings.CONTACT_BATCH_MAX_IDS)
+
+
+class ContactBatchChanges(BaseModel):
+    """Model for fields that can be set on many contacts at once.
+
+    ``email`` and ``phone`` are unique per contact, so they cannot be set
+    in a batch and are rejected; change them one contact at a time.
+
+    Attributes:
+        first_name (Optional[str]): Contact's first name (2-50 characters)
+        last_name (Optional[str]): Contact's last name (2-50 characters)
+        birthday (Optional[date]): Contact's birthday
+        additional_info (Optional[str]): Additional contact information
+            (max 250 characters)
+    """
+
+    first_name: Optional[str] = Field(None, min_length=2, max_length=50)
+    last_name: Optional[str] = Field(None, min_length=2, max_length=50)
+    birthday: Optional[date] = None
+    additional_info: Optional[str] = Field(None, max_length=250)
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class ContactBatchUpdate(ContactIds):
+    """Model for applying the same partial update to a set of contacts.
+
+    Additional Attributes:
+        changes (ContactBatchChanges): Fields to set on every contact
+    """
+
+    changes: ContactBatchChanges
+
+
+class ContactBatchResult(BaseModel):
+    """Outcome of an operation on a set of contacts.
+
+    Attributes:
+        contacts (list[ContactResponse]): Contacts the operation applied to,
+            in the order their IDs were given
+        missing (list[int]): IDs that match no contact of the user
+    """
+
+    contacts: list[ContactResponse]
+    missing: list[int]
+
+
+class ContactImportModel(ContactModel):
+    """Model for a contact row of a bulk import.
+
+    Caps the lengths at the sizes of the ``contacts`` columns, so a row the
+    database would reject fails validation on its own instead of failing
+    the whole batch it is inserted with.
+    """
+
+    first_name: str = Field(min_length=2, max_length=25)
+    last_name: str = Field(min_length=2, max_length=25)
+    email: EmailStr = Field(max_length=100)
+    phone: str = Field(max_length=20)
+
+
+class ContactImportError(BaseModel):
+    """A row of a contact import that was not imported.
+
+    Attributes:
+        line (int): Line of the upload the row starts on, counting from 1
+        errors (list[str]): Why the row was rejected
+    """
+
+    line: int
+    errors: list[str]
+
+
+class ContactImportReport(BaseModel):
+    """Outcome of a bulk contact import.
+
+    Attributes:
+        imported (int): Number of contacts created
+        duplicates (int): Rows skipped because their email or phone is taken
+        invalid (int): Rows rejected by validation
+        errors (list[ContactImportError]): One entry per row not imported
+    """
+
+    imported: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    errors: list[ContactImportError] = []
+
+
 # Схема користувача
 class User(BaseModel):
     """Model for user data responses.
@@ -100,6 +198,55 @@ class User(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class UserPrincipal(BaseModel):
+    """Read-only view of the authenticated user.
+
+    Built either from the cached Redis payload or from a database row, and
+    detached from any session, so it can be passed around freely without
+    triggering lazy loads.
+
+    Attributes:
+        id (int): Unique identifier for the user
+        username (str): User's chosen username
+        email (str): User's email address
+        avatar (str | None): URL to user's avatar image
+        role (UserRole): User's role
+        confirmed (bool): Whether the user's email has been confirmed
+        created_at (datetime | None): Timestamp of account creation
+    """
+
+    id: int
+    username: str
+    email: str
+    avatar: Optional[str] = None
+    role: UserRole
+    confirmed: bool
+    created_at: Optional[datetime] = None
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+class TokenClaims(BaseModel):
+    """Authorization claims carried by an access token.
+
+    Lets routes that only need identity and role authorize a request from
+    the token alone, without loading the user.
+
+    Attributes:
+        id (int): Unique identifier for the user
+        username (str): User's username (the token subject)
+        role (UserRole): User's role
+        confirmed (bool): Whether the user's email has been confirmed
+        version (int): Token version the token was issued under
+    """
+
+    id: int
+    username: str
+    role: UserRole
+    confirmed: bool
+    version: int = 0
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
 # Схема для запиту реєстрації
 class UserCreate(BaseModel):
     """Model for user registration requests.
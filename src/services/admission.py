@@ -0,0 +1,109 @@
+"""Admission control for CPU-bound request paths.
+
+This module provides a bounded concurrency gate with a wait queue and a
+queue-wait deadline. Requests that cannot be admitted in time, or that
+arrive while the queue is full, are rejected immediately with
+503 Service Unavailable and a Retry-After header, so latency stays bounded
+during a burst instead of growing with the backlog.
+"""
+
+import asyncio
+import contextlib
+import time
+
+from fastapi import HTTPException, status
+
+from src.services.metrics import metrics
+
+
+class AdmissionGate:
+    """Bounded concurrency gate with a bounded, time-limited wait queue.
+
+    Attributes:
+        name (str): Prefix of the metrics reported by this gate.
+        max_concurrency (int): Number of operations allowed to run at once.
+        max_queue (int): Number of operations allowed to wait for a slot.
+        queue_timeout (float): Seconds an operation may wait for a slot.
+        retry_after (int): Value of the Retry-After header on rejection.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int,
+        max_queue: int,
+        queue_timeout: float,
+        retry_after: int = 1,
+    ):
+        """Initialize the gate.
+
+        Args:
+            name (str): Prefix of the metrics reported by this gate.
+            max_concurrency (int): Number of operations allowed to run at once.
+            max_queue (int): Number of operations allowed to wait for a slot.
+            queue_timeout (float): Seconds an operation may wait for a slot.
+            retry_after (int): Value of the Retry-After header on rejection.
+        """
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._waiting = 0
+        self._active = 0
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+            self._waiting = 0
+            self._active = 0
+        return self._semaphore
+
+    def _reject(self, reason: str) -> HTTPException:
+        metrics.inc(f"{self.name}_rejected_{reason}")
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Сервер перевантажений, спробуйте пізніше",
+            headers={"Retry-After": str(self.retry_after)},
+        )
+
+    def _report(self) -> None:
+        metrics.set_gauge(f"{self.name}_queue_depth", self._waiting)
+        metrics.set_gauge(f"{self.name}_in_flight", self._active)
+
+    @contextlib.asynccontextmanager
+    async def admit(self):
+        """Wait for a free slot and hold it for the duration of the block.
+
+        Raises:
+            HTTPException: 503 with Retry-After if the queue is full or the
+                wait exceeds ``queue_timeout``.
+        """
+        semaphore = self._get_semaphore()
+        if semaphore.locked() and self._waiting >= self.max_queue:
+            raise self._reject("queue_full")
+
+        self._waiting += 1
+        self._report()
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise self._reject("timeout")
+        finally:
+            self._waiting -= 1
+            metrics.observe(f"{self.name}_queue_wait", time.perf_counter() - started)
+            self._report()
+
+        self._active += 1
+        self._report()
+        try:
+            yield
+        finally:
+            self._active -= 1
+            semaphore.release()
+            self._report()
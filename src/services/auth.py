@@ -1,3 +1,8 @@
+import asyncio
+import hashlib
+import time
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta, UTC
 from typing import Optional
 
@@ -6,28 +11,58 @@ from passlib.context import CryptContext
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 from jose import JWTError, jwt
+from pydantic import ValidationError
+from redis.commands.core import AsyncScript
+from redis.exceptions import RedisError
 
-from src.database.db import get_db
+from src.database.db import get_db, get_read_db
+from src.database.redis import redis_manager
 from src.conf.config import settings
+from src.services.admission import AdmissionGate
+from src.services.cache import TTLCache
+from src.services.circuit_breaker import redis_breaker
+from src.services.metrics import metrics
+from src.services.revocation import revocation_list
 from src.services.users import UserService
+from src.services.user_cache import user_cache
 from src.database.models import User, UserRole
-import json
-import redis
+from src.schemas import TokenClaims, UserPrincipal
 
 
-r = redis.Redis(host="localhost", port=6379, db=0)
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+hash_gate = AdmissionGate(
+    "hash",
+    max_concurrency=settings.HASH_MAX_CONCURRENCY,
+    max_queue=settings.HASH_MAX_QUEUE,
+    queue_timeout=settings.HASH_QUEUE_TIMEOUT_SECONDS,
+    retry_after=settings.HASH_RETRY_AFTER_SECONDS,
+)
+
+
+def _verify_password(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def _hash_password(password: str) -> str:
+    return pwd_context.hash(password)
 
 
 class Hash:
     """Utility class for password hashing and verification.
 
-    Uses bcrypt for secure password hashing and verification.
+    Uses bcrypt for secure password hashing and verification. The async
+    variants run bcrypt on a dedicated executor so the event loop keeps
+    serving other requests while a hash is computed, and pass through
+    ``hash_gate`` so a login storm is shed with 503 instead of queueing
+    without bound.
 
     Attributes:
         pwd_context (CryptContext): Passlib context for password hashing.
     """
 
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    pwd_context = pwd_context
+    _executor: Executor | None = None
 
     def verify_password(self, plain_password, hashed_password):
         """Verify a password against its hash.
@@ -52,68 +87,318 @@ class Hash:
         """
         return self.pwd_context.hash(password)
 
+    async def verify_password_async(self, plain_password, hashed_password) -> bool:
+        """Verify a password against its hash without blocking the event loop.
+
+        Args:
+            plain_password (str): Plain text password to verify.
+            hashed_password (str): Hashed password to verify against.
+
+        Returns:
+            bool: True if password matches hash, False otherwise.
+
+        Raises:
+            HTTPException: 503 if the hashing queue is full or the wait times out.
+        """
+        loop = asyncio.get_running_loop()
+        async with hash_gate.admit():
+            return await loop.run_in_executor(
+                self.executor(), _verify_password, plain_password, hashed_password
+            )
+
+    async def get_password_hash_async(self, password: str) -> str:
+        """Generate a password hash without blocking the event loop.
+
+        Args:
+            password (str): Plain text password to hash.
+
+        Returns:
+            str: Bcrypt hash of the password.
+
+        Raises:
+            HTTPException: 503 if the hashing queue is full or the wait times out.
+        """
+        loop = asyncio.get_running_loop()
+        async with hash_gate.admit():
+            return await loop.run_in_executor(self.executor(), _hash_password, password)
+
+    @classmethod
+    def executor(cls) -> Executor:
+        """Return the shared hashing executor, creating it on first use.
+
+        The executor kind (``thread`` or ``process``) and its size come from
+        ``HASH_EXECUTOR`` and ``HASH_POOL_SIZE`` in settings.
+
+        Returns:
+            Executor: Executor that runs bcrypt operations.
+        """
+        if cls._executor is None:
+            if settings.HASH_EXECUTOR == "process":
+                cls._executor = ProcessPoolExecutor(max_workers=settings.HASH_POOL_SIZE)
+            else:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=settings.HASH_POOL_SIZE, thread_name_prefix="bcrypt"
+                )
+        return cls._executor
+
+    @classmethod
+    def shutdown_executor(cls) -> None:
+        """Shut down the hashing executor, waiting for running jobs."""
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=True)
+            cls._executor = None
+
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+token_cache = TTLCache(
+    "token_cache",
+    maxsize=settings.TOKEN_CACHE_SIZE,
+    ttl=settings.JWT_EXPIRATION_SECONDS,
+)
+
+
+def decode_access_token(token: str) -> dict:
+    """Decode and verify a JWT, reusing claims of tokens verified before.
+
+    Verified claims are cached under the SHA-256 digest of the token until
+    the token's own ``exp``, so repeat callers skip parsing and signature
+    verification. Tokens that fail verification are never cached.
+
+    Args:
+        token (str): Encoded JWT.
+
+    Raises:
+        JWTError: If the token is malformed, forged or expired.
+
+    Returns:
+        dict: Verified token claims. Treat as read-only, it is shared.
+    """
+    digest = hashlib.sha256(token.encode("utf-8")).digest()
+    claims = token_cache.get(digest)
+    if claims is not None:
+        return claims
+
+    claims = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
+    exp = claims.get("exp")
+    if exp is not None:
+        token_cache.set(digest, claims, ttl=exp - time.time())
+    return claims
+
 
 async def create_access_token(
-    data: dict, expires_delta: Optional[int] = None, scope: str = "access"
+    data: dict,
+    expires_delta: Optional[int] = None,
+    scope: str = "access",
+    user: User | UserPrincipal | None = None,
 ):
     """Create a new JWT token with a specific scope (access or refresh).
 
+    Every token gets a unique ``jti`` so it can be revoked on its own, see
+    :func:`revoke_session`. When ``user`` is given, compact authorization
+    claims are embedded in the token: ``uid``, ``role``, ``confirmed`` and
+    ``ver`` (the user's current token version). Routes that only need identity and role can then
+    authorize from the token alone, see :func:`get_token_claims`.
+
     Args:
         data (dict): Payload data for the token (usually includes 'sub').
         expires_delta (Optional[int]): Lifetime of the token in seconds.
+            Access tokens never outlive ``JWT_EXPIRATION_SECONDS``, the
+            retention of the revocation log.
         scope (str): Token scope: 'access' or 'refresh'.
+        user (User | UserPrincipal | None): User whose claims to embed.
 
     Returns:
         str: JWT token string.
     """
     to_encode = data.copy()
     if scope == "access":
-        expire = datetime.now(UTC) + timedelta(
-            seconds=expires_delta or settings.JWT_EXPIRATION_SECONDS
+        # Довший токен пережив би свій запис у журналі відкликань
+        lifetime = min(
+            expires_delta or settings.JWT_EXPIRATION_SECONDS,
+            settings.JWT_EXPIRATION_SECONDS,
         )
+        expire = datetime.now(UTC) + timedelta(seconds=lifetime)
     elif scope == "refresh":
         expire = datetime.now(UTC) + timedelta(days=7)
     else:
         raise ValueError("Invalid token scope")
 
+    if user is not None:
+        to_encode.update(
+            {
+                "uid": user.id,
+                "role": UserRole(user.role).value,
+                "confirmed": user.confirmed,
+                "ver": await _token_version(user.username, required=True),
+            }
+        )
+    to_encode.setdefault("jti", uuid.uuid4().hex)
     to_encode.update({"exp": expire, "scope": scope})
     return jwt.encode(to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
 
 
-async def create_refresh_token(username: str) -> str:
-    """Create and store a refresh token for a user.
+REFRESH_TOKEN_TTL = 7 * 24 * 3600  # 7 days
+
+# Атомарна ротація refresh-токена в межах сімейства (один мережевий виклик).
+# KEYS: сімейство, множина сімейств користувача, версія токенів користувача,
+# закешований користувач.
+# ARGV: пред'явлений jti, новий jti, TTL, id сімейства, версія токенів
+# на момент видачі refresh-токена.
+# Повертає {статус, версія[, користувач]}: 1 - ротовано, 0 - невідоме або
+# застаріле сімейство, -1 - повторне використання (сімейство відкликано).
+ROTATE_REFRESH_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+local version = tonumber(redis.call('GET', KEYS[3]) or '0')
+if not current then
+    return {0, version}
+end
+if tonumber(ARGV[5]) < version then
+    redis.call('DEL', KEYS[1])
+    redis.call('SREM', KEYS[2], ARGV[4])
+    return {0, version}
+end
+if current ~= ARGV[1] then
+    redis.call('DEL', KEYS[1])
+    redis.call('SREM', KEYS[2], ARGV[4])
+    return {-1, version}
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+redis.call('EXPIRE', KEYS[2], ARGV[3])
+return {1, version, redis.call('GET', KEYS[4]) or ''}
+"""
+
+# Скрипт реєструється один раз; SHA рахується з байтів, тож клієнт
+# потрібен лише під час виклику.
+_rotate_refresh = AsyncScript(None, ROTATE_REFRESH_SCRIPT.encode("utf-8"))
+
+
+def refresh_family_key(username: str, family_id: str) -> str:
+    """Return the Redis key holding the current token id of a refresh family.
+
+    Args:
+        username (str): Owner of the refresh family.
+        family_id (str): Refresh family (device session) identifier.
+
+    Returns:
+        str: Redis key.
+    """
+    return f"refresh:{username}:{family_id}"
+
+
+def refresh_families_key(username: str) -> str:
+    """Return the Redis key of the set of a user's refresh families.
+
+    Args:
+        username (str): Owner of the refresh families.
+
+    Returns:
+        str: Redis key.
+    """
+    return f"refresh_families:{username}"
+
+
+async def create_refresh_token(
+    username: str, family_id: str, jti: str, version: int = 0
+) -> str:
+    """Create a refresh token that belongs to a refresh family.
+
+    Each login starts a new family (one per device session). Every use of a
+    refresh token rotates it: the family keeps only the newest ``jti``.
+    The token carries the user's token version, so bumping the version
+    (for example on a password change) also ends every refresh family.
 
     Args:
         username (str): The username to associate with the refresh token.
+        family_id (str): Refresh family identifier.
+        jti (str): Unique identifier of this refresh token.
+        version (int): The user's current token version.
 
     Returns:
         str: JWT refresh token.
     """
-    token_data = {"sub": username}
-    refresh_token = await create_access_token(token_data, scope="refresh")
+    token_data = {"sub": username, "fid": family_id, "jti": jti, "ver": version}
+    return await create_access_token(token_data, scope="refresh")
+
 
-    redis_key = f"refresh:{username}"
-    r.set(redis_key, refresh_token, ex=7 * 24 * 3600)  # 7 days
-    return refresh_token
+async def _start_refresh_family(username: str, family_id: str, jti: str):
+    families_key = refresh_families_key(username)
+    async with redis_manager.client.pipeline(transaction=True) as pipe:
+        pipe.set(refresh_family_key(username, family_id), jti, ex=REFRESH_TOKEN_TTL)
+        pipe.sadd(families_key, family_id)
+        pipe.expire(families_key, REFRESH_TOKEN_TTL)
+        pipe.get(user_cache.version_key(username))
+        *_, version = await pipe.execute()
+    return version
+
+
+async def _end_refresh_family(username: str, family_id: str) -> None:
+    async with redis_manager.client.pipeline(transaction=True) as pipe:
+        pipe.delete(refresh_family_key(username, family_id))
+        pipe.srem(refresh_families_key(username), family_id)
+        await pipe.execute()
+
+
+async def create_token_pair(user: User | UserPrincipal) -> dict:
+    """Start a new refresh family and issue an access/refresh token pair.
+
+    The family is stored and the user's token version is read in a single
+    Redis pipeline, so issuing tokens costs one network round-trip.
+
+    Args:
+        user (User | UserPrincipal): The authenticated user.
+
+    Returns:
+        dict: ``access_token``, ``refresh_token`` and ``token_type``.
+
+    Raises:
+        HTTPException: 503 if Redis is unavailable.
+    """
+    family_id, jti = uuid.uuid4().hex, uuid.uuid4().hex
+    try:
+        version = await redis_breaker.call(
+            _start_refresh_family, user.username, family_id, jti
+        )
+    except (RedisError, OSError):
+        raise _redis_unavailable()
+    version = int(version or 0)
+    user_cache.versions.set(user.username, version)
+
+    return {
+        "access_token": await create_access_token(
+            {"sub": user.username, "fid": family_id}, user=user
+        ),
+        "refresh_token": await create_refresh_token(
+            user.username, family_id, jti, version
+        ),
+        "token_type": "bearer",
+    }
 
 
 async def refresh_access_token(
     refresh_token: str, db: Session = Depends(get_db)
-) -> str:
-    """Validate refresh token and return a new access token.
+) -> dict:
+    """Validate and rotate a refresh token, returning a new token pair.
+
+    The presented token must be the newest one of its family. Presenting an
+    older token means it was stolen or replayed, so the whole family is
+    revoked and the device must log in again. A token issued before the
+    user's token version was bumped ends its family the same way.
+
+    The rotation script also returns the user's token version and cached
+    principal, so a refresh costs a single Redis round trip unless the
+    principal has to be loaded from the database.
 
     Args:
         refresh_token (str): JWT refresh token.
         db (Session): Database session.
 
     Returns:
-        str: New access token.
+        dict: ``access_token``, rotated ``refresh_token`` and ``token_type``.
 
     Raises:
-        HTTPException: If token is invalid or expired.
+        HTTPException: 401 if token is invalid, expired, reused or revoked,
+            503 if Redis is unavailable.
     """
     try:
         payload = jwt.decode(
@@ -124,93 +409,302 @@ async def refresh_access_token(
                 status_code=status.HTTP_401_UNAUTHORIZED, detail="Невірний тип токену"
             )
         username = payload.get("sub")
-    except JWTError:
+        family_id = payload["fid"]
+        jti = payload["jti"]
+        token_version = int(payload.get("ver", 0))
+    except (JWTError, KeyError, TypeError, ValueError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Невірний або протермінований токен",
         )
 
-    redis_key = f"refresh:{username}"
-    stored_token = r.get(redis_key)
-    if not stored_token or stored_token.decode("utf-8") != refresh_token:
+    new_jti = uuid.uuid4().hex
+    try:
+        rotated, version, *cached = await redis_breaker.call(
+            _rotate_refresh,
+            keys=[
+                refresh_family_key(username, family_id),
+                refresh_families_key(username),
+                user_cache.version_key(username),
+                user_cache.key(username),
+            ],
+            args=[jti, new_jti, REFRESH_TOKEN_TTL, family_id, token_version],
+            client=redis_manager.client,
+        )
+    except (RedisError, OSError):
+        # Без Redis ротацію не перевірити, тому відмовляємо (fail closed)
+        raise _redis_unavailable()
+    if rotated != 1:
+        if rotated == -1:
+            metrics.inc("refresh_token_reuse_detected")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Недійсний або відкликаний токен",
         )
-
-    user_service = UserService(db)
-    user = await user_service.get_user_by_username(username=username)
+    version = int(version)
+    user_cache.versions.set(username, version)
+
+    # Скрипт повертає закешованого користувача, тож другий запит до Redis
+    # потрібен лише на промах кешу
+    user = None
+    if cached and cached[0]:
+        try:
+            user = UserPrincipal.model_validate_json(cached[0])
+            user_cache.local.set(username, user)
+        except ValidationError:
+            user = None
+    if user is None:
+        user = await get_principal(username, db)
     if not user:
         raise HTTPException(status_code=404, detail="Користувача не знайдено")
 
-    return await create_access_token({"sub": username})
+    return {
+        "access_token": await create_access_token(
+            {"sub": username, "fid": family_id}, user=user
+        ),
+        "refresh_token": await create_refresh_token(
+            username, family_id, new_jti, version
+        ),
+        "token_type": "bearer",
+    }
+
 
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
+
+def _redis_unavailable() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Сервіс тимчасово недоступний, спробуйте пізніше",
+        headers={"Retry-After": str(int(redis_breaker.reset_timeout))},
+    )
+
+
+async def _guarded_read(
+    local: TTLCache, key: str, load, *args, hit_metric: str | None = None
 ):
-    """Get the current authenticated user from a JWT token and verify it with Redis.
+    """Serve a read from the L1 cache, or load it from Redis through the breaker.
 
-    This is a FastAPI dependency that validates the JWT token and returns the user.
+    The L1 lookup and the hit are one step, so an entry expiring in between
+    can never send the read to Redis unguarded. Reads served from L1 never
+    touch Redis, so they neither count towards the breaker nor get rejected
+    while it is open.
+    """
+    value = local.get(key)
+    if value is not None:
+        if hit_metric is not None:
+            metrics.inc(hit_metric)
+        return value
+    return await redis_breaker.call(load, *args)
+
+
+async def _token_version(username: str, required: bool = False) -> int | None:
+    """Return a user's token version, tolerating an unavailable Redis.
+
+    Args:
+        username (str): Username of the token owner.
+        required (bool): Raise 503 instead of returning None without Redis.
+
+    Returns:
+        int | None: Current version, or None if it cannot be read.
+    """
+    try:
+        return await _guarded_read(
+            user_cache.versions, username, user_cache.load_token_version, username
+        )
+    except (RedisError, OSError):
+        if required:
+            raise _redis_unavailable()
+        metrics.inc("auth_redis_fallbacks")
+        return None
+
+
+async def _is_revoked(jti: str) -> bool:
+    """Check the revocation list, failing closed only on filter hits.
+
+    Without Redis the local filter is used as it stands: tokens it does not
+    know are accepted, tokens it may know are rejected.
+    """
+    if revocation_list.sync_due:
+        try:
+            await redis_breaker.call(revocation_list.sync)
+        except (RedisError, OSError):
+            metrics.inc("auth_redis_fallbacks")
+    if not revocation_list.might_be_revoked(jti):
+        return False
+    try:
+        return await redis_breaker.call(revocation_list.confirm, jti)
+    except (RedisError, OSError):
+        metrics.inc("auth_redis_fallbacks")
+        return True
+
+
+async def _verify_access_token(token: str) -> dict:
+    """Verify an access token and check that it has not been revoked.
+
+    While Redis is unavailable the checks degrade to what this worker knows
+    locally instead of failing the request.
 
     Args:
         token (str): JWT token from Authorization header.
-        db (Session): Database session.
 
     Raises:
-        HTTPException: 401 if token is invalid, expired, revoked, or user not found.
+        HTTPException: 401 if token is invalid, expired, revoked or not an
+            access token.
 
     Returns:
-        User: Current authenticated user.
+        dict: Verified token claims.
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+    try:
+        payload = decode_access_token(token)
+    except JWTError:
+        raise _credentials_exception()
+    username = payload.get("sub")
+    # Refresh, email and reset tokens are signed with the same key but
+    # must never authenticate an API call.
+    if username is None or payload.get("scope") != "access":
+        raise _credentials_exception()
+    # Токени, видані до зміни ролі чи пароля, відкликаються через версію.
+    # Якщо Redis недоступний, версію перевірити неможливо - пропускаємо.
+    if "ver" in payload:
+        version = await _token_version(username)
+        if version is not None and payload["ver"] < version:
+            raise _credentials_exception()
+    # Токени, відкликані під час виходу із системи
+    if "jti" in payload and await _is_revoked(payload["jti"]):
+        raise _credentials_exception()
+    return payload
+
+
+async def revoke_session(token: str) -> None:
+    """Revoke an access token and the refresh family it was issued with.
+
+    The token stays on the revocation list until it would have expired, and
+    the device's refresh family is dropped so it cannot mint new tokens.
+
+    Args:
+        token (str): JWT access token from Authorization header.
+
+    Raises:
+        HTTPException: 401 if token is invalid, expired or already revoked,
+            503 if Redis is unavailable.
+    """
+    payload = await _verify_access_token(token)
+    if "jti" not in payload:
+        raise _credentials_exception()
 
     try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
+        await redis_breaker.call(revocation_list.revoke, payload["jti"], payload["exp"])
+        if "fid" in payload:
+            await redis_breaker.call(_end_refresh_family, payload["sub"], payload["fid"])
+    except (RedisError, OSError):
+        raise _redis_unavailable()
+
+
+async def get_principal(username: str, db: Session) -> UserPrincipal | None:
+    """Load a user's principal, from cache when possible.
+
+    Falls back to the database when Redis is unavailable. Principals read
+    from a replica are cached only for the L1 TTL, so a lagging replica
+    cannot pin stale data in the shared cache.
+
+    Args:
+        username (str): Username to look up.
+        db (Session): Database session used on a cache miss.
+
+    Returns:
+        UserPrincipal | None: The principal, or None if the user does not exist.
+    """
+    try:
+        principal = await _guarded_read(
+            user_cache.local,
+            username,
+            user_cache.load,
+            username,
+            hit_metric="user_cache_hits",
         )
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-    except JWTError:
-        raise credentials_exception
-
-    redis_key = f"user:{username}"
-    user_data = r.get(redis_key)
-    if user_data:
-        # Якщо користувач є в кеші, повертаємо дані
-        user_dict = json.loads(user_data.decode("utf-8"))
-        # Instead of creating a new User instance, get the existing one from DB
-        user_service = UserService(db)
-        user = await user_service.get_user_by_username(username=username)
-        if user is None:
-            raise credentials_exception
-        return user
-
-    # Якщо користувача немає в кеші, отримуємо з бази даних
+    except (RedisError, OSError):
+        metrics.inc("auth_redis_fallbacks")
+        principal = None
+    if principal is not None:
+        return principal
+
     user_service = UserService(db)
     user = await user_service.get_user_by_username(username=username)
     if user is None:
-        raise credentials_exception
-
-    # Convert to a dictionary for Redis storage
-    user_data = {
-        "id": user.id,
-        "username": user.username,
-        "email": user.email,
-        "created_at": user.created_at.isoformat(),
-        "avatar": user.avatar,
-        "confirmed": user.confirmed,
-    }
+        return None
+    # Репліка може відставати, тому її дані кешуються лише ненадовго
+    ttl = user_cache.local.ttl if db.info.get("replica") else None
+    try:
+        return await redis_breaker.call(user_cache.set, user, ttl=ttl)
+    except (RedisError, OSError):
+        return UserPrincipal.model_validate(user)
 
-    # Кешуємо користувача в Redis на 15 хвилин
-    r.set(redis_key, json.dumps(user_data), ex=900)
 
-    return user
+async def get_current_user(
+    token: str = Depends(oauth2_scheme), db: Session = Depends(get_read_db)
+):
+    """Get the current authenticated user from a JWT token and verify it with Redis.
+
+    This is a FastAPI dependency that validates the JWT token and returns the user.
+    On a cache hit the principal is built from the cached payload and the
+    database is not queried at all.
+
+    Args:
+        token (str): JWT token from Authorization header.
+        db (Session): Database session.
+
+    Raises:
+        HTTPException: 401 if token is invalid, expired, revoked, or user not found.
+
+    Returns:
+        UserPrincipal: Read-only view of the current authenticated user.
+    """
+    payload = await _verify_access_token(token)
+    principal = await get_principal(payload["sub"], db)
+    if principal is None:
+        raise _credentials_exception()
+    return principal
+
+
+async def get_token_claims(
+    token: str = Depends(oauth2_scheme), db: Session = Depends(get_read_db)
+) -> TokenClaims:
+    """Get the authorization claims of the current request from its token.
+
+    Tokens issued with embedded claims are authorized without loading the
+    user. Older tokens that carry only ``sub`` fall back to the cached
+    principal.
+
+    Args:
+        token (str): JWT token from Authorization header.
+        db (Session): Database session, used only for tokens without claims.
+
+    Raises:
+        HTTPException: 401 if token is invalid, expired, revoked, or user not found.
+
+    Returns:
+        TokenClaims: Identity and role of the current user.
+    """
+    payload = await _verify_access_token(token)
+    if "uid" in payload and "role" in payload:
+        return TokenClaims(
+            id=payload["uid"],
+            username=payload["sub"],
+            role=payload["role"],
+            confirmed=payload.get("confirmed", False),
+            version=payload.get("ver", 0),
+        )
+
+    principal = await get_principal(payload["sub"], db)
+    if principal is None:
+        raise _credentials_exception()
+    return TokenClaims.model_validate(principal)
 
 
 def create_email_token(data: dict):
@@ -270,19 +764,20 @@ async def create_password_reset_token(data: dict) -> str:
     return token
 
 
-def get_current_admin_user(current_user: User = Depends(get_current_user)):
+def get_current_admin_user(current_user: TokenClaims = Depends(get_token_claims)):
     """Check if the current user is an administrator.
 
     This is a FastAPI dependency that can be used to protect admin-only endpoints.
-    It builds on top of get_current_user to first authenticate the user,
-    then verifies if they have administrator privileges.
+    It builds on top of get_token_claims to first authenticate the user,
+    then verifies if they have administrator privileges, using the role
+    carried by the token rather than a user lookup.
 
     Args:
-        current_user (User): The authenticated user from get_current_user dependency.
+        current_user (TokenClaims): The claims from get_token_claims dependency.
             This parameter is injected by FastAPI's dependency system.
 
     Returns:
-        User: The current user if they are an administrator.
+        TokenClaims: The current user's claims if they are an administrator.
 
     Raises:
         HTTPException: 403 Forbidden if the user is not an administrator.
@@ -292,7 +787,7 @@ def get_current_admin_user(current_user: User = Depends(get_current_user)):
     Example:
         ```python
         @router.get("/admin-only")
-        async def admin_endpoint(admin: User = Depends(get_current_admin_user)):
+        async def admin_endpoint(admin: TokenClaims = Depends(get_current_admin_user)):
             return {"message": "You are an admin"}
         ```
     """
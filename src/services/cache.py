@@ -0,0 +1,95 @@
+"""In-process TTL/LRU cache.
+
+This module provides a bounded, per-worker cache used in front of Redis on
+hot paths. Entries expire after a fixed TTL (or at an explicit deadline) and
+the least recently used entry is evicted when the cache is full. Hits,
+misses and evictions are reported through the metrics registry.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+from src.services.metrics import metrics
+
+
+class TTLCache:
+    """Bounded in-memory cache with per-entry expiry and LRU eviction.
+
+    Attributes:
+        name (str): Prefix of the metrics reported by this cache.
+        maxsize (int): Maximum number of entries kept.
+        ttl (float): Default lifetime of an entry in seconds.
+    """
+
+    def __init__(self, name: str, maxsize: int, ttl: float):
+        """Initialize an empty cache.
+
+        Args:
+            name (str): Prefix of the metrics reported by this cache.
+            maxsize (int): Maximum number of entries kept. 0 disables the cache.
+            ttl (float): Default lifetime of an entry in seconds.
+        """
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        metrics.register_collector(f"{name}_size", lambda: len(self._data))
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return a live entry and mark it as recently used.
+
+        Args:
+            key (Hashable): Cache key.
+
+        Returns:
+            Any | None: Cached value, or None if missing or expired.
+        """
+        item = self._data.get(key)
+        if item is not None:
+            expires_at, value = item
+            if expires_at > time.monotonic():
+                self._data.move_to_end(key)
+                metrics.inc(f"{self.name}_hits")
+                return value
+            del self._data[key]
+        metrics.inc(f"{self.name}_misses")
+        return None
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """Store an entry, evicting the least recently used one if full.
+
+        Args:
+            key (Hashable): Cache key.
+            value (Any): Value to cache.
+            ttl (float | None): Lifetime in seconds. Defaults to the cache TTL.
+        """
+        if self.maxsize <= 0:
+            return
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            metrics.inc(f"{self.name}_evictions")
+
+    def pop(self, key: Hashable) -> None:
+        """Drop an entry if present.
+
+        Args:
+            key (Hashable): Cache key.
+        """
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        item = self._data.get(key)
+        return item is not None and item[0] > time.monotonic()
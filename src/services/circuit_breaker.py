@@ -0,0 +1,143 @@
+"""Circuit breaker for calls to backing services.
+
+A breaker counts consecutive failures of the calls it guards. After
+``failure_threshold`` failures it opens and rejects calls immediately for
+``reset_timeout`` seconds, so a slow or unreachable Redis costs a request
+nothing instead of a socket timeout. It then lets a single trial call
+through (half-open); success closes it again, failure reopens it.
+
+Every guarded call also runs under a hard deadline, so a server that
+accepts connections but never replies is treated as a failure.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
+
+from redis.exceptions import RedisError
+
+from src.conf.config import settings
+from src.services.metrics import metrics
+
+
+class CircuitOpenError(RedisError):
+    """Raised instead of calling the service while the breaker is open."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for async calls.
+
+    Attributes:
+        name (str): Prefix of the metrics reported by this breaker.
+        failure_threshold (int): Consecutive failures that open the breaker.
+        reset_timeout (float): Seconds the breaker stays open before a trial call.
+        call_timeout (float): Deadline of a single guarded call in seconds.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    _STATE_CODES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        reset_timeout: float,
+        call_timeout: float,
+    ):
+        """Initialize a closed breaker.
+
+        Args:
+            name (str): Prefix of the metrics reported by this breaker.
+            failure_threshold (int): Consecutive failures that open the breaker.
+            reset_timeout (float): Seconds the breaker stays open before a trial call.
+            call_timeout (float): Deadline of a single guarded call in seconds.
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.call_timeout = call_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        metrics.set_gauge(f"{name}_state", self._STATE_CODES[self.state])
+
+    def _transition(self, state: str) -> None:
+        if state == self.state:
+            return
+        self.state = state
+        metrics.set_gauge(f"{self.name}_state", self._STATE_CODES[state])
+        metrics.inc(f"{self.name}_{state}")
+
+    def _before_call(self) -> bool:
+        if self.state == self.OPEN:
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            self._transition(self.HALF_OPEN)
+        if self.state == self.HALF_OPEN:
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+        return True
+
+    def _on_success(self) -> None:
+        self._failures = 0
+        self._trial_in_flight = False
+        self._transition(self.CLOSED)
+
+    def _on_failure(self) -> None:
+        metrics.inc(f"{self.name}_failures")
+        self._failures += 1
+        self._trial_in_flight = False
+        if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+            self._transition(self.OPEN)
+
+    async def call(
+        self, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Run a guarded call.
+
+        Args:
+            func (Callable[..., Awaitable[Any]]): Coroutine function to call.
+            *args (Any): Positional arguments for ``func``.
+            **kwargs (Any): Keyword arguments for ``func``.
+
+        Returns:
+            Any: The result of ``func``.
+
+        Raises:
+            CircuitOpenError: If the breaker is open.
+            RedisError | OSError: If the call fails or exceeds ``call_timeout``.
+        """
+        if not self._before_call():
+            metrics.inc(f"{self.name}_rejected")
+            raise CircuitOpenError(f"{self.name} is open")
+        try:
+            result = await asyncio.wait_for(func(*args, **kwargs), self.call_timeout)
+        except (RedisError, OSError, asyncio.TimeoutError):
+            self._on_failure()
+            raise
+        except BaseException:
+            self._trial_in_flight = False
+            raise
+        self._on_success()
+        return result
+
+    def reset(self) -> None:
+        """Close the breaker and forget past failures."""
+        self._failures = 0
+        self._trial_in_flight = False
+        self._transition(self.CLOSED)
+
+
+# Global breaker guarding Redis calls on the authentication path
+redis_breaker = CircuitBreaker(
+    "redis_breaker",
+    failure_threshold=settings.REDIS_BREAKER_FAILURE_THRESHOLD,
+    reset_timeout=settings.REDIS_BREAKER_RESET_SECONDS,
+    call_timeout=settings.REDIS_BREAKER_CALL_TIMEOUT_SECONDS,
+)
@@ -0,0 +1,183 @@
+"""Redis cache of per-user contact responses.
+
+Responses are cached as ready-to-send JSON under keys that embed a
+per-user contacts version (``contacts_version:{user_id}``). Every contact
+write bumps the version with :meth:`ContactCache.bump`, which makes all of
+that user's cached responses unreachable at once; they expire on their own.
+
+A version read before a concurrent write only ever names entries of the
+older version, so a response computed from pre-write rows is never served
+after the write.
+
+If the bump itself fails because Redis is unavailable, the stale entries
+stay reachable, so entry lifetimes are kept short
+(``CONTACT_CACHE_TTL_SECONDS``) to bound how long they can be served.
+"""
+
+import hashlib
+from datetime import date, datetime, time, timedelta
+
+from src.conf.config import settings
+from src.database.redis import redis_manager
+from src.services.metrics import metrics
+
+
+class ContactCache:
+    """Versioned Redis cache of serialized contact responses.
+
+    Attributes:
+        ttl (int): Upper bound on the lifetime of an entry in seconds.
+    """
+
+    def __init__(self, ttl: int):
+        """Initialize the cache.
+
+        Args:
+            ttl (int): Upper bound on the lifetime of an entry in seconds.
+        """
+        self.ttl = ttl
+
+    @staticmethod
+    def version_key(user_id: int) -> str:
+        """Return the Redis key holding a user's contacts version.
+
+        Args:
+            user_id (int): ID of the contacts owner.
+
+        Returns:
+            str: Redis key.
+        """
+        return f"contacts_version:{user_id}"
+
+    @staticmethod
+    def entry_key(user_id: int, version: int, name: str) -> str:
+        """Return the Redis key of a cached response.
+
+        Args:
+            user_id (int): ID of the contacts owner.
+            version (int): Contacts version the response was computed at.
+            name (str): Name of the response, unique per user.
+
+        Returns:
+            str: Redis key.
+        """
+        return f"contacts_cache:{user_id}:{version}:{name}"
+
+    @staticmethod
+    def page_name(limit: int, skip: int, after: int | None, q: str | None) -> str:
+        """Return the entry name of a contacts list page.
+
+        Parameters that do not affect the result are normalized away, so
+        equivalent requests share an entry.
+
+        Args:
+            limit (int): Page size.
+            skip (int): Offset, ignored when ``after`` is given.
+            after (int | None): Keyset cursor position.
+            q (str | None): Search query; empty means no search.
+
+        Returns:
+            str: Entry name.
+        """
+        position = f"after={after}" if after is not None else f"skip={skip}"
+        query = hashlib.blake2b(q.encode(), digest_size=12).hexdigest() if q else ""
+        return f"page:{limit}:{position}:{query}"
+
+    @staticmethod
+    def birthdays_name(day: date, days: int) -> str:
+        """Return the entry name of a birthdays response.
+
+        Args:
+            day (date): Day the window starts on.
+            days (int): Length of the window.
+
+        Returns:
+            str: Entry name.
+        """
+        return f"birthdays:{day.isoformat()}:{days}"
+
+    async def version(self, user_id: int) -> int:
+        """Return the current contacts version of a user.
+
+        Args:
+            user_id (int): ID of the contacts owner.
+
+        Returns:
+            int: Current version, 0 if the user's contacts never changed.
+        """
+        return int(await redis_manager.client.get(self.version_key(user_id)) or 0)
+
+    async def bump(self, user_id: int) -> int:
+        """Invalidate every cached response of a user.
+
+        Args:
+            user_id (int): ID of the contacts owner.
+
+        Returns:
+            int: The new version.
+        """
+        version = await redis_manager.client.incr(self.version_key(user_id))
+        metrics.inc("contact_cache_invalidations")
+        return version
+
+    async def get(self, user_id: int, name: str) -> tuple[int, bytes | None]:
+        """Look up a cached response at the user's current version.
+
+        Args:
+            user_id (int): ID of the contacts owner.
+            name (str): Name of the response.
+
+        Returns:
+            tuple[int, bytes | None]: The current version, to store a fresh
+                response under on a miss, and the cached bytes or None.
+        """
+        version = await self.version(user_id)
+        payload = await redis_manager.client.get(
+            self.entry_key(user_id, version, name)
+        )
+        metrics.inc("contact_cache_hits" if payload is not None else "contact_cache_misses")
+        return version, payload
+
+    async def set(
+        self,
+        user_id: int,
+        version: int,
+        name: str,
+        payload: bytes,
+        ttl: int | None = None,
+    ) -> None:
+        """Cache a response under the version it was computed at.
+
+        Args:
+            user_id (int): ID of the contacts owner.
+            version (int): Version returned by :meth:`get`.
+            name (str): Name of the response.
+            payload (bytes): Serialized response.
+            ttl (int | None): Lifetime in seconds, capped by the cache TTL.
+        """
+        ex = self.ttl if ttl is None else min(self.ttl, ttl)
+        await redis_manager.client.set(
+            self.entry_key(user_id, version, name), payload, ex=max(1, ex)
+        )
+
+
+def seconds_until_end_of(day: date) -> int:
+    """Return the number of whole seconds left until the midnight after ``day``.
+
+    Args:
+        day (date): Day whose end to measure to.
+
+    Returns:
+        int: Seconds until midnight, at least 1.
+    """
+    midnight = datetime.combine(day + timedelta(days=1), time.min)
+    return max(1, int((midnight - datetime.now()).total_seconds()))
+
+
+# Global contact cache instance
+contact_cache = ContactCache(ttl=settings.CONTACT_CACHE_TTL_SECONDS)
+
+metrics.register_collector(
+    "contact_cache_hit_ratio",
+    lambda: metrics.ratio("contact_cache_hits", "contact_cache_misses"),
+)
@@ -1,8 +1,261 @@
+import base64
+import binascii
+import csv
+import io
+import json
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import AsyncIterable, AsyncIterator, List
+
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import to_json
+from redis.exceptions import RedisError
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.repository.contacts import ContactRepository
-from src.schemas import ContactModel, ContactUpdate
+from src.repository.contacts import EXPORT_COLUMNS, ContactRepository
+from src.schemas import (
+    ContactBatchChanges,
+    ContactBatchResult,
+    ContactImportError,
+    ContactImportModel,
+    ContactImportReport,
+    ContactModel,
+    ContactResponse,
+    ContactUpdate,
+)
+from src.database.db import is_recent_writer
 from src.database.models import User
+from src.services.circuit_breaker import redis_breaker
+from src.conf.config import settings
+from src.services.contact_cache import contact_cache, seconds_until_end_of
+from src.services.metrics import metrics
+
+contact_list_adapter = TypeAdapter(List[ContactResponse])
+contact_batch_adapter = TypeAdapter(List[ContactImportModel])
+
+DUPLICATE_CONTACT = "Contact with this email or phone already exists"
+UNSAVED_CONTACT = "Contact could not be saved"
+
+
+def dump_contacts(contacts) -> bytes:
+    """Serialize contacts as a JSON array of :class:`ContactResponse` objects.
+
+    Args:
+        contacts (Iterable[Contact]): ORM contacts to serialize.
+
+    Returns:
+        bytes: The JSON array.
+    """
+    return contact_list_adapter.dump_json(
+        contact_list_adapter.validate_python(contacts, from_attributes=True)
+    )
+
+
+def _csv_value(value):
+    return value.isoformat() if isinstance(value, date) else value
+
+
+def dump_ndjson_rows(rows) -> bytes:
+    """Serialize contact rows as newline-delimited JSON objects.
+
+    Args:
+        rows (Sequence[Row]): Rows of :data:`EXPORT_COLUMNS`.
+
+    Returns:
+        bytes: One JSON object per line, each line newline-terminated.
+    """
+    return b"".join(to_json(row._asdict()) + b"\n" for row in rows)
+
+
+def dump_csv_rows(rows) -> bytes:
+    """Serialize contact rows as CSV records.
+
+    Dates and times are written in ISO 8601, as in the JSON responses.
+
+    Args:
+        rows (Sequence[Sequence]): Rows of :data:`EXPORT_COLUMNS`, or the
+            header.
+
+    Returns:
+        bytes: UTF-8 encoded CSV records.
+    """
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(
+        [_csv_value(value) for value in row] for row in rows
+    )
+    return buffer.getvalue().encode()
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[tuple[int, bytes]]:
+    """Split a byte stream into lines as the chunks arrive.
+
+    Args:
+        chunks (AsyncIterable[bytes]): Chunks of the upload, split anywhere.
+
+    Yields:
+        tuple[int, bytes]: Line number, counting from 1, and the line
+            without its terminator.
+    """
+    number, buffer = 0, b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            number += 1
+            yield number, line.removesuffix(b"\r")
+    if buffer:
+        yield number + 1, buffer.removesuffix(b"\r")
+
+
+async def iter_records(
+    chunks: AsyncIterable[bytes], fmt: str
+) -> AsyncIterator[tuple[int, object, str | None]]:
+    """Parse an NDJSON or CSV upload into records, one at a time.
+
+    CSV uploads start with a header row naming the columns; a quoted field
+    may span lines. Blank lines are skipped.
+
+    Args:
+        chunks (AsyncIterable[bytes]): Chunks of the upload.
+        fmt (str): ``"ndjson"`` or ``"csv"``.
+
+    Yields:
+        tuple[int, object, str | None]: The line the record starts on, the
+            parsed record, and an error message if it could not be parsed.
+    """
+    header, pending, start = None, "", 0
+    async for number, raw in iter_lines(chunks):
+        try:
+            line = raw.decode()
+        except UnicodeDecodeError:
+            yield number, None, "Invalid UTF-8"
+            continue
+        if number == 1:
+            line = line.removeprefix("\ufeff")
+
+        if fmt != "csv":
+            if not line.strip():
+                continue
+            try:
+                yield number, json.loads(line), None
+            except json.JSONDecodeError as e:
+                yield number, None, f"Invalid JSON: {e.msg}"
+            continue
+
+        if not pending:
+            start = number
+        pending += line
+        if pending.count('"') % 2:
+            pending += "\n"  # the record continues inside a quoted field
+            continue
+        text, pending = pending, ""
+        if not text.strip():
+            continue
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [name.strip() for name in values]
+        elif len(values) != len(header):
+            yield start, None, f"Expected {len(header)} fields, got {len(values)}"
+        else:
+            yield start, dict(zip(header, values)), None
+    if pending:
+        yield start, None, "Unterminated quoted field"
+
+
+def batch_result(ids: List[int], contacts) -> ContactBatchResult:
+    """Report the outcome of an operation on several contacts.
+
+    Args:
+        ids (List[int]): Distinct IDs the operation was asked to apply to.
+        contacts (Iterable[Contact]): Contacts it applied to, in any order.
+
+    Returns:
+        ContactBatchResult: The contacts in the order of ``ids``, and the
+            IDs that matched no contact.
+    """
+    by_id = {contact.id: contact for contact in contacts}
+    return ContactBatchResult(
+        contacts=[
+            ContactResponse.model_validate(by_id[contact_id], from_attributes=True)
+            for contact_id in ids
+            if contact_id in by_id
+        ],
+        missing=[contact_id for contact_id in ids if contact_id not in by_id],
+    )
+
+
+def encode_cursor(contact_id: int) -> str:
+    """Encode the ID of the last contact of a page as an opaque cursor.
+
+    Args:
+        contact_id (int): ID of the last contact returned.
+
+    Returns:
+        str: URL-safe cursor token.
+    """
+    raw = f"id:{contact_id}".encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    """Decode a cursor produced by :func:`encode_cursor`.
+
+    Args:
+        cursor (str): Cursor token from a previous page.
+
+    Returns:
+        int: ID of the last contact of the previous page.
+
+    Raises:
+        ValueError: If the token is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    prefix, _, value = raw.partition(":")
+    if prefix != "id" or not value.isdigit():
+        raise ValueError("Invalid cursor")
+    return int(value)
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def contact_etag(contact_id: int, updated_at: datetime) -> str:
+    """Build the strong ETag of a contact from its ID and last update time.
+
+    The tag is reversible with :func:`parse_contact_etag`, so ``If-Match``
+    can be checked by the database in the update statement itself.
+
+    Args:
+        contact_id (int): ID of the contact.
+        updated_at (datetime): Time of the contact's last update.
+
+    Returns:
+        str: Quoted entity tag.
+    """
+    micros = (updated_at - _EPOCH) // timedelta(microseconds=1)
+    return f'"{contact_id}-{micros}"'
+
+
+def parse_contact_etag(etag: str) -> tuple[int, datetime]:
+    """Decode an ETag produced by :func:`contact_etag`.
+
+    Args:
+        etag (str): Quoted entity tag.
+
+    Returns:
+        tuple[int, datetime]: Contact ID and last update time.
+
+    Raises:
+        ValueError: If the tag was not produced by :func:`contact_etag`.
+    """
+    contact_id, _, micros = etag.strip('"').partition("-")
+    if not (contact_id.isdigit() and micros.isdigit()):
+        raise ValueError("Invalid contact ETag")
+    return int(contact_id), _EPOCH + timedelta(microseconds=int(micros))
 
 
 class ContactService:
@@ -37,7 +290,12 @@ class ContactService:
         return await self.contact_repository.create_contact(body, user)
 
     async def get_contacts(
-        self, skip: int, limit: int, user: User, q: str | None = None
+        self,
+        skip: int,
+        limit: int,
+        user: User,
+        q: str | None = None,
+        after: int | None = None,
     ):
         """Retrieve a paginated list of contacts with optional search.
 
@@ -46,11 +304,15 @@ class ContactService:
             limit (int): Maximum number of contacts to return.
             user (User): User whose contacts to retrieve.
             q (str | None, optional): Search query string. Defaults to None.
+            after (int | None, optional): ID of the last contact of the
+                previous page. Defaults to None.
 
         Returns:
             List[Contact]: List of contacts matching the criteria.
         """
-        return await self.contact_repository.get_contacts(skip, limit, q, user)
+        return await self.contact_repository.get_contacts(
+            skip, limit, user, q=q, after=after
+        )
 
     async def get_contact(self, contact_id: int, user: User):
         """Retrieve a specific contact by ID.
@@ -64,18 +326,43 @@ class ContactService:
         """
         return await self.contact_repository.get_contact_by_id(contact_id, user)
 
-    async def update_contact(self, contact_id: int, body: ContactUpdate, user: User):
+    async def get_contact_updated_at(self, contact_id: int, user: User):
+        """Retrieve the last update time of a contact.
+
+        Args:
+            contact_id (int): ID of the contact.
+            user (User): User who owns the contact.
+
+        Returns:
+            datetime | None: Last update time if found and owned by user,
+                None otherwise.
+        """
+        return await self.contact_repository.get_contact_updated_at(contact_id, user)
+
+    async def update_contact(
+        self,
+        contact_id: int,
+        body: ContactUpdate,
+        user: User,
+        if_updated_at: list[datetime] | None = None,
+    ):
         """Update an existing contact.
 
         Args:
             contact_id (int): ID of the contact to update.
             body (ContactUpdate): Updated contact data.
             user (User): User who owns the contact.
+            if_updated_at (list[datetime] | None, optional): Only update if
+                the contact was last updated at one of these times.
+                Defaults to None.
 
         Returns:
-            Contact | None: Updated contact if found and owned by user, None otherwise.
+            Contact | None: Updated contact if found, owned by user and at an
+                expected version, None otherwise.
         """
-        return await self.contact_repository.update_contact(contact_id, body, user)
+        return await self.contact_repository.update_contact(
+            contact_id, body, user, if_updated_at=if_updated_at
+        )
 
     async def remove_contact(self, contact_id: int, user: User):
         """Delete a contact.
@@ -89,16 +376,319 @@ class ContactService:
         """
         return await self.contact_repository.remove_contact(contact_id, user)
 
-    async def get_birthday_list(self, user: User):
+    async def get_contacts_by_ids(self, ids: List[int], user: User):
+        """Retrieve several contacts by ID.
+
+        Args:
+            ids (List[int]): IDs of the contacts to retrieve.
+            user (User): User who owns the contacts.
+
+        Returns:
+            ContactBatchResult: Contacts found, and the IDs that were not.
+        """
+        ids = list(dict.fromkeys(ids))
+        contacts = await self.contact_repository.get_contacts_by_ids(ids, user)
+        return batch_result(ids, contacts)
+
+    async def update_contacts(
+        self, ids: List[int], body: ContactBatchChanges, user: User
+    ):
+        """Apply the same update to several contacts.
+
+        Args:
+            ids (List[int]): IDs of the contacts to update.
+            body (ContactBatchChanges): Fields to set.
+            user (User): User who owns the contacts.
+
+        Returns:
+            ContactBatchResult: Contacts updated, and the IDs not found.
+        """
+        ids = list(dict.fromkeys(ids))
+        contacts = await self.contact_repository.update_contacts(ids, body, user)
+        return batch_result(ids, contacts)
+
+    async def remove_contacts(self, ids: List[int], user: User):
+        """Delete several contacts.
+
+        Args:
+            ids (List[int]): IDs of the contacts to delete.
+            user (User): User who owns the contacts.
+
+        Returns:
+            ContactBatchResult: Contacts deleted, and the IDs not found.
+        """
+        ids = list(dict.fromkeys(ids))
+        contacts = await self.contact_repository.remove_contacts(ids, user)
+        return batch_result(ids, contacts)
+
+    async def get_birthday_list(self, user: User, days: int = 7):
         """Get list of contacts with upcoming birthdays.
 
-        Retrieves contacts whose birthdays are within the configured
-        notification period (typically next 7 days).
+        Retrieves contacts whose birthdays fall between today and the end of
+        the notification window (the next 7 days by default).
 
         Args:
             user (User): User whose contacts to check.
+            days (int, optional): Length of the window after today. Defaults to 7.
 
         Returns:
             List[Contact]: List of contacts with upcoming birthdays.
         """
-        return await self.contact_repository.get_birthday_list(user)
+        return await self.contact_repository.get_birthday_list(user, days)
+
+    async def export_contacts(self, user: User, fmt: str) -> AsyncIterator[bytes]:
+        """Stream all of a user's contacts as NDJSON or CSV.
+
+        Contacts are read ``CONTACT_EXPORT_BATCH_SIZE`` rows at a time and
+        each batch is serialized once and yielded as one chunk, so memory
+        use does not grow with the number of contacts.
+
+        Args:
+            user (User): User whose contacts to export.
+            fmt (str): ``"ndjson"`` or ``"csv"``. CSV starts with a header.
+
+        Yields:
+            bytes: The next chunk of the export.
+        """
+        if fmt == "csv":
+            dump = dump_csv_rows
+            yield dump_csv_rows([EXPORT_COLUMNS])
+        else:
+            dump = dump_ndjson_rows
+        async for rows in self.contact_repository.stream_contacts(
+            user, settings.CONTACT_EXPORT_BATCH_SIZE
+        ):
+            yield dump(rows)
+
+    async def import_contacts(
+        self, user: User, chunks: AsyncIterable[bytes], fmt: str
+    ) -> ContactImportReport:
+        """Create contacts from an NDJSON or CSV upload.
+
+        The upload is parsed as it arrives. Every ``CONTACT_IMPORT_BATCH_SIZE``
+        records are validated against :class:`ContactImportModel` together
+        and inserted with one statement; rows whose email or phone already
+        exists are skipped, not failed. Each batch is committed on its own.
+        If the database rejects a batch, its rows are retried one by one
+        and those it still rejects are reported as invalid.
+
+        Args:
+            user (User): User who will own the contacts.
+            chunks (AsyncIterable[bytes]): Chunks of the upload.
+            fmt (str): ``"ndjson"`` or ``"csv"``.
+
+        Returns:
+            ContactImportReport: Counts, and an error for every row not
+                imported, ordered by line.
+        """
+        report = ContactImportReport()
+        batch = []
+        async for line, record, error in iter_records(chunks, fmt):
+            if error is not None:
+                report.invalid += 1
+                report.errors.append(ContactImportError(line=line, errors=[error]))
+                continue
+            batch.append((line, record))
+            if len(batch) >= settings.CONTACT_IMPORT_BATCH_SIZE:
+                await self._import_batch(user, batch, report)
+                batch = []
+        await self._import_batch(user, batch, report)
+        report.errors.sort(key=lambda error: error.line)
+        return report
+
+    async def _import_batch(
+        self, user: User, batch: list[tuple[int, object]], report: ContactImportReport
+    ) -> None:
+        lines = [line for line, _ in batch]
+        records = [record for _, record in batch]
+        try:
+            contacts = contact_batch_adapter.validate_python(records)
+        except ValidationError as e:
+            problems = defaultdict(list)
+            for error in e.errors():
+                index, *loc = error["loc"]
+                field = ".".join(str(part) for part in loc)
+                problems[index].append(
+                    f"{field}: {error['msg']}" if field else error["msg"]
+                )
+            for index, errors in problems.items():
+                report.invalid += 1
+                report.errors.append(ContactImportError(line=lines[index], errors=errors))
+            lines = [line for i, line in enumerate(lines) if i not in problems]
+            contacts = contact_batch_adapter.validate_python(
+                [record for i, record in enumerate(records) if i not in problems]
+            )
+
+        rows, emails, phones = [], set(), set()
+        for line, contact in zip(lines, contacts):
+            if contact.email in emails or contact.phone in phones:
+                report.duplicates += 1
+                report.errors.append(
+                    ContactImportError(line=line, errors=[DUPLICATE_CONTACT])
+                )
+                continue
+            emails.add(contact.email)
+            phones.add(contact.phone)
+            rows.append((line, contact.model_dump()))
+
+        try:
+            inserted = await self.contact_repository.insert_contacts(
+                [row for _, row in rows], user
+            )
+        except DBAPIError:
+            metrics.inc("contact_import_batch_failures")
+            inserted, saved = set(), []
+            for line, row in rows:
+                try:
+                    inserted |= await self.contact_repository.insert_contacts(
+                        [row], user
+                    )
+                except DBAPIError:
+                    report.invalid += 1
+                    report.errors.append(
+                        ContactImportError(line=line, errors=[UNSAVED_CONTACT])
+                    )
+                    continue
+                saved.append((line, row))
+            rows = saved
+        for line, row in rows:
+            if row["email"] in inserted:
+                report.imported += 1
+            else:
+                report.duplicates += 1
+                report.errors.append(
+                    ContactImportError(line=line, errors=[DUPLICATE_CONTACT])
+                )
+
+    async def _cached_json(self, user: User, name: str, build, ttl: int | None = None):
+        """Return a cached response, building and caching it on a miss.
+
+        A hit is returned as stored, without touching the database or
+        re-validating contacts. Without Redis the response is built on
+        every call. A response built on a read replica is cached only if
+        the user's contacts version did not move during the build and the
+        user is past the read-your-writes window, see :meth:`_replica_is_current`.
+
+        Args:
+            user (User): Owner of the contacts in the response.
+            name (str): Entry name in the contact cache.
+            build (Callable[[], Awaitable[bytes]]): Builds the response.
+            ttl (int | None): Lifetime of the entry in seconds.
+
+        Returns:
+            bytes: The serialized response.
+        """
+        try:
+            version, payload = await redis_breaker.call(contact_cache.get, user.id, name)
+        except (RedisError, OSError):
+            metrics.inc("contact_cache_fallbacks")
+            version, payload = None, None
+        if payload is not None:
+            return payload
+
+        payload = await build()
+        if version is not None and await self._replica_is_current(user, version):
+            try:
+                await redis_breaker.call(
+                    contact_cache.set, user.id, version, name, payload, ttl
+                )
+            except (RedisError, OSError):
+                metrics.inc("contact_cache_fallbacks")
+        return payload
+
+    async def _replica_is_current(self, user: User, version: int) -> bool:
+        """Check whether a response built on this session may be cached.
+
+        Responses built on the primary always may. A replica may lag
+        behind a write that has already bumped the version, so its
+        response is cached only if the version is still the one read
+        before the build and the user has not written within
+        ``DB_READ_STICKINESS_SECONDS``, the lag replicas are allowed.
+
+        Args:
+            user (User): Owner of the contacts in the response.
+            version (int): Contacts version read before the build.
+
+        Returns:
+            bool: True if the response can be cached under ``version``.
+        """
+        if not self.contact_repository.db.info.get("replica"):
+            return True
+        try:
+            current = await redis_breaker.call(contact_cache.version, user.id)
+        except (RedisError, OSError):
+            metrics.inc("contact_cache_fallbacks")
+            return False
+        return current == version and not await is_recent_writer(user.username)
+
+    async def get_birthday_list_json(self, user: User, days: int = 7) -> bytes:
+        """Get the serialized birthdays response through the contact cache.
+
+        Entries live at most ``CONTACT_CACHE_TTL_SECONDS``, and never past
+        midnight, when the window moves.
+
+        Args:
+            user (User): User whose contacts to check.
+            days (int, optional): Length of the window after today. Defaults to 7.
+
+        Returns:
+            bytes: JSON array of :class:`ContactResponse` objects.
+        """
+        today = date.today()
+
+        async def build() -> bytes:
+            return dump_contacts(await self.get_birthday_list(user, days))
+
+        return await self._cached_json(
+            user,
+            contact_cache.birthdays_name(today, days),
+            build,
+            seconds_until_end_of(today),
+        )
+
+    async def get_contacts_page_json(
+        self,
+        skip: int,
+        limit: int,
+        user: User,
+        q: str | None = None,
+        after: int | None = None,
+    ) -> tuple[bytes, str | None]:
+        """Get a serialized page of contacts and the cursor of the next page.
+
+        Pages are cached per user and normalized parameters for
+        ``CONTACT_LIST_CACHE_TTL_SECONDS``, and dropped by any change to
+        the user's contacts.
+
+        Args:
+            skip (int): Number of contacts to skip for pagination.
+            limit (int): Maximum number of contacts to return.
+            user (User): User whose contacts to retrieve.
+            q (str | None, optional): Search query string. Defaults to None.
+            after (int | None, optional): ID of the last contact of the
+                previous page. Defaults to None.
+
+        Returns:
+            tuple[bytes, str | None]: JSON array of :class:`ContactResponse`
+                objects, and the next cursor if the page is full.
+        """
+        q = q or None
+        if after is not None:
+            skip = 0
+
+        async def build() -> bytes:
+            contacts = await self.get_contacts(skip, limit, user, q=q, after=after)
+            cursor = ""
+            if contacts and len(contacts) == limit:
+                cursor = encode_cursor(contacts[-1].id)
+            # The cursor never contains a newline, so it can prefix the body.
+            return cursor.encode() + b"\n" + dump_contacts(contacts)
+
+        cached = await self._cached_json(
+            user,
+            contact_cache.page_name(limit, skip, after, q),
+            build,
+            settings.CONTACT_LIST_CACHE_TTL_SECONDS,
+        )
+        cursor, _, payload = cached.partition(b"\n")
+        return payload, cursor.decode() or None
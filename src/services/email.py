@@ -1,25 +1,85 @@
+import functools
 from pathlib import Path
 
 from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
 from fastapi_mail.errors import ConnectionErrors
+from jinja2 import Environment, FileSystemLoader
 from pydantic import EmailStr
 
 from src.services.auth import create_email_token
 from src.conf.config import settings
 
-conf = ConnectionConfig(
-    MAIL_USERNAME=settings.MAIL_USERNAME,
-    MAIL_PASSWORD=settings.MAIL_PASSWORD,
-    MAIL_FROM=settings.MAIL_FROM,
-    MAIL_PORT=settings.MAIL_PORT,
-    MAIL_SERVER=settings.MAIL_SERVER,
-    MAIL_FROM_NAME=settings.MAIL_FROM_NAME,
-    MAIL_STARTTLS=settings.MAIL_STARTTLS,
-    MAIL_SSL_TLS=settings.MAIL_SSL_TLS,
-    USE_CREDENTIALS=settings.USE_CREDENTIALS,
-    VALIDATE_CERTS=settings.VALIDATE_CERTS,
-    TEMPLATE_FOLDER=Path(__file__).parent / "templates",
-)
+TEMPLATE_FOLDER = Path(__file__).parent / "templates"
+
+
+@functools.lru_cache(maxsize=None)
+def _template_environment(folder: Path) -> Environment:
+    return Environment(loader=FileSystemLoader(folder))
+
+
+class MailConfig(ConnectionConfig):
+    """Mail connection settings that share one template environment.
+
+    ``ConnectionConfig`` builds a new Jinja environment for every message,
+    which re-reads and recompiles the template each time. This subclass
+    reuses a single environment, so compiled templates are cached.
+    """
+
+    def template_engine(self) -> Environment:
+        return _template_environment(self.TEMPLATE_FOLDER)
+
+
+class Mailer:
+    """Lazily created mail client shared by every outgoing message.
+
+    Attributes:
+        templates (tuple[str, ...]): Templates compiled by :meth:`warm_up`.
+    """
+
+    templates = ("verify_email.html", "reset_password.html")
+
+    def __init__(self):
+        """Initialize without building the client."""
+        self._client: FastMail | None = None
+
+    @property
+    def client(self) -> FastMail:
+        """Return the mail client, building it from settings on first use.
+
+        Returns:
+            FastMail: The shared mail client.
+        """
+        if self._client is None:
+            config = MailConfig(
+                MAIL_USERNAME=settings.MAIL_USERNAME,
+                MAIL_PASSWORD=settings.MAIL_PASSWORD,
+                MAIL_FROM=settings.MAIL_FROM,
+                MAIL_PORT=settings.MAIL_PORT,
+                MAIL_SERVER=settings.MAIL_SERVER,
+                MAIL_FROM_NAME=settings.MAIL_FROM_NAME,
+                MAIL_STARTTLS=settings.MAIL_STARTTLS,
+                MAIL_SSL_TLS=settings.MAIL_SSL_TLS,
+                USE_CREDENTIALS=settings.USE_CREDENTIALS,
+                VALIDATE_CERTS=settings.VALIDATE_CERTS,
+                TEMPLATE_FOLDER=TEMPLATE_FOLDER,
+            )
+            self._client = FastMail(config)
+        return self._client
+
+    def warm_up(self) -> None:
+        """Build the client and compile every email template."""
+        environment = self.client.config.template_engine()
+        for template in self.templates:
+            environment.get_template(template)
+
+    def close(self) -> None:
+        """Drop the client and its compiled templates."""
+        self._client = None
+        _template_environment.cache_clear()
+
+
+# Global mail client instance
+mailer = Mailer()
 
 
 async def send_email(email: EmailStr, username: str, host: str):
@@ -56,8 +116,7 @@ async def send_email(email: EmailStr, username: str, host: str):
             subtype=MessageType.html,
         )
 
-        fm = FastMail(conf)
-        await fm.send_message(message, template_name="verify_email.html")
+        await mailer.client.send_message(message, template_name="verify_email.html")
     except ConnectionErrors as err:
         print(err)  # Consider using proper logging here
 
@@ -83,7 +142,6 @@ async def send_password_reset_email(email: EmailStr, username: str, host: str, t
             subtype=MessageType.html,
         )
 
-        fm = FastMail(conf)
-        await fm.send_message(message, template_name="reset_password.html")
+        await mailer.client.send_message(message, template_name="reset_password.html")
     except ConnectionErrors as err:
         print(err)
@@ -0,0 +1,81 @@
+"""HTTP entity tags for conditional requests.
+
+Helpers to build strong ETags and to evaluate ``If-None-Match`` and
+``If-Match`` request headers (RFC 9110, section 13.1).
+"""
+
+import hashlib
+
+
+def make_etag(*parts) -> str:
+    """Build a strong ETag from the values that identify a representation.
+
+    Args:
+        *parts: Values whose string forms together determine the response.
+
+    Returns:
+        str: Quoted entity tag.
+    """
+    digest = hashlib.blake2b(
+        "\x1f".join(str(part) for part in parts).encode(), digest_size=16
+    )
+    return f'"{digest.hexdigest()}"'
+
+
+def content_etag(payload: bytes) -> str:
+    """Build a strong ETag from a serialized response body.
+
+    Args:
+        payload (bytes): Response body.
+
+    Returns:
+        str: Quoted entity tag.
+    """
+    return f'"{hashlib.blake2b(payload, digest_size=16).hexdigest()}"'
+
+
+def parse_etags(header: str) -> list[str]:
+    """Split an ``If-Match``/``If-None-Match`` header into its entity tags.
+
+    Args:
+        header (str): Header value, e.g. ``"a", W/"b"`` or ``*``.
+
+    Returns:
+        list[str]: Tags as sent, including any ``W/`` prefix.
+    """
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
+
+
+def none_match(header: str | None, etag: str) -> bool:
+    """Evaluate ``If-None-Match``: True if the client's copy is current.
+
+    Uses the weak comparison the header calls for, so ``W/"x"`` matches
+    ``"x"``.
+
+    Args:
+        header (str | None): ``If-None-Match`` header value.
+        etag (str): Current entity tag of the resource.
+
+    Returns:
+        bool: True if a 304 Not Modified should be sent.
+    """
+    if not header:
+        return False
+    tags = parse_etags(header)
+    return "*" in tags or etag.removeprefix("W/") in (
+        tag.removeprefix("W/") for tag in tags
+    )
+
+
+def strong_tags(header: str) -> list[str]:
+    """Return the strong tags of an ``If-Match`` header.
+
+    Weak tags never match under the strong comparison ``If-Match`` uses.
+
+    Args:
+        header (str): ``If-Match`` header value other than ``*``.
+
+    Returns:
+        list[str]: Strong entity tags.
+    """
+    return [tag for tag in parse_etags(header) if not tag.startswith("W/")]
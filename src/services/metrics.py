@@ -0,0 +1,123 @@
+"""In-process application metrics.
+
+This module provides a small registry of counters, gauges and timings that
+services update on their hot paths. The registry is exposed as JSON through
+the /api/metrics endpoint.
+"""
+
+from collections import defaultdict
+from typing import Any, Callable
+
+
+class MetricsRegistry:
+    """Registry of named counters, gauges, timings and derived collectors.
+
+    Attributes:
+        _counters (dict): Monotonic counters keyed by metric name.
+        _gauges (dict): Point-in-time values keyed by metric name.
+        _timings (dict): Count, total and max of observed durations in seconds.
+        _collectors (dict): Callables evaluated when a snapshot is taken.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._counters: dict[str, float] = defaultdict(float)
+        self._gauges: dict[str, float] = {}
+        self._timings: dict[str, dict[str, float]] = {}
+        self._collectors: dict[str, Callable[[], Any]] = {}
+
+    def inc(self, name: str, value: float = 1) -> None:
+        """Increment a counter.
+
+        Args:
+            name (str): Counter name.
+            value (float): Amount to add. Defaults to 1.
+        """
+        self._counters[name] += value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """Set a gauge to its current value.
+
+        Args:
+            name (str): Gauge name.
+            value (float): Current value.
+        """
+        self._gauges[name] = value
+
+    def observe(self, name: str, seconds: float) -> None:
+        """Record a duration.
+
+        Args:
+            name (str): Timing name.
+            seconds (float): Observed duration in seconds.
+        """
+        timing = self._timings.setdefault(name, {"count": 0, "total": 0.0, "max": 0.0})
+        timing["count"] += 1
+        timing["total"] += seconds
+        timing["max"] = max(timing["max"], seconds)
+
+    def register_collector(self, name: str, collector: Callable[[], Any]) -> None:
+        """Register a callable whose result is included in every snapshot.
+
+        Args:
+            name (str): Name under which the collected value is reported.
+            collector (Callable[[], Any]): Function returning the current value.
+        """
+        self._collectors[name] = collector
+
+    def get(self, name: str) -> float:
+        """Return the current value of a counter or gauge.
+
+        Args:
+            name (str): Metric name.
+
+        Returns:
+            float: Current value, 0 if the metric was never recorded.
+        """
+        if name in self._gauges:
+            return self._gauges[name]
+        return self._counters.get(name, 0)
+
+    def ratio(self, numerator: str, denominator: str) -> float:
+        """Return numerator / (numerator + denominator) for two counters.
+
+        Args:
+            numerator (str): Counter counted as success, e.g. cache hits.
+            denominator (str): Counter counted as failure, e.g. cache misses.
+
+        Returns:
+            float: The ratio, 0.0 if neither counter was incremented.
+        """
+        hits = self.get(numerator)
+        total = hits + self.get(denominator)
+        return hits / total if total else 0.0
+
+    def snapshot(self) -> dict:
+        """Return the current state of every metric.
+
+        Returns:
+            dict: Counters, gauges, timings and collected values.
+        """
+        timings = {
+            name: {
+                **timing,
+                "avg": timing["total"] / timing["count"] if timing["count"] else 0.0,
+            }
+            for name, timing in self._timings.items()
+        }
+        return {
+            "counters": dict(self._counters),
+            "gauges": dict(self._gauges),
+            "timings": timings,
+            "collected": {name: fn() for name, fn in self._collectors.items()},
+        }
+
+    def reset(self) -> None:
+        """Clear counters, gauges and timings. Collectors stay registered."""
+        self._counters.clear()
+        self._gauges.clear()
+        self._timings.clear()
+
+
+# Global metrics registry instance
+metrics = MetricsRegistry()
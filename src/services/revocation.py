@@ -0,0 +1,220 @@
+"""Access-token revocation list.
+
+Revoked token IDs (``jti``) are stored in Redis under ``revoked:{jti}`` until
+the token would have expired anyway, and appended to a Redis stream. Each
+worker mirrors the stream into a local Bloom filter, pulling only entries
+after the last ID it has seen, so checking a token that was never revoked -
+the common case - costs no network call. A filter hit is confirmed against
+Redis before the token is rejected.
+
+Stream IDs are assigned by Redis and strictly increase, so the cursor never
+skips an entry whatever the clocks of the workers that appended them.
+Entries are kept for ``retention`` seconds, the longest lifetime of an
+access token, and older ones are trimmed both on revocation and whenever a
+worker rebuilds its filter.
+"""
+
+import hashlib
+import math
+import time
+
+from src.conf.config import settings
+from src.database.redis import redis_manager
+from src.services.metrics import metrics
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over string keys.
+
+    Attributes:
+        size (int): Number of bits in the filter.
+        hashes (int): Number of bit positions set per key.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        """Size the filter for a capacity and false-positive rate.
+
+        Args:
+            capacity (int): Expected number of keys.
+            error_rate (float): Target false-positive probability.
+        """
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, key: str) -> None:
+        """Add a key to the filter.
+
+        Args:
+            key (str): Key to add.
+        """
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+
+class RevocationList:
+    """Redis-backed list of revoked token IDs with a local Bloom filter.
+
+    Attributes:
+        sync_interval (float): Seconds between incremental syncs of the filter.
+        retention (int): Seconds a log entry is kept, the longest token lifetime.
+        capacity (int): Expected number of live revocations, sizes the filter.
+        error_rate (float): Target false-positive rate of the filter.
+    """
+
+    log_key = "revocation_log"
+
+    def __init__(
+        self, sync_interval: float, retention: int, capacity: int, error_rate: float
+    ):
+        """Initialize an empty revocation list.
+
+        Args:
+            sync_interval (float): Seconds between incremental syncs of the filter.
+            retention (int): Seconds a log entry is kept, the longest token lifetime.
+            capacity (int): Expected number of live revocations, sizes the filter.
+            error_rate (float): Target false-positive rate of the filter.
+        """
+        self.sync_interval = sync_interval
+        self.retention = retention
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._reset()
+
+    def _reset(self) -> None:
+        self._filter = BloomFilter(self.capacity, self.error_rate)
+        self._built_at = time.time()
+        self._synced_at = 0.0
+        self._cursor: str | None = None
+
+    def _horizon(self, now: float) -> int:
+        # Stream IDs start with the Redis time in milliseconds.
+        return int((now - self.retention) * 1000)
+
+    @staticmethod
+    def key(jti: str) -> str:
+        """Return the Redis key marking a token ID as revoked.
+
+        Args:
+            jti (str): Token ID.
+
+        Returns:
+            str: Redis key.
+        """
+        return f"revoked:{jti}"
+
+    async def revoke(self, jti: str, expires_at: float) -> None:
+        """Revoke a token until it expires.
+
+        Args:
+            jti (str): Token ID.
+            expires_at (float): Token expiry as a Unix timestamp.
+        """
+        now = time.time()
+        ttl = int(math.ceil(expires_at - now))
+        if ttl <= 0:
+            return
+        async with redis_manager.client.pipeline(transaction=True) as pipe:
+            pipe.set(self.key(jti), 1, ex=ttl)
+            pipe.xadd(
+                self.log_key,
+                {"jti": jti},
+                minid=self._horizon(now),
+                approximate=True,
+            )
+            await pipe.execute()
+        self._filter.add(jti)
+        metrics.inc("tokens_revoked")
+
+    @property
+    def sync_due(self) -> bool:
+        """Whether the next :meth:`sync` would query Redis."""
+        return time.time() - self._synced_at >= self.sync_interval
+
+    async def sync(self) -> None:
+        """Pull revocations newer than the last sync into the local filter.
+
+        Runs at most once per ``sync_interval``. The filter is rebuilt from
+        the log once per ``retention`` so expired entries drop out of it; a
+        rebuild trims the log and reads only entries within ``retention``.
+        """
+        if not self.sync_due:
+            return
+        now = time.time()
+        if now - self._built_at > self.retention:
+            self._reset()
+        self._synced_at = now
+
+        if self._cursor is None:
+            horizon = self._horizon(now)
+            await redis_manager.client.xtrim(
+                self.log_key, minid=horizon, approximate=True
+            )
+            start = f"{horizon}-0"
+        else:
+            start = f"({self._cursor}"
+        entries = await redis_manager.client.xrange(self.log_key, min=start)
+        for entry_id, fields in entries:
+            self._filter.add(fields[b"jti"].decode("utf-8"))
+            self._cursor = entry_id.decode("utf-8")
+        metrics.set_gauge("revocation_filter_entries", self._filter.count)
+
+    def might_be_revoked(self, jti: str) -> bool:
+        """Check the local filter only.
+
+        Args:
+            jti (str): Token ID.
+
+        Returns:
+            bool: False if the token is certainly not revoked, True if it may be.
+        """
+        if jti not in self._filter:
+            return False
+        metrics.inc("revocation_filter_positives")
+        return True
+
+    async def confirm(self, jti: str) -> bool:
+        """Check Redis for a token ID that the local filter reported.
+
+        Args:
+            jti (str): Token ID.
+
+        Returns:
+            bool: True if the token was revoked.
+        """
+        return bool(await redis_manager.client.exists(self.key(jti)))
+
+    async def is_revoked(self, jti: str) -> bool:
+        """Check whether a token ID has been revoked.
+
+        Args:
+            jti (str): Token ID.
+
+        Returns:
+            bool: True if the token was revoked.
+        """
+        await self.sync()
+        return self.might_be_revoked(jti) and await self.confirm(jti)
+
+
+# Global revocation list instance
+revocation_list = RevocationList(
+    sync_interval=settings.REVOCATION_SYNC_INTERVAL_SECONDS,
+    retention=settings.JWT_EXPIRATION_SECONDS,
+    capacity=settings.REVOCATION_FILTER_CAPACITY,
+    error_rate=settings.REVOCATION_FILTER_ERROR_RATE,
+)
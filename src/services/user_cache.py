@@ -0,0 +1,324 @@
+"""Cache of authenticated principals.
+
+This module caches a serialized :class:`~src.schemas.UserPrincipal` in two
+tiers so that authenticated requests can be served without a database
+round-trip:
+
+- L1: a bounded per-worker :class:`~src.services.cache.TTLCache`.
+- L2: Redis, under ``user:{username}``.
+
+Writes to a user must call :meth:`UserCache.invalidate`. It deletes the Redis
+entry and publishes the username on a pub/sub channel, so every worker drops
+its L1 copy as soon as the message arrives.
+
+The cache also tracks a per-user token version (``token_version:{username}``)
+that is embedded in access tokens. Bumping it with
+:meth:`UserCache.bump_token_version` revokes every token issued before,
+for example after a password or role change.
+
+Repository writes go through :meth:`UserCache.invalidate_after_write`, which
+calls Redis through the circuit breaker. When Redis is unreachable the change
+is queued in the worker and replayed by the invalidation listener as soon as
+it reconnects, so a committed write never fails on its cache side effects.
+"""
+
+import asyncio
+import logging
+
+from pydantic import ValidationError
+from redis.exceptions import RedisError
+
+from src.conf.config import settings
+from src.database.redis import redis_manager
+from src.schemas import UserPrincipal
+from src.services.cache import TTLCache
+from src.services.circuit_breaker import redis_breaker
+from src.services.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class UserCache:
+    """Two-tier (in-process + Redis) cache of :class:`UserPrincipal` objects.
+
+    Attributes:
+        ttl (int): Lifetime of a Redis entry in seconds.
+        channel (str): Pub/sub channel used to broadcast invalidations.
+        local (TTLCache): Per-worker L1 cache of principals.
+        versions (TTLCache): Per-worker L1 cache of token versions.
+    """
+
+    def __init__(
+        self, ttl: int, channel: str, local: TTLCache, versions: TTLCache | None = None
+    ):
+        """Initialize the cache.
+
+        Args:
+            ttl (int): Lifetime of a Redis entry in seconds.
+            channel (str): Pub/sub channel used to broadcast invalidations.
+            local (TTLCache): Per-worker L1 cache of principals.
+            versions (TTLCache | None): Per-worker L1 cache of token versions.
+                Defaults to a cache with the same size and TTL as ``local``.
+        """
+        self.ttl = ttl
+        self.channel = channel
+        self.local = local
+        self.versions = versions or TTLCache(
+            f"{local.name}_versions", maxsize=local.maxsize, ttl=local.ttl
+        )
+        self._listener: asyncio.Task | None = None
+        # Usernames whose invalidation failed, mapped to whether their token
+        # version must be bumped as well.
+        self._pending: dict[str, bool] = {}
+
+    @staticmethod
+    def key(username: str) -> str:
+        """Return the Redis key for a username.
+
+        Args:
+            username (str): Username of the cached user.
+
+        Returns:
+            str: Redis key.
+        """
+        return f"user:{username}"
+
+    @staticmethod
+    def version_key(username: str) -> str:
+        """Return the Redis key holding a user's token version.
+
+        Args:
+            username (str): Username of the token owner.
+
+        Returns:
+            str: Redis key.
+        """
+        return f"token_version:{username}"
+
+    async def get(self, username: str) -> UserPrincipal | None:
+        """Return the cached principal for a username.
+
+        The L1 cache is checked first; Redis is only queried on an L1 miss.
+
+        Args:
+            username (str): Username to look up.
+
+        Returns:
+            UserPrincipal | None: Cached principal, or None on a cache miss.
+        """
+        principal = self.local.get(username)
+        if principal is not None:
+            metrics.inc("user_cache_hits")
+            return principal
+        return await self.load(username)
+
+    async def load(self, username: str) -> UserPrincipal | None:
+        """Read a principal from Redis and keep it in the L1 cache.
+
+        Redis entries that no longer match the principal schema are treated as
+        misses, so a deploy that changes the payload never serves stale shapes.
+
+        Args:
+            username (str): Username to look up.
+
+        Returns:
+            UserPrincipal | None: Cached principal, or None on a cache miss.
+        """
+        payload = await redis_manager.client.get(self.key(username))
+        if payload is not None:
+            try:
+                principal = UserPrincipal.model_validate_json(payload)
+            except ValidationError:
+                principal = None
+            if principal is not None:
+                metrics.inc("user_cache_hits")
+                self.local.set(username, principal)
+                return principal
+        metrics.inc("user_cache_misses")
+        return None
+
+    async def set(self, user, ttl: float | None = None) -> UserPrincipal:
+        """Cache a user in both tiers and return its detached principal.
+
+        Args:
+            user (User): ORM user instance or any object with principal attributes.
+            ttl (float | None): Lifetime of the Redis entry in seconds.
+                Defaults to the cache TTL.
+
+        Returns:
+            UserPrincipal: The principal that was cached.
+        """
+        principal = UserPrincipal.model_validate(user)
+        ex = self.ttl if ttl is None else max(1, int(ttl))
+        await redis_manager.client.set(
+            self.key(principal.username), principal.model_dump_json(), ex=ex
+        )
+        self.local.set(principal.username, principal)
+        return principal
+
+    async def invalidate(self, username: str) -> None:
+        """Drop the cached entry for a username in every worker.
+
+        Args:
+            username (str): Username whose entry must be dropped.
+        """
+        self.local.pop(username)
+        self.versions.pop(username)
+        await redis_manager.client.delete(self.key(username))
+        await redis_manager.client.publish(self.channel, username)
+        metrics.inc("user_cache_invalidations")
+
+    async def token_version(self, username: str) -> int:
+        """Return the current token version of a user.
+
+        Args:
+            username (str): Username of the token owner.
+
+        Returns:
+            int: Current version, 0 if tokens were never revoked.
+        """
+        version = self.versions.get(username)
+        if version is None:
+            version = await self.load_token_version(username)
+        return version
+
+    async def load_token_version(self, username: str) -> int:
+        """Read a user's token version from Redis and keep it in the L1 cache.
+
+        Args:
+            username (str): Username of the token owner.
+
+        Returns:
+            int: Current version, 0 if tokens were never revoked.
+        """
+        version = int(await redis_manager.client.get(self.version_key(username)) or 0)
+        self.versions.set(username, version)
+        return version
+
+    async def bump_token_version(self, username: str) -> int:
+        """Revoke every access token issued to a user so far.
+
+        Args:
+            username (str): Username of the token owner.
+
+        Returns:
+            int: The new token version.
+        """
+        version = await redis_manager.client.incr(self.version_key(username))
+        await self.invalidate(username)
+        return version
+
+    async def invalidate_after_write(
+        self, username: str, revoke_tokens: bool = False
+    ) -> bool:
+        """Drop a user's cached entry after a committed database write.
+
+        Redis is called through the circuit breaker. If it fails, the local
+        copies are still dropped and the invalidation is queued; the listener
+        replays it once Redis is reachable again.
+
+        Args:
+            username (str): Username whose entry must be dropped.
+            revoke_tokens (bool): Also bump the user's token version.
+
+        Returns:
+            bool: True if Redis was updated, False if the change was queued.
+        """
+        try:
+            if revoke_tokens:
+                await redis_breaker.call(self.bump_token_version, username)
+            else:
+                await redis_breaker.call(self.invalidate, username)
+            return True
+        except (RedisError, OSError):
+            self.local.pop(username)
+            self.versions.pop(username)
+            revoke_tokens = self._pending.get(username, False) or revoke_tokens
+            self._pending[username] = revoke_tokens
+            metrics.inc("user_cache_invalidation_failures")
+            logger.warning(
+                "Queued cache invalidation for user %s", username, exc_info=True
+            )
+            return False
+
+    async def retry_pending(self) -> None:
+        """Replay invalidations queued by :meth:`invalidate_after_write`.
+
+        Raises:
+            RedisError: If Redis is still unreachable; the rest stays queued.
+        """
+        for username, revoke_tokens in list(self._pending.items()):
+            if revoke_tokens:
+                await self.bump_token_version(username)
+            else:
+                await self.invalidate(username)
+            if self._pending.get(username) == revoke_tokens:
+                del self._pending[username]
+            metrics.inc("user_cache_invalidation_retries")
+
+    async def listen(self) -> None:
+        """Drop L1 entries named on the invalidation channel until cancelled.
+
+        Invalidations queued while Redis was unreachable are replayed on
+        every pass. Connection errors are retried with a short back-off;
+        while the listener is disconnected, L1 entries still expire after
+        their TTL.
+        """
+        while True:
+            pubsub = redis_manager.client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self.channel)
+                while True:
+                    if self._pending:
+                        await self.retry_pending()
+                    message = await pubsub.get_message(timeout=0.5)
+                    if message is not None:
+                        username = message["data"].decode("utf-8")
+                        self.local.pop(username)
+                        self.versions.pop(username)
+                        metrics.inc("user_cache_remote_invalidations")
+            except (RedisError, OSError):
+                metrics.inc("user_cache_listener_errors")
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+    def start_listener(self) -> None:
+        """Start the invalidation listener on the running event loop."""
+        if self._listener is None:
+            self._listener = asyncio.create_task(self.listen())
+
+    async def stop_listener(self) -> None:
+        """Cancel the invalidation listener and wait for it to finish."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        self.local.clear()
+        self.versions.clear()
+
+
+# Global user cache instance
+user_cache = UserCache(
+    ttl=settings.USER_CACHE_TTL_SECONDS,
+    channel=settings.USER_CACHE_INVALIDATION_CHANNEL,
+    local=TTLCache(
+        "user_cache_l1",
+        maxsize=settings.USER_CACHE_L1_SIZE,
+        ttl=settings.USER_CACHE_L1_TTL_SECONDS,
+    ),
+)
+
+metrics.register_collector(
+    "user_cache_hit_ratio", lambda: metrics.ratio("user_cache_hits", "user_cache_misses")
+)
+metrics.register_collector(
+    "user_cache_pending_invalidations", lambda: len(user_cache._pending)
+)
+metrics.register_collector(
+    "user_cache_l1_hit_ratio",
+    lambda: metrics.ratio("user_cache_l1_hits", "user_cache_l1_misses"),
+)
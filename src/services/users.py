@@ -75,6 +75,18 @@ class UserService:
         """
         return await self.repository.get_user_by_email(email)
 
+    async def get_conflicting_user(self, email: str, username: str):
+        """Find a user that already holds the given email or username.
+
+        Args:
+            email (str): Email address to check.
+            username (str): Username to check.
+
+        Returns:
+            User | None: Conflicting user if any, None otherwise.
+        """
+        return await self.repository.get_conflicting_user(email, username)
+
     async def confirmed_email(self, email: str):
         """Mark a user's email as confirmed.
 
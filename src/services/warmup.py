@@ -0,0 +1,97 @@
+"""Start-up warm-up of shared clients.
+
+Run from the application lifespan so a cold worker serves its first
+requests at steady-state latency:
+
+- opens a minimum number of database connections on the primary and on
+  every read replica, and of Redis connections;
+- primes SQLAlchemy's compiled-statement cache by running the repository
+  read queries once, on every engine;
+- builds the mail client and compiles the email templates.
+
+Every step is best-effort and bounded by ``WARMUP_STEP_TIMEOUT_SECONDS``.
+A failing or unreachable dependency is reported through the
+``warmup_failures`` counter and the log, and start-up continues.
+"""
+
+import asyncio
+import logging
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.conf.config import settings
+from src.database.db import sessionmanager
+from src.database.models import User
+from src.database.redis import redis_manager
+from src.repository.contacts import ContactRepository
+from src.repository.users import UserRepository
+from src.services.email import mailer
+from src.services.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+async def prime_statement_cache(session: AsyncSession) -> None:
+    """Run every repository read query once on a session's engine.
+
+    The queries are issued for a user that does not exist, so they return
+    no rows; only their compiled form is kept in the engine's cache.
+
+    Args:
+        session (AsyncSession): Session bound to the engine to prime.
+    """
+    nobody = User(id=0, username="", email="")
+    contacts = ContactRepository(session)
+    await contacts.get_contacts(0, 10, nobody)
+    await contacts.get_contacts(0, 10, nobody, q="warmup")
+    await contacts.get_contacts(0, 10, nobody, after=0)
+    await contacts.get_contact_by_id(0, nobody)
+    await contacts.get_birthday_list(nobody)
+
+    users = UserRepository(session)
+    await users.get_user_by_id(0)
+    await users.get_user_by_username("")
+    await users.get_user_by_email("")
+    await users.get_conflicting_user("", "")
+
+
+async def _prime_all_engines() -> None:
+    async with sessionmanager.session() as session:
+        await prime_statement_cache(session)
+    for _ in range(sessionmanager.replica_count):
+        async with sessionmanager.read_session() as session:
+            await prime_statement_cache(session)
+
+
+async def _warm_mailer() -> None:
+    mailer.warm_up()
+
+
+async def warm_up() -> None:
+    """Warm every shared client, tolerating failures of individual steps.
+
+    Each step is cancelled after ``WARMUP_STEP_TIMEOUT_SECONDS``, so an
+    unreachable database or Redis cannot hold up start-up.
+    """
+    steps = {
+        "database": lambda: sessionmanager.warm_up(settings.DB_WARM_CONNECTIONS),
+        "statements": _prime_all_engines,
+        "redis": lambda: redis_manager.warm_up(settings.REDIS_WARM_CONNECTIONS),
+        "mail": _warm_mailer,
+    }
+    started = time.perf_counter()
+    for name, step in steps.items():
+        try:
+            await asyncio.wait_for(step(), settings.WARMUP_STEP_TIMEOUT_SECONDS)
+        except TimeoutError:
+            metrics.inc("warmup_failures")
+            logger.warning(
+                "Warm-up step %r timed out after %ss",
+                name,
+                settings.WARMUP_STEP_TIMEOUT_SECONDS,
+            )
+        except Exception:
+            metrics.inc("warmup_failures")
+            logger.warning("Warm-up step %r failed", name, exc_info=True)
+    metrics.observe("warmup", time.perf_counter() - started)
@@ -8,7 +8,7 @@ from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, Asyn
 
 from main import app
 from src.database.models import Base, User, UserRole
-from src.database.db import get_db
+from src.database.db import get_db, get_read_db, get_read_db_context
 from src.services.auth import create_access_token, Hash
 
 SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
@@ -87,8 +87,11 @@ def client():
                 raise
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_read_db_context] = lambda: TestingSessionLocal()
 
-    yield TestClient(app)
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest_asyncio.fixture()
@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from src.services.admission import AdmissionGate
+from src.services.metrics import metrics
+
+
+@pytest.mark.asyncio
+async def test_admit_runs_within_capacity():
+    gate = AdmissionGate("test_gate", max_concurrency=2, max_queue=0, queue_timeout=1)
+    async with gate.admit():
+        async with gate.admit():
+            assert metrics.get("test_gate_in_flight") == 2
+    assert metrics.get("test_gate_in_flight") == 0
+
+
+@pytest.mark.asyncio
+async def test_admit_rejects_when_queue_full():
+    gate = AdmissionGate(
+        "test_gate", max_concurrency=1, max_queue=0, queue_timeout=1, retry_after=3
+    )
+    async with gate.admit():
+        with pytest.raises(HTTPException) as exc:
+            async with gate.admit():
+                pass
+
+    assert exc.value.status_code == 503
+    assert exc.value.headers["Retry-After"] == "3"
+
+
+@pytest.mark.asyncio
+async def test_admit_rejects_after_queue_timeout():
+    gate = AdmissionGate("test_gate", max_concurrency=1, max_queue=1, queue_timeout=0.05)
+    release = asyncio.Event()
+
+    async def hold():
+        async with gate.admit():
+            await release.wait()
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    with pytest.raises(HTTPException) as exc:
+        async with gate.admit():
+            pass
+    release.set()
+    await holder
+
+    assert exc.value.status_code == 503
+    assert metrics.get("test_gate_queue_depth") == 0
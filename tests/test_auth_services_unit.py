@@ -1,7 +1,9 @@
 import pickle
+import time
 
 import pytest
-from jose import jwt
+from jose import JWTError, jwt
+from redis.exceptions import ConnectionError as RedisConnectionError
 from unittest.mock import AsyncMock, patch, MagicMock
 
 from fastapi import HTTPException, status
@@ -12,9 +14,27 @@ from src.services.auth import (
     get_email_from_token,
     create_email_token,
     get_current_admin_user,
+    Hash,
+    decode_access_token,
+    get_token_claims,
+    _guarded_read,
+    create_refresh_token,
+    refresh_access_token,
 )
 from src.database.models import User, UserRole
+from src.schemas import UserPrincipal
 from src.conf.config import settings
+from src.services.cache import TTLCache
+from src.services.circuit_breaker import CircuitBreaker, CircuitOpenError, redis_breaker
+from src.services.user_cache import user_cache
+
+
+@pytest.fixture(autouse=True)
+def revocations():
+    with patch("src.services.auth.revocation_list") as mock_revocations:
+        mock_revocations.sync_due = False
+        mock_revocations.might_be_revoked.return_value = False
+        yield mock_revocations
 
 
 @pytest.mark.asyncio
@@ -26,6 +46,18 @@ async def test_create_access_token():
     )
     assert decoded["sub"] == "test@example.com"
     assert "exp" in decoded
+    assert decoded["jti"]
+
+
+@pytest.mark.asyncio
+async def test_create_access_token_caps_lifetime():
+    token = await create_access_token(
+        {"sub": "test@example.com"}, expires_delta=settings.JWT_EXPIRATION_SECONDS * 10
+    )
+    decoded = jwt.decode(
+        token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
+    )
+    assert decoded["exp"] - time.time() <= settings.JWT_EXPIRATION_SECONDS
 
 
 @pytest.mark.asyncio
@@ -74,3 +106,183 @@ def test_create_email_token():
     assert decoded["sub"] == "test@example.com"
     assert "exp" in decoded
     assert "iat" in decoded
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_cache_hit_skips_db():
+    token = await create_access_token({"sub": "cached"})
+    principal = UserPrincipal(
+        id=1, username="cached", email="c@example.com", role=UserRole.USER, confirmed=True
+    )
+    with patch("src.services.auth.user_cache") as mock_cache, patch(
+        "src.services.auth.UserService"
+    ) as mock_service:
+        mock_cache.local.get.return_value = None
+        mock_cache.load = AsyncMock(return_value=principal)
+        result = await get_current_user(token=token, db=AsyncMock())
+
+    assert result is principal
+    mock_service.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_cache_miss_loads_and_caches():
+    token = await create_access_token({"sub": "fresh"})
+    user = User(id=2, username="fresh", role=UserRole.USER, confirmed=True)
+    principal = UserPrincipal(
+        id=2, username="fresh", email="f@example.com", role=UserRole.USER, confirmed=True
+    )
+    with patch("src.services.auth.user_cache") as mock_cache, patch(
+        "src.services.auth.UserService"
+    ) as mock_service:
+        mock_cache.local.get.return_value = None
+        mock_cache.load = AsyncMock(return_value=None)
+        mock_cache.set = AsyncMock(return_value=principal)
+        mock_service.return_value.get_user_by_username = AsyncMock(return_value=user)
+        result = await get_current_user(token=token, db=AsyncMock(info={}))
+
+    assert result is principal
+    mock_cache.set.assert_awaited_once_with(user, ttl=None)
+
+
+@pytest.mark.asyncio
+async def test_hash_async_roundtrip():
+    hashed = await Hash().get_password_hash_async("secret123")
+    assert await Hash().verify_password_async("secret123", hashed)
+    assert not await Hash().verify_password_async("wrong", hashed)
+    assert Hash().verify_password("secret123", hashed)
+
+
+@pytest.mark.asyncio
+async def test_decode_access_token_caches_verified_claims():
+    token = await create_access_token({"sub": "repeat"}, expires_delta=60)
+    with patch("src.services.auth.jwt.decode", wraps=jwt.decode) as mock_decode:
+        first = decode_access_token(token)
+        second = decode_access_token(token)
+
+    assert first["sub"] == second["sub"] == "repeat"
+    mock_decode.assert_called_once()
+
+
+def test_decode_access_token_rejects_expired():
+    token = jwt.encode(
+        {"sub": "late", "exp": 1}, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM
+    )
+    with pytest.raises(JWTError):
+        decode_access_token(token)
+
+
+@pytest.mark.asyncio
+async def test_get_token_claims_from_token_skips_lookup():
+    admin = User(id=7, username="boss", role=UserRole.ADMIN, confirmed=True)
+    with patch("src.services.auth.user_cache") as mock_cache, patch(
+        "src.services.auth.UserService"
+    ) as mock_service:
+        mock_cache.versions.get.return_value = None
+        mock_cache.load_token_version = AsyncMock(return_value=0)
+        token = await create_access_token({"sub": "boss"}, user=admin)
+        claims = await get_token_claims(token=token, db=AsyncMock())
+
+    assert claims.id == 7
+    assert claims.role == UserRole.ADMIN
+    assert get_current_admin_user(claims) is claims
+    mock_cache.load.assert_not_called()
+    mock_service.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_token_claims_rejects_revoked_version():
+    user = User(id=8, username="demoted", role=UserRole.ADMIN, confirmed=True)
+    with patch("src.services.auth.user_cache") as mock_cache:
+        mock_cache.versions.get.return_value = None
+        mock_cache.load_token_version = AsyncMock(return_value=0)
+        token = await create_access_token({"sub": "demoted"}, user=user)
+        mock_cache.load_token_version = AsyncMock(return_value=1)
+        with pytest.raises(HTTPException) as exc:
+            await get_token_claims(token=token, db=AsyncMock())
+
+    assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_rejects_revoked_jti(revocations):
+    token = await create_access_token({"sub": "gone"})
+    revocations.might_be_revoked.return_value = True
+    revocations.confirm = AsyncMock(return_value=True)
+    with patch("src.services.auth.user_cache") as mock_cache:
+        mock_cache.local.get.return_value = None
+        mock_cache.load = AsyncMock()
+        with pytest.raises(HTTPException) as exc:
+            await get_current_user(token=token, db=AsyncMock())
+
+    assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
+    revocations.confirm.assert_awaited_once_with(jwt.get_unverified_claims(token)["jti"])
+    mock_cache.load.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_from_replica_caches_briefly():
+    token = await create_access_token({"sub": "replicated"})
+    user = User(id=4, username="replicated", role=UserRole.USER, confirmed=True)
+    with patch("src.services.auth.user_cache") as mock_cache, patch(
+        "src.services.auth.UserService"
+    ) as mock_service:
+        mock_cache.local.get.return_value = None
+        mock_cache.load = AsyncMock(return_value=None)
+        mock_cache.set = AsyncMock()
+        mock_cache.local.ttl = 30.0
+        mock_service.return_value.get_user_by_username = AsyncMock(return_value=user)
+        await get_current_user(token=token, db=AsyncMock(info={"replica": True}))
+
+    mock_cache.set.assert_awaited_once_with(user, ttl=30.0)
+
+
+@pytest.mark.asyncio
+async def test_refresh_mints_access_token_from_script_result():
+    principal = UserPrincipal(
+        id=7, username="rotating", email="r@example.com", role=UserRole.USER, confirmed=True
+    )
+    refresh = await create_refresh_token("rotating", "fid", "jti")
+    redis_breaker.reset()
+    try:
+        with patch("src.services.auth.redis_manager") as mock_manager, patch(
+            "src.services.auth.get_principal", AsyncMock()
+        ) as mock_get_principal:
+            mock_manager.client = MagicMock(
+                evalsha=AsyncMock(return_value=[1, 3, principal.model_dump_json()])
+            )
+            tokens = await refresh_access_token(refresh, db=AsyncMock())
+    finally:
+        user_cache.local.pop("rotating")
+        user_cache.versions.pop("rotating")
+        redis_breaker.reset()
+
+    mock_manager.client.evalsha.assert_awaited_once()
+    mock_get_principal.assert_not_awaited()
+    claims = jwt.decode(
+        tokens["access_token"], settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
+    )
+    assert claims["uid"] == 7
+    assert claims["ver"] == 3
+
+
+
+@pytest.mark.asyncio
+async def test_guarded_read_sends_every_l1_miss_through_the_breaker():
+    local = TTLCache("test_guarded", 10, 60)
+    local.set("cached", 1)
+    local.set("expired", 1, ttl=0.001)
+    load = AsyncMock(return_value=2)
+    breaker = CircuitBreaker(
+        "test_guarded_breaker", failure_threshold=1, reset_timeout=60, call_timeout=1
+    )
+    with pytest.raises(RedisConnectionError):
+        await breaker.call(AsyncMock(side_effect=RedisConnectionError()))
+    time.sleep(0.002)
+
+    with patch("src.services.auth.redis_breaker", breaker):
+        assert await _guarded_read(local, "cached", load, "cached") == 1
+        with pytest.raises(CircuitOpenError):
+            await _guarded_read(local, "expired", load, "expired")
+
+    load.assert_not_awaited()
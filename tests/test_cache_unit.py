@@ -0,0 +1,110 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from redis.exceptions import ConnectionError
+
+from src.database.models import UserRole
+from src.schemas import UserPrincipal
+from src.services.cache import TTLCache
+from src.services.circuit_breaker import redis_breaker
+from src.services.metrics import metrics
+from src.services.user_cache import UserCache
+
+
+@pytest.fixture
+def principal():
+    return UserPrincipal(
+        id=1, username="cached", email="c@example.com", role=UserRole.USER, confirmed=True
+    )
+
+
+def test_ttl_cache_get_set():
+    cache = TTLCache("test_cache", maxsize=2, ttl=60)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.get("missing") is None
+
+
+def test_ttl_cache_expired_entry_is_a_miss(monkeypatch):
+    cache = TTLCache("test_cache", maxsize=2, ttl=10)
+    monkeypatch.setattr("src.services.cache.time.monotonic", lambda: 100.0)
+    cache.set("a", 1)
+    monkeypatch.setattr("src.services.cache.time.monotonic", lambda: 111.0)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    metrics.reset()
+    cache = TTLCache("test_cache", maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert metrics.get("test_cache_evictions") == 1
+    assert metrics.get("test_cache_hits") == 1
+
+
+@pytest.mark.asyncio
+async def test_user_cache_l1_hit_skips_redis(principal):
+    cache = UserCache(ttl=60, channel="test", local=TTLCache("test_l1", 10, 60))
+    cache.local.set("cached", principal)
+    with patch("src.services.user_cache.redis_manager") as mock_manager:
+        result = await cache.get("cached")
+
+    assert result is principal
+    mock_manager.client.get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_user_cache_invalidate_publishes(principal):
+    cache = UserCache(ttl=60, channel="test", local=TTLCache("test_l1", 10, 60))
+    cache.local.set("cached", principal)
+    with patch("src.services.user_cache.redis_manager") as mock_manager:
+        mock_manager.client = MagicMock(delete=AsyncMock(), publish=AsyncMock())
+        await cache.invalidate("cached")
+
+    assert "cached" not in cache.local
+    mock_manager.client.delete.assert_awaited_once_with("user:cached")
+    mock_manager.client.publish.assert_awaited_once_with("test", "cached")
+
+
+@pytest.mark.asyncio
+async def test_invalidate_after_write_queues_on_redis_failure(principal):
+    cache = UserCache(ttl=60, channel="test", local=TTLCache("test_l1", 10, 60))
+    cache.local.set("cached", principal)
+    cache.versions.set("cached", 1)
+    failures = metrics.get("user_cache_invalidation_failures")
+    redis_breaker.reset()
+    try:
+        with patch("src.services.user_cache.redis_manager") as mock_manager:
+            mock_manager.client = MagicMock(
+                incr=AsyncMock(side_effect=ConnectionError("down"))
+            )
+            applied = await cache.invalidate_after_write("cached", revoke_tokens=True)
+    finally:
+        redis_breaker.reset()
+
+    assert applied is False
+    assert "cached" not in cache.local
+    assert "cached" not in cache.versions
+    assert cache._pending == {"cached": True}
+    assert metrics.get("user_cache_invalidation_failures") == failures + 1
+
+
+@pytest.mark.asyncio
+async def test_retry_pending_replays_queued_invalidations():
+    cache = UserCache(ttl=60, channel="test", local=TTLCache("test_l1", 10, 60))
+    cache._pending = {"revoked": True, "edited": False}
+    with patch("src.services.user_cache.redis_manager") as mock_manager:
+        mock_manager.client = MagicMock(
+            incr=AsyncMock(return_value=2), delete=AsyncMock(), publish=AsyncMock()
+        )
+        await cache.retry_pending()
+
+    assert cache._pending == {}
+    mock_manager.client.incr.assert_awaited_once_with("token_version:revoked")
+    assert mock_manager.client.delete.await_count == 2
@@ -0,0 +1,127 @@
+import asyncio
+import time
+
+import pytest
+import pytest_asyncio
+from unittest.mock import AsyncMock, patch
+
+from fastapi import HTTPException, status
+from redis.exceptions import ConnectionError
+
+from src.database.models import User, UserRole
+from src.database.redis import RedisClientManager
+from src.services.auth import (
+    create_access_token,
+    create_refresh_token,
+    get_current_user,
+    refresh_access_token,
+)
+from src.services.circuit_breaker import CircuitBreaker, CircuitOpenError
+from src.services.metrics import metrics
+from src.services.revocation import RevocationList
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_after_threshold_and_rejects():
+    breaker = CircuitBreaker(
+        "test_breaker", failure_threshold=2, reset_timeout=60, call_timeout=1
+    )
+    failing = AsyncMock(side_effect=ConnectionError("down"))
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            await breaker.call(failing)
+    assert breaker.state == CircuitBreaker.OPEN
+    assert metrics.get("test_breaker_state") == 2
+
+    with pytest.raises(CircuitOpenError):
+        await breaker.call(failing)
+    assert failing.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_breaker_half_open_trial_closes_on_success(monkeypatch):
+    breaker = CircuitBreaker(
+        "test_breaker", failure_threshold=1, reset_timeout=5, call_timeout=1
+    )
+    monkeypatch.setattr("src.services.circuit_breaker.time.monotonic", lambda: 100.0)
+    with pytest.raises(ConnectionError):
+        await breaker.call(AsyncMock(side_effect=ConnectionError("down")))
+
+    monkeypatch.setattr("src.services.circuit_breaker.time.monotonic", lambda: 106.0)
+    assert await breaker.call(AsyncMock(return_value="pong")) == "pong"
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert metrics.get("test_breaker_state") == 0
+
+
+@pytest.mark.asyncio
+async def test_breaker_counts_call_timeout_as_failure():
+    breaker = CircuitBreaker(
+        "test_breaker", failure_threshold=1, reset_timeout=60, call_timeout=0.01
+    )
+
+    async def hang():
+        await asyncio.sleep(1)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await breaker.call(hang)
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+@pytest_asyncio.fixture()
+async def stalled_redis():
+    """Redis stand-in that accepts connections but never replies."""
+    connections = []
+
+    async def accept(reader, writer):
+        connections.append(writer)
+
+    server = await asyncio.start_server(accept, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    manager = RedisClientManager(
+        "127.0.0.1", port, socket_timeout=0.05, socket_connect_timeout=0.05
+    )
+    breaker = CircuitBreaker(
+        "stalled_breaker", failure_threshold=2, reset_timeout=60, call_timeout=0.1
+    )
+    with patch("src.services.auth.redis_manager", manager), patch(
+        "src.services.user_cache.redis_manager", manager
+    ), patch("src.services.revocation.redis_manager", manager), patch(
+        "src.services.auth.redis_breaker", breaker
+    ), patch(
+        "src.services.auth.revocation_list",
+        RevocationList(sync_interval=0, retention=3600, capacity=100, error_rate=0.01),
+    ):
+        yield breaker
+    for writer in connections:
+        writer.close()
+    server.close()
+
+
+@pytest.mark.asyncio
+async def test_auth_falls_back_to_database_when_redis_stalls(stalled_redis):
+    user = User(
+        id=3, username="stalled", email="s@example.com", role=UserRole.USER, confirmed=True
+    )
+    access = await create_access_token({"sub": "stalled"})
+    with patch("src.services.auth.UserService") as mock_service:
+        mock_service.return_value.get_user_by_username = AsyncMock(return_value=user)
+        for _ in range(3):
+            principal = await get_current_user(token=access, db=AsyncMock(info={}))
+            assert principal.username == "stalled"
+
+        assert stalled_redis.state == CircuitBreaker.OPEN
+        started = time.perf_counter()
+        await get_current_user(token=access, db=AsyncMock(info={}))
+        assert time.perf_counter() - started < 0.05
+
+
+@pytest.mark.asyncio
+async def test_refresh_fails_closed_when_redis_stalls(stalled_redis):
+    refresh = await create_refresh_token("stalled", "fid", "jti")
+
+    with pytest.raises(HTTPException) as exc:
+        await refresh_access_token(refresh, db=AsyncMock())
+
+    assert exc.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert "Retry-After" in exc.value.headers
@@ -0,0 +1,142 @@
+from datetime import date, datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from redis.exceptions import ConnectionError
+
+from src.database.models import Contact, User
+from src.services.circuit_breaker import redis_breaker
+from src.services.contact_cache import ContactCache, seconds_until_end_of
+from src.services.contacts import ContactService
+
+
+@pytest.fixture
+def redis_client():
+    with patch("src.services.contact_cache.redis_manager") as manager:
+        manager.client.get = AsyncMock(return_value=None)
+        manager.client.set = AsyncMock()
+        manager.client.incr = AsyncMock(return_value=4)
+        yield manager.client
+
+
+@pytest.fixture(autouse=True)
+def breaker():
+    redis_breaker.reset()
+    yield
+    redis_breaker.reset()
+
+
+@pytest.mark.asyncio
+async def test_get_birthdays_reads_versioned_key(redis_client):
+    redis_client.get = AsyncMock(side_effect=[b"3", b"[]"])
+    cache = ContactCache(ttl=86400)
+
+    version, payload = await cache.get(7, cache.birthdays_name(date(2026, 10, 17), 7))
+
+    assert (version, payload) == (3, b"[]")
+    assert redis_client.get.await_args_list[1].args == (
+        "contacts_cache:7:3:birthdays:2026-10-17:7",
+    )
+
+
+@pytest.mark.asyncio
+async def test_bump_changes_version(redis_client):
+    assert await ContactCache(ttl=86400).bump(7) == 4
+    redis_client.incr.assert_awaited_once_with("contacts_version:7")
+
+
+@pytest.mark.asyncio
+async def test_set_caps_ttl(redis_client):
+    cache = ContactCache(ttl=300)
+
+    await cache.set(7, 3, "page", b"[]", ttl=86400)
+    await cache.set(7, 3, "page", b"[]", ttl=60)
+
+    assert [c.kwargs["ex"] for c in redis_client.set.await_args_list] == [300, 60]
+    assert redis_client.set.await_args.args[0] == "contacts_cache:7:3:page"
+
+
+def test_seconds_until_end_of_today():
+    today = date.today()
+    midnight = datetime.combine(today, datetime.max.time())
+    assert 1 <= seconds_until_end_of(today) <= (midnight - datetime.now()).seconds + 1
+
+
+def test_page_name_normalizes_parameters():
+    assert ContactCache.page_name(10, 0, None, None) == ContactCache.page_name(
+        10, 0, None, ""
+    )
+    assert ContactCache.page_name(10, 0, 42, "ann") != ContactCache.page_name(
+        10, 0, 42, "anna"
+    )
+    assert ContactCache.page_name(10, 20, None, None) != ContactCache.page_name(
+        10, 0, None, None
+    )
+
+
+@pytest.mark.asyncio
+async def test_birthdays_json_falls_back_without_redis():
+    user = User(id=1, username="test")
+    contact = Contact(
+        id=1,
+        first_name="Test",
+        last_name="Contact",
+        email="test@example.com",
+        phone="+380000000000",
+        birthday=date(1990, 1, 1),
+    )
+    service = ContactService(AsyncMock(info={}))
+    service.contact_repository.get_birthday_list = AsyncMock(return_value=[contact])
+
+    with patch("src.services.contacts.contact_cache") as cache:
+        cache.get = AsyncMock(side_effect=ConnectionError("down"))
+        cache.set = AsyncMock()
+        payload = await service.get_birthday_list_json(user, 7)
+
+    assert b'"first_name":"Test"' in payload
+    cache.set.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_contacts_page_hit_skips_database():
+    service = ContactService(AsyncMock(info={}))
+    service.contact_repository.get_contacts = AsyncMock()
+
+    with patch("src.services.contacts.contact_cache") as cache:
+        cache.get = AsyncMock(return_value=(3, b'aWQ6NQ\n[{"id":5}]'))
+        payload, cursor = await service.get_contacts_page_json(
+            0, 1, User(id=1, username="test")
+        )
+
+    assert (payload, cursor) == (b'[{"id":5}]', "aWQ6NQ")
+    service.contact_repository.get_contacts.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "info, current_version, recent_writer, cached",
+    [
+        ({}, 4, True, True),
+        ({"replica": True}, 3, False, True),
+        ({"replica": True}, 4, False, False),
+        ({"replica": True}, 3, True, False),
+    ],
+)
+async def test_contacts_page_miss_from_replica_is_cached_when_current(
+    info, current_version, recent_writer, cached
+):
+    service = ContactService(AsyncMock(info=info))
+    service.contact_repository.get_contacts = AsyncMock(return_value=[])
+
+    with patch("src.services.contacts.contact_cache") as cache, patch(
+        "src.services.contacts.is_recent_writer", AsyncMock(return_value=recent_writer)
+    ):
+        cache.get = AsyncMock(return_value=(3, None))
+        cache.version = AsyncMock(return_value=current_version)
+        cache.set = AsyncMock()
+        payload, cursor = await service.get_contacts_page_json(
+            0, 10, User(id=1, username="test")
+        )
+
+    assert (payload, cursor) == (b"[]", None)
+    assert cache.set.await_count == int(cached)
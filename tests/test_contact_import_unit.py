@@ -0,0 +1,109 @@
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.exc import DataError
+
+from src.database.models import User
+from src.services.contacts import (
+    UNSAVED_CONTACT,
+    ContactService,
+    iter_lines,
+    iter_records,
+)
+
+
+async def chunked(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def collect(iterator):
+    return [item async for item in iterator]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [1, 3, 1024])
+async def test_iter_lines_is_independent_of_chunking(size):
+    data = b"first\r\nsecond\n\nlast"
+    lines = await collect(iter_lines(chunked(data, size)))
+    assert lines == [(1, b"first"), (2, b"second"), (3, b""), (4, b"last")]
+
+
+@pytest.mark.asyncio
+async def test_iter_records_csv_header_and_multiline_fields():
+    data = (
+        "﻿email,additional_info\n"
+        'a@example.com,"one\n""two"""\n'
+        "\n"
+        "b@example.com,plain,extra\n"
+        'c@example.com,"open\n'
+    ).encode()
+    records = await collect(iter_records(chunked(data, 4), "csv"))
+    assert records == [
+        (2, {"email": "a@example.com", "additional_info": 'one\n"two"'}, None),
+        (5, None, "Expected 2 fields, got 3"),
+        (6, None, "Unterminated quoted field"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iter_records_ndjson_reports_bad_lines():
+    data = b'{"email": "a@example.com"}\n\xff\n[1\n\n{"email": "b@example.com"}'
+    records = await collect(iter_records(chunked(data, 5), "ndjson"))
+    assert records[0] == (1, {"email": "a@example.com"}, None)
+    assert records[1] == (2, None, "Invalid UTF-8")
+    assert records[2][0] == 3 and records[2][2].startswith("Invalid JSON")
+    assert records[3] == (5, {"email": "b@example.com"}, None)
+
+
+def _row(i, **overrides):
+    return {
+        "first_name": f"Import{i}",
+        "last_name": "Contact",
+        "email": f"import{i}@example.com",
+        "phone": f"+38000000{i:04d}",
+        "birthday": "1990-01-01",
+        "additional_info": "",
+        **overrides,
+    }
+
+
+@pytest.mark.asyncio
+async def test_import_rejects_values_longer_than_columns():
+    service = ContactService(AsyncMock())
+    service.contact_repository.insert_contacts = AsyncMock(
+        side_effect=lambda rows, user: {row["email"] for row in rows}
+    )
+    rows = [_row(0), _row(1, phone="+" + "1" * 30), _row(2, last_name="x" * 26)]
+    upload = "\n".join(json.dumps(row) for row in rows)
+
+    report = await service.import_contacts(
+        User(id=1), chunked(upload.encode(), 64), "ndjson"
+    )
+
+    assert report.imported == 1
+    assert report.invalid == 2
+    assert [error.line for error in report.errors] == [2, 3]
+    assert report.errors[0].errors[0].startswith("phone:")
+
+
+@pytest.mark.asyncio
+async def test_import_isolates_rows_the_database_rejects():
+    async def insert(rows, user):
+        if any(row["email"] == "import1@example.com" for row in rows):
+            raise DataError("INSERT", {}, Exception("value too long"))
+        return {row["email"] for row in rows}
+
+    service = ContactService(AsyncMock())
+    service.contact_repository.insert_contacts = AsyncMock(side_effect=insert)
+    upload = "\n".join(json.dumps(_row(i)) for i in range(3))
+
+    report = await service.import_contacts(
+        User(id=1), chunked(upload.encode(), 64), "ndjson"
+    )
+
+    assert report.imported == 2
+    assert report.invalid == 1
+    assert report.errors[0].line == 2
+    assert report.errors[0].errors == [UNSAVED_CONTACT]
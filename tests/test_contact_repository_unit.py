@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import Contact, User
@@ -16,6 +16,13 @@ contact_info = {
 }
 
 
+@pytest.fixture(autouse=True)
+def contact_cache():
+    with patch("src.repository.contacts.contact_cache") as mock_cache:
+        mock_cache.bump = AsyncMock()
+        yield mock_cache
+
+
 @pytest.fixture
 def mock_session():
     mock_session = AsyncMock(spec=AsyncSession)
@@ -78,7 +85,7 @@ async def test_get_contact_by_id(contact_repository, mock_session, user):
 
 
 @pytest.mark.asyncio
-async def test_create_contact(contact_repository, mock_session, user):
+async def test_create_contact(contact_repository, mock_session, user, contact_cache):
     # Setup
     contact_data = ContactModel(
         first_name="Test2",
@@ -89,7 +96,7 @@ async def test_create_contact(contact_repository, mock_session, user):
         additional_info="Test contact info",
     )
     mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = Contact(
+    mock_result.scalar_one.return_value = Contact(
         id=1,
         first_name=contact_data.first_name,
         last_name=contact_data.last_name,
@@ -108,10 +115,14 @@ async def test_create_contact(contact_repository, mock_session, user):
     assert result.last_name == "Contact2"
     assert result.email == "test2@example.com"
     assert result.phone == "+2134567890"
+    mock_session.execute.assert_awaited_once()
+    mock_session.commit.assert_awaited_once()
+    mock_session.refresh.assert_not_awaited()
+    contact_cache.bump.assert_awaited_once_with(user.id)
 
 
 @pytest.mark.asyncio
-async def test_remove_contact(contact_repository, mock_session, user):
+async def test_remove_contact(contact_repository, mock_session, user, contact_cache):
     # Setup
     existing_contact = Contact(id=1, **contact_info, user=user)
     mock_result = MagicMock()
@@ -128,12 +139,14 @@ async def test_remove_contact(contact_repository, mock_session, user):
     assert result.email == "test@example.com"
     assert result.phone == "+1234567890"
 
-    mock_session.delete.assert_awaited_once_with(existing_contact)
+    mock_session.execute.assert_awaited_once()
+    mock_session.delete.assert_not_awaited()
     mock_session.commit.assert_awaited_once()
+    contact_cache.bump.assert_awaited_once_with(user.id)
 
 
 @pytest.mark.asyncio
-async def test_update_contact(contact_repository, mock_session, user):
+async def test_update_contact(contact_repository, mock_session, user, contact_cache):
     # Setup
     contact_data = ContactUpdate(
         first_name="Test3",
@@ -141,9 +154,11 @@ async def test_update_contact(contact_repository, mock_session, user):
         email="test3@example.com",
         phone="+3134567890",
     )
-    existing_contact = Contact(id=1, **contact_info, user=user)
+    updated_contact = Contact(
+        id=1, **{**contact_info, **contact_data.model_dump(exclude_unset=True)}, user=user
+    )
     mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = existing_contact
+    mock_result.scalar_one_or_none.return_value = updated_contact
     mock_session.execute = AsyncMock(return_value=mock_result)
 
     # Call method
@@ -157,5 +172,22 @@ async def test_update_contact(contact_repository, mock_session, user):
     assert result.last_name == "Contact3"
     assert result.email == "test3@example.com"
     assert result.phone == "+3134567890"
+    mock_session.execute.assert_awaited_once()
     mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once_with(existing_contact)
+    mock_session.refresh.assert_not_awaited()
+    contact_cache.bump.assert_awaited_once_with(user.id)
+
+
+@pytest.mark.asyncio
+async def test_get_contacts_keyset(contact_repository, mock_session, user):
+    mock_result = MagicMock()
+    mock_result.scalars.return_value.all.return_value = []
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    await contact_repository.get_contacts(skip=50, limit=10, user=user, after=42)
+
+    stmt = mock_session.execute.await_args.args[0]
+    sql = str(stmt.compile(compile_kwargs={"literal_binds": True}))
+    assert "contacts.id > 42" in sql
+    assert "ORDER BY contacts.id" in sql
+    assert "OFFSET" not in sql
@@ -1,6 +1,6 @@
 from datetime import datetime
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import Contact, User
@@ -18,6 +18,13 @@ contact_data = ContactModel(
 )
 
 
+@pytest.fixture(autouse=True)
+def contact_cache():
+    with patch("src.repository.contacts.contact_cache") as mock_cache:
+        mock_cache.bump = AsyncMock()
+        yield mock_cache
+
+
 @pytest.fixture
 def mock_session():
     return AsyncMock(spec=AsyncSession)
@@ -75,16 +82,13 @@ async def test_remove_contact(contact_repository, mock_session, user):
 
     assert result is not None
     assert result.last_name == "Contact"
-    mock_session.delete.assert_awaited_once_with(existing_contact)
+    mock_session.execute.assert_awaited_once()
+    mock_session.delete.assert_not_awaited()
     mock_session.commit.assert_awaited_once()
 
 
 @pytest.mark.asyncio
 async def test_update_contact(contact_repository, mock_session, user):
-    existing_contact = Contact(
-        id=1, first_name="OldName", last_name="OldLastName", user=user
-    )
-
     contact_data = ContactModel(
         email="updated@test.de",
         first_name="UpdatedName",
@@ -94,8 +98,10 @@ async def test_update_contact(contact_repository, mock_session, user):
         additional_info="Updated info",
     )
 
+    updated_contact = Contact(id=1, **contact_data.model_dump(), user=user)
+
     mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = existing_contact
+    mock_result.scalar_one_or_none.return_value = updated_contact
     mock_session.execute = AsyncMock(return_value=mock_result)
 
     result = await contact_repository.update_contact(
@@ -106,12 +112,15 @@ async def test_update_contact(contact_repository, mock_session, user):
     assert result.first_name == "UpdatedName"
     assert result.last_name == "UpdatedLastName"
     assert result.email == "updated@test.de"
+    mock_session.execute.assert_awaited_once()
     mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once_with(existing_contact)
+    mock_session.refresh.assert_not_awaited()
 
 
 @pytest.mark.asyncio
-async def test_remove_contact_not_found(contact_repository, mock_session, user):
+async def test_remove_contact_not_found(
+    contact_repository, mock_session, user, contact_cache
+):
     non_existing_contact = None
 
     mock_result = MagicMock()
@@ -123,6 +132,7 @@ async def test_remove_contact_not_found(contact_repository, mock_session, user):
     assert result is None
     mock_session.delete.assert_not_awaited()
     mock_session.commit.assert_not_awaited()
+    contact_cache.bump.assert_not_awaited()
 
 
 @pytest.mark.asyncio
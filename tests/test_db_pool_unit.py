@@ -0,0 +1,30 @@
+import pytest
+from sqlalchemy import exc, text
+
+from src.database.db import DatabaseSessionManager
+from src.services.metrics import metrics
+
+
+@pytest.mark.asyncio
+async def test_pool_checkout_times_out_when_saturated(tmp_path):
+    manager = DatabaseSessionManager(
+        f"sqlite+aiosqlite:///{tmp_path}/pool.db",
+        name="db_test",
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    timeouts = metrics.get("db_test_pool_timeouts")
+
+    async with manager.session() as holder:
+        await holder.execute(text("SELECT 1"))
+        assert manager.pool_stats()["checked_out"] == 1
+
+        with pytest.raises(exc.TimeoutError):
+            async with manager.session() as waiter:
+                await waiter.execute(text("SELECT 1"))
+
+    assert metrics.get("db_test_pool_timeouts") == timeouts + 1
+    assert metrics.snapshot()["timings"]["db_test_pool_checkout_wait"]["max"] >= 0.05
+    assert manager.pool_stats()["checked_out"] == 0
+    await manager._engine.dispose()
@@ -0,0 +1,132 @@
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from redis.exceptions import ConnectionError
+from sqlalchemy import text
+
+from src.database.db import (
+    DatabaseSessionManager,
+    ReadYourWritesMiddleware,
+    get_read_db,
+    mark_recent_writer,
+    recent_writer_key,
+    recent_writers,
+    writer_key,
+)
+from src.services.circuit_breaker import redis_breaker
+from src.services.auth import create_access_token
+
+
+async def _database_file(session) -> str:
+    rows = await session.execute(text("PRAGMA database_list"))
+    return rows.first()[2]
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return DatabaseSessionManager(
+        f"sqlite+aiosqlite:///{tmp_path}/primary.db",
+        name="db_routing",
+        replica_urls=[
+            f"sqlite+aiosqlite:///{tmp_path}/replica_a.db",
+            f"sqlite+aiosqlite:///{tmp_path}/replica_b.db",
+        ],
+    )
+
+
+@pytest.mark.asyncio
+async def test_read_sessions_rotate_over_replicas(manager):
+    files = []
+    for _ in range(3):
+        async with manager.read_session() as session:
+            assert session.info["replica"] is True
+            files.append(await _database_file(session))
+
+    assert files[0].endswith("replica_a.db")
+    assert files[1].endswith("replica_b.db")
+    assert files[2].endswith("replica_a.db")
+
+
+@pytest.mark.asyncio
+async def test_read_session_without_replicas_uses_primary(tmp_path):
+    manager = DatabaseSessionManager(f"sqlite+aiosqlite:///{tmp_path}/only.db")
+    async with manager.read_session() as session:
+        assert "replica" not in session.info
+        assert (await _database_file(session)).endswith("only.db")
+
+
+def test_writer_key_reads_token_subject():
+    token = "eyJhbGciOiJIUzI1NiJ9.eyJzdWIiOiJ3cml0ZXIifQ.c2ln"
+    assert writer_key(f"Bearer {token}") == "writer"
+    assert writer_key("Bearer not-a-jwt") is None
+    assert writer_key(None) is None
+
+
+@pytest.fixture
+def redis_marks():
+    marks = {}
+
+    async def set_mark(key, value, px):
+        marks[key] = px
+
+    async def exists(key):
+        return int(key in marks)
+
+    with patch("src.database.db.redis_manager") as redis_manager:
+        redis_manager.client.set = AsyncMock(side_effect=set_mark)
+        redis_manager.client.exists = AsyncMock(side_effect=exists)
+        yield marks
+    redis_breaker.reset()
+
+
+async def _read_database(manager, token) -> str:
+    request = Mock(headers={"Authorization": f"Bearer {token}"})
+    with patch("src.database.db.sessionmanager", manager):
+        dependency = get_read_db(request)
+        session = await anext(dependency)
+        database = (
+            "replica" if session.info.get("replica") else await _database_file(session)
+        )
+        await dependency.aclose()
+    return database
+
+
+@pytest.mark.asyncio
+async def test_writer_is_marked_before_the_response_starts(redis_marks):
+    token = await create_access_token({"sub": "sticky"})
+    headers = [(b"authorization", f"Bearer {token}".encode())]
+    sent = []
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 201, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def send(message):
+        sent.append((message["type"], recent_writer_key("sticky") in redis_marks))
+
+    await ReadYourWritesMiddleware(app)(
+        {"type": "http", "method": "POST", "headers": headers}, None, send
+    )
+    assert sent == [("http.response.start", True), ("http.response.body", True)]
+    assert redis_marks[recent_writer_key("sticky")] == 5000
+    recent_writers.pop("sticky")
+
+
+@pytest.mark.asyncio
+async def test_recent_writer_reads_from_primary_on_any_worker(manager, redis_marks):
+    token = await create_access_token({"sub": "sticky"})
+    assert await _read_database(manager, token) == "replica"
+
+    await mark_recent_writer("sticky")
+    # Another worker has no local mark, only the one in Redis.
+    recent_writers.pop("sticky")
+    assert (await _read_database(manager, token)).endswith("primary.db")
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_primary_when_stickiness_is_unknown(manager, redis_marks):
+    token = await create_access_token({"sub": "sticky"})
+    with patch(
+        "src.database.db.redis_manager.client.exists",
+        AsyncMock(side_effect=ConnectionError("down")),
+    ):
+        assert (await _read_database(manager, token)).endswith("primary.db")
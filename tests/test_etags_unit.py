@@ -0,0 +1,43 @@
+from datetime import datetime
+
+import pytest
+
+from src.services.contacts import contact_etag, parse_contact_etag
+from src.services.etags import content_etag, make_etag, none_match, strong_tags
+
+
+def test_make_etag_is_strong_and_stable():
+    etag = make_etag(1, "user", "user@example.com")
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == make_etag(1, "user", "user@example.com")
+    assert etag != make_etag(1, "user", "other@example.com")
+
+
+def test_content_etag_depends_on_body():
+    assert content_etag(b"[]") == content_etag(b"[]")
+    assert content_etag(b"[]") != content_etag(b"[{}]")
+
+
+def test_none_match_uses_weak_comparison():
+    assert none_match('"a"', '"a"')
+    assert none_match('W/"a"', '"a"')
+    assert none_match('"b", "a"', '"a"')
+    assert none_match("*", '"a"')
+    assert not none_match('"b"', '"a"')
+    assert not none_match(None, '"a"')
+
+
+def test_strong_tags_drop_weak_ones():
+    assert strong_tags('"a", W/"b", "c"') == ['"a"', '"c"']
+
+
+def test_contact_etag_round_trip():
+    updated_at = datetime(2026, 10, 17, 9, 30, 15, 123456)
+    etag = contact_etag(42, updated_at)
+    assert parse_contact_etag(etag) == (42, updated_at)
+
+
+@pytest.mark.parametrize("etag", ['"abc"', '"1-"', "W/x", '""'])
+def test_parse_contact_etag_rejects_foreign_tags(etag):
+    with pytest.raises(ValueError):
+        parse_contact_etag(etag)
@@ -1,4 +1,4 @@
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 from src.database.models import UserRole
 import pytest
 from sqlalchemy import select
@@ -35,6 +35,25 @@ def test_repeat_signup(client, monkeypatch):
     assert data["detail"] == "Користувач з таким email вже існує"
 
 
+def test_repeat_signup_username(client, monkeypatch):
+    monkeypatch.setattr("src.api.auth.send_email", Mock())
+    response = client.post(
+        "api/auth/register", json={**user_data, "email": "other@gmail.com"}
+    )
+    assert response.status_code == 409, response.text
+    assert response.json()["detail"] == "Користувач з таким іменем вже існує"
+
+
+def test_signup_race_maps_integrity_error(client, monkeypatch):
+    monkeypatch.setattr("src.api.auth.send_email", Mock())
+    monkeypatch.setattr(
+        "src.api.auth.UserService.get_conflicting_user", AsyncMock(return_value=None)
+    )
+    response = client.post("api/auth/register", json=user_data)
+    assert response.status_code == 409, response.text
+    assert response.json()["detail"] == "Користувач з таким email або іменем вже існує"
+
+
 def test_not_confirmed_login(client):
     response = client.post(
         "api/auth/login",
@@ -197,3 +216,110 @@ def test_login_user_not_found(client):
     assert response.status_code == 401, response.text
     data = response.json()
     assert data["detail"] == "Невірне імʼя користувача або пароль"
+
+
+def _login(client):
+    response = client.post(
+        "api/auth/login",
+        data={
+            "username": user_data.get("username"),
+            "password": user_data.get("password"),
+        },
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _refresh(client, refresh_token):
+    return client.post(
+        "api/auth/refresh", headers={"Authorization": f"Bearer {refresh_token}"}
+    )
+
+
+def test_refresh_rotates_token(client):
+    tokens = _login(client)
+
+    response = _refresh(client, tokens["refresh_token"])
+    assert response.status_code == 200, response.text
+    rotated = response.json()
+    assert rotated["refresh_token"] != tokens["refresh_token"]
+    assert "access_token" in rotated
+
+    response = _refresh(client, rotated["refresh_token"])
+    assert response.status_code == 200, response.text
+
+
+def test_refresh_reuse_revokes_family(client):
+    tokens = _login(client)
+    rotated = _refresh(client, tokens["refresh_token"]).json()
+
+    reused = _refresh(client, tokens["refresh_token"])
+    assert reused.status_code == 401, reused.text
+    assert _refresh(client, rotated["refresh_token"]).status_code == 401
+
+
+def test_refresh_families_are_per_device(client):
+    phone = _login(client)
+    laptop = _login(client)
+
+    assert _refresh(client, phone["refresh_token"]).status_code == 200
+    assert _refresh(client, laptop["refresh_token"]).status_code == 200
+
+
+def test_logout_revokes_access_and_refresh_tokens(client):
+    tokens = _login(client)
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    assert client.get("api/users/me", headers=headers).status_code == 200
+
+    response = client.post("api/auth/logout", headers=headers)
+    assert response.status_code == 200, response.text
+
+    assert client.get("api/users/me", headers=headers).status_code == 401
+    assert client.post("api/auth/logout", headers=headers).status_code == 401
+    assert _refresh(client, tokens["refresh_token"]).status_code == 401
+
+
+def test_refresh_token_is_not_a_bearer_token(client):
+    tokens = _login(client)
+    refresh_headers = {"Authorization": f"Bearer {tokens['refresh_token']}"}
+    assert client.get("api/contacts/", headers=refresh_headers).status_code == 401
+
+    client.post(
+        "api/auth/logout",
+        headers={"Authorization": f"Bearer {tokens['access_token']}"},
+    )
+    assert client.get("api/contacts/", headers=refresh_headers).status_code == 401
+    assert client.post("api/auth/logout", headers=refresh_headers).status_code == 401
+
+
+def test_logout_keeps_other_devices_signed_in(client):
+    phone = _login(client)
+    laptop = _login(client)
+
+    client.post(
+        "api/auth/logout",
+        headers={"Authorization": f"Bearer {phone['access_token']}"},
+    )
+
+    headers = {"Authorization": f"Bearer {laptop['access_token']}"}
+    assert client.get("api/users/me", headers=headers).status_code == 200
+    assert _refresh(client, laptop["refresh_token"]).status_code == 200
+
+
+
+@pytest.mark.asyncio
+async def test_password_change_ends_refresh_families(client):
+    from src.services.auth import create_password_reset_token
+
+    tokens = _login(client)
+    reset_token = await create_password_reset_token({"sub": user_data["email"]})
+    response = client.post(
+        "api/auth/password-reset",
+        json={"token": reset_token, "new_password": user_data["password"]},
+    )
+    assert response.status_code == 200, response.text
+
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    assert client.get("api/users/me", headers=headers).status_code == 401
+    assert _refresh(client, tokens["refresh_token"]).status_code == 401
+    assert _refresh(client, _login(client)["refresh_token"]).status_code == 200
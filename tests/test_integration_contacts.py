@@ -1,3 +1,9 @@
+import csv
+import io
+import json
+from datetime import date
+from unittest.mock import AsyncMock, patch
+
 contact_info = {
     "first_name": "Test",
     "last_name": "Contact",
@@ -156,3 +162,456 @@ def test_delete_contact_not_found(client, get_token):
     assert response.status_code == 404, response.text
     data = response.json()
     assert data["detail"] == "Contact not found"
+
+
+def test_get_contacts_cursor_pages(client, get_token):
+    headers = {"Authorization": f"Bearer {get_token}"}
+    created = []
+    for i in range(3):
+        body = {
+            **contact_info,
+            "first_name": f"Page{i}",
+            "email": f"page{i}@example.com",
+            "phone": f"+38000000000{i}",
+        }
+        response = client.post("/api/contacts", json=body, headers=headers)
+        assert response.status_code == 201, response.text
+        created.append(response.json()["id"])
+
+    first = client.get("/api/contacts", params={"limit": 2}, headers=headers)
+    assert first.status_code == 200, first.text
+    assert [c["id"] for c in first.json()] == created[:2]
+    cursor = first.headers["X-Next-Cursor"]
+    assert f"after={cursor}" in first.headers["Link"]
+    assert first.headers["Link"].endswith('rel="next"')
+
+    second = client.get(
+        "/api/contacts", params={"limit": 2, "after": cursor}, headers=headers
+    )
+    assert second.status_code == 200, second.text
+    assert [c["id"] for c in second.json()] == created[2:]
+    assert "X-Next-Cursor" not in second.headers
+    assert "Link" not in second.headers
+
+    offset = client.get("/api/contacts", params={"limit": 2, "skip": 2}, headers=headers)
+    assert offset.json() == second.json()
+
+    for contact_id in created:
+        client.delete(f"/api/contacts/{contact_id}", headers=headers)
+
+
+def test_get_contacts_invalid_cursor(client, get_token):
+    response = client.get(
+        "/api/contacts",
+        params={"after": "not-a-cursor"},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == 400, response.text
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_birthdays_window(client, get_token):
+    headers = {"Authorization": f"Bearer {get_token}"}
+    today = date.today()
+    body = {
+        **contact_info,
+        "email": "birthday@example.com",
+        "phone": "+380000000777",
+        "birthday": today.replace(year=1990).isoformat()
+        if (today.month, today.day) != (2, 29)
+        else "1992-02-29",
+    }
+    created = client.post("/api/contacts", json=body, headers=headers)
+    assert created.status_code == 201, created.text
+
+    response = client.get("/api/contacts/birthdays", params={"days": 0}, headers=headers)
+    assert response.status_code == 200, response.text
+    assert [c["id"] for c in response.json()] == [created.json()["id"]]
+
+    response = client.get("/api/contacts/birthdays", params={"days": 400}, headers=headers)
+    assert response.status_code == 422, response.text
+
+    client.delete(f"/api/contacts/{created.json()['id']}", headers=headers)
+
+
+def test_birthdays_cached_until_contacts_change(client, get_token, monkeypatch):
+    headers = {"Authorization": f"Bearer {get_token}"}
+    first = client.get("/api/contacts/birthdays", params={"days": 3}, headers=headers)
+    assert first.status_code == 200, first.text
+
+    # A hit must be served without querying the database.
+    monkeypatch.setattr(
+        "src.services.contacts.ContactRepository.get_birthday_list",
+        AsyncMock(side_effect=AssertionError("database queried on a cache hit")),
+    )
+    second = client.get("/api/contacts/birthdays", params={"days": 3}, headers=headers)
+    assert second.status_code == 200, second.text
+    assert second.content == first.content
+    monkeypatch.undo()
+
+    today = date.today()
+    body = {
+        **contact_info,
+        "email": "cached@example.com",
+        "phone": "+380000000778",
+        "birthday": "1992-02-29"
+        if (today.month, today.day) == (2, 29)
+        else today.replace(year=1990).isoformat(),
+    }
+    created = client.post("/api/contacts", json=body, headers=headers)
+    assert created.status_code == 201, created.text
+
+    third = client.get("/api/contacts/birthdays", params={"days": 3}, headers=headers)
+    assert created.json()["id"] in [c["id"] for c in third.json()]
+
+    client.delete(f"/api/contacts/{created.json()['id']}", headers=headers)
+    fourth = client.get("/api/contacts/birthdays", params={"days": 3}, headers=headers)
+    assert fourth.json() == first.json()
+
+
+def test_contact_pages_cached_until_contacts_change(client, get_token, monkeypatch):
+    headers = {"Authorization": f"Bearer {get_token}"}
+    params = {"limit": 5, "q": "cache"}
+    first = client.get("/api/contacts", params=params, headers=headers)
+    assert first.status_code == 200, first.text
+    assert first.json() == []
+
+    monkeypatch.setattr(
+        "src.services.contacts.ContactRepository.get_contacts",
+        AsyncMock(side_effect=AssertionError("database queried on a cache hit")),
+    )
+    second = client.get("/api/contacts", params=params, headers=headers)
+    assert second.status_code == 200, second.text
+    assert second.content == first.content
+    monkeypatch.undo()
+
+    body = {
+        **contact_info,
+        "first_name": "Cache",
+        "email": "page-cache@example.com",
+        "phone": "+380000000779",
+    }
+    created = client.post("/api/contacts", json=body, headers=headers)
+    assert created.status_code == 201, created.text
+
+    third = client.get("/api/contacts", params=params, headers=headers)
+    assert [c["id"] for c in third.json()] == [created.json()["id"]]
+
+    client.delete(f"/api/contacts/{created.json()['id']}", headers=headers)
+    assert client.get("/api/contacts", params=params, headers=headers).json() == []
+
+
+def test_contact_etags(client, get_token):
+    headers = {"Authorization": f"Bearer {get_token}"}
+    body = {
+        **contact_info,
+        "first_name": "Etag",
+        "email": "etag@example.com",
+        "phone": "+380000000780",
+    }
+    created = client.post("/api/contacts", json=body, headers=headers)
+    assert created.status_code == 201, created.text
+    contact_id = created.json()["id"]
+    etag = created.headers["ETag"]
+
+    response = client.get(f"/api/contacts/{contact_id}", headers=headers)
+    assert response.headers["ETag"] == etag
+
+    not_modified = client.get(
+        f"/api/contacts/{contact_id}", headers={**headers, "If-None-Match": etag}
+    )
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    updated = client.patch(
+        f"/api/contacts/{contact_id}",
+        json={"first_name": "Etag2"},
+        headers={**headers, "If-Match": etag},
+    )
+    assert updated.status_code == 200, updated.text
+    new_etag = updated.headers["ETag"]
+    assert new_etag != etag
+
+    stale = client.patch(
+        f"/api/contacts/{contact_id}",
+        json={"first_name": "Lost"},
+        headers={**headers, "If-Match": etag},
+    )
+    assert stale.status_code == 412, stale.text
+    assert client.get(f"/api/contacts/{contact_id}", headers=headers).json()[
+        "first_name"
+    ] == "Etag2"
+
+    modified = client.get(
+        f"/api/contacts/{contact_id}", headers={**headers, "If-None-Match": etag}
+    )
+    assert modified.status_code == 200
+    assert modified.headers["ETag"] == new_etag
+
+    missing = client.put(
+        "/api/contacts/999999", json=body, headers={**headers, "If-Match": new_etag}
+    )
+    assert missing.status_code == 404, missing.text
+
+    client.delete(f"/api/contacts/{contact_id}", headers=headers)
+
+
+def test_contact_list_etag(client, get_token):
+    headers = {"Authorization": f"Bearer {get_token}"}
+    first = client.get("/api/contacts", headers=headers)
+    assert first.status_code == 200, first.text
+
+    second = client.get(
+        "/api/contacts", headers={**headers, "If-None-Match": first.headers["ETag"]}
+    )
+    assert second.status_code == 304
+    assert second.content == b""
+
+
+def test_export_contacts(client, get_token, monkeypatch):
+    from src.conf.config import settings
+
+    monkeypatch.setattr(settings, "CONTACT_EXPORT_BATCH_SIZE", 2)
+    headers = {"Authorization": f"Bearer {get_token}"}
+    created = []
+    for i in range(3):
+        body = {
+            **contact_info,
+            "first_name": f"Export{i}",
+            "email": f"export{i}@example.com",
+            "phone": f"+38000000079{i}",
+        }
+        response = client.post("/api/contacts", json=body, headers=headers)
+        assert response.status_code == 201, response.text
+        created.append(response.json())
+
+    listed = client.get("/api/contacts", params={"limit": 100}, headers=headers).json()
+
+    ndjson = client.get("/api/contacts/export", headers=headers)
+    assert ndjson.status_code == 200, ndjson.text
+    assert ndjson.headers["content-type"] == "application/x-ndjson"
+    assert 'filename="contacts.ndjson"' in ndjson.headers["content-disposition"]
+    exported = [json.loads(line) for line in ndjson.text.splitlines()]
+    assert exported == listed
+    assert {c["id"] for c in created} <= {c["id"] for c in exported}
+
+    response = client.get(
+        "/api/contacts/export", params={"format": "csv"}, headers=headers
+    )
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [int(row["id"]) for row in rows] == [c["id"] for c in listed]
+    first = next(row for row in rows if int(row["id"]) == created[0]["id"])
+    assert first["first_name"] == "Export0"
+    assert first["birthday"] == contact_info["birthday"]
+    assert first["updated_at"] == created[0]["updated_at"]
+
+    invalid = client.get(
+        "/api/contacts/export", params={"format": "xml"}, headers=headers
+    )
+    assert invalid.status_code == 422
+
+    for contact in created:
+        client.delete(f"/api/contacts/{contact['id']}", headers=headers)
+
+
+def test_import_contacts_ndjson(client, get_token, monkeypatch):
+    from src.conf.config import settings
+
+    monkeypatch.setattr(settings, "CONTACT_IMPORT_BATCH_SIZE", 2)
+    headers = {"Authorization": f"Bearer {get_token}"}
+    existing = client.post(
+        "/api/contacts",
+        json={**contact_info, "email": "taken@example.com", "phone": "+380000000800"},
+        headers=headers,
+    ).json()
+
+    def row(i, **overrides):
+        return json.dumps(
+            {
+                **contact_info,
+                "first_name": f"Import{i}",
+                "email": f"import{i}@example.com",
+                "phone": f"+38000000081{i}",
+                **overrides,
+            }
+        )
+
+    upload = "\n".join(
+        [
+            row(0),
+            row(1, email="not-an-email"),
+            "",
+            row(2),
+            row(3, email="import0@example.com"),
+            "{broken",
+            row(4, phone="+380000000800"),
+            row(5, email="taken@example.com"),
+            row(6),
+        ]
+    )
+    response = client.post(
+        "/api/contacts/import",
+        content=upload.encode(),
+        headers={**headers, "Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200, response.text
+    report = response.json()
+    assert report["imported"] == 3
+    assert report["invalid"] == 2
+    assert report["duplicates"] == 3
+    assert [error["line"] for error in report["errors"]] == [2, 5, 6, 7, 8]
+    assert report["errors"][0]["errors"][0].startswith("email:")
+    assert report["errors"][2]["errors"][0].startswith("Invalid JSON")
+
+    exported = [
+        json.loads(line)
+        for line in client.get("/api/contacts/export", headers=headers).text.splitlines()
+    ]
+    imported = [c for c in exported if c["first_name"].startswith("Import")]
+    assert [c["first_name"] for c in imported] == ["Import0", "Import2", "Import6"]
+
+    for contact in [existing, *imported]:
+        client.delete(f"/api/contacts/{contact['id']}", headers=headers)
+
+
+def test_import_contacts_csv_round_trip(client, get_token):
+    headers = {"Authorization": f"Bearer {get_token}"}
+    body = {
+        **contact_info,
+        "first_name": "Csv",
+        "email": "csv@example.com",
+        "phone": "+380000000820",
+        "additional_info": 'Line one,\n"quoted" line two',
+    }
+    created = client.post("/api/contacts", json=body, headers=headers).json()
+    export = client.get(
+        "/api/contacts/export", params={"format": "csv"}, headers=headers
+    ).content
+    client.delete(f"/api/contacts/{created['id']}", headers=headers)
+
+    response = client.post(
+        "/api/contacts/import",
+        params={"format": "csv"},
+        content=export,
+        headers={**headers, "Content-Type": "text/csv"},
+    )
+    assert response.status_code == 200, response.text
+    report = response.json()
+    assert report["imported"] >= 1
+    assert report["invalid"] == 0
+
+    contacts = client.get(
+        "/api/contacts", params={"q": "csv@example"}, headers=headers
+    ).json()
+    assert len(contacts) == 1
+    assert contacts[0]["additional_info"] == body["additional_info"]
+
+    again = client.post(
+        "/api/contacts/import",
+        params={"format": "csv"},
+        content=export,
+        headers={**headers, "Content-Type": "text/csv"},
+    ).json()
+    assert again["imported"] == 0
+    assert again["duplicates"] == report["imported"]
+
+    client.delete(f"/api/contacts/{contacts[0]['id']}", headers=headers)
+
+
+def test_contacts_batch(client, get_token):
+    headers = {"Authorization": f"Bearer {get_token}"}
+    ids = []
+    for i in range(3):
+        body = {
+            **contact_info,
+            "first_name": f"Batch{i}",
+            "email": f"batch{i}@example.com",
+            "phone": f"+38000000083{i}",
+        }
+        response = client.post("/api/contacts", json=body, headers=headers)
+        assert response.status_code == 201, response.text
+        ids.append(response.json()["id"])
+
+    requested = [ids[2], 999999, ids[0], ids[2]]
+    response = client.post(
+        "/api/contacts/batch/get", json={"ids": requested}, headers=headers
+    )
+    assert response.status_code == 200, response.text
+    result = response.json()
+    assert [c["id"] for c in result["contacts"]] == [ids[2], ids[0]]
+    assert result["missing"] == [999999]
+
+    response = client.post(
+        "/api/contacts/batch/update",
+        json={"ids": [ids[0], ids[1], 999999], "changes": {"additional_info": "Batch"}},
+        headers=headers,
+    )
+    assert response.status_code == 200, response.text
+    result = response.json()
+    assert [c["additional_info"] for c in result["contacts"]] == ["Batch", "Batch"]
+    assert result["missing"] == [999999]
+    assert client.get(f"/api/contacts/{ids[2]}", headers=headers).json()[
+        "additional_info"
+    ] == contact_info["additional_info"]
+
+    for unique in ({"email": "same@example.com"}, {"phone": "+380000000839"}):
+        rejected = client.post(
+            "/api/contacts/batch/update",
+            json={"ids": ids[:2], "changes": unique},
+            headers=headers,
+        )
+        assert rejected.status_code == 422, rejected.text
+    emails = [
+        c["email"]
+        for c in client.post(
+            "/api/contacts/batch/get", json={"ids": ids}, headers=headers
+        ).json()["contacts"]
+    ]
+    assert emails == [f"batch{i}@example.com" for i in range(3)]
+    empty = client.post("/api/contacts/batch/delete", json={"ids": []}, headers=headers)
+    assert empty.status_code == 422
+
+    response = client.post(
+        "/api/contacts/batch/delete", json={"ids": ids + [999999]}, headers=headers
+    )
+    assert response.status_code == 200, response.text
+    result = response.json()
+    assert [c["id"] for c in result["contacts"]] == ids
+    assert result["missing"] == [999999]
+    assert client.get(f"/api/contacts/{ids[0]}", headers=headers).status_code == 404
+
+
+def test_contact_writes_survive_cache_invalidation_failure(client, get_token):
+    from redis.exceptions import ConnectionError
+
+    from src.services.circuit_breaker import redis_breaker
+    from src.services.metrics import metrics
+
+    headers = {"Authorization": f"Bearer {get_token}"}
+    body = {
+        **contact_info,
+        "email": "nocache@example.com",
+        "phone": "+380000000840",
+    }
+    failures = metrics.get("contact_cache_invalidation_failures")
+    try:
+        with patch(
+            "src.repository.contacts.contact_cache.bump",
+            AsyncMock(side_effect=ConnectionError("down")),
+        ):
+            created = client.post("/api/contacts", json=body, headers=headers)
+            assert created.status_code == 201, created.text
+            contact_id = created.json()["id"]
+            updated = client.patch(
+                f"/api/contacts/{contact_id}",
+                json={"first_name": "Updated"},
+                headers=headers,
+            )
+            assert updated.status_code == 200, updated.text
+            removed = client.delete(f"/api/contacts/{contact_id}", headers=headers)
+            assert removed.status_code == 200, removed.text
+    finally:
+        redis_breaker.reset()
+    assert metrics.get("contact_cache_invalidation_failures") == failures + 3
@@ -19,6 +19,12 @@ def test_get_me(client, get_token):
     assert data["email"] == test_user["email"]
     assert "avatar" in data
 
+    etag = response.headers["ETag"]
+    response = client.get("api/users/me", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304, response.text
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
 
 @pytest.mark.asyncio
 async def test_login(client):
@@ -43,3 +49,87 @@ async def test_login(client):
     assert "access_token" in data
     assert "token_type" in data
     return data
+
+
+def _admin_headers(client):
+    login = client.post(
+        "api/auth/login",
+        data={
+            "username": admin_user.get("username"),
+            "password": admin_user.get("password"),
+        },
+    )
+    return {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+
+def test_metrics_report_user_cache_hit_ratio(client, get_token):
+    headers = {"Authorization": f"Bearer {get_token}"}
+    client.get("api/contacts/", headers=headers)
+    client.get("api/contacts/", headers=headers)
+
+    response = client.get("api/metrics", headers=_admin_headers(client))
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert data["counters"]["user_cache_hits"] >= 1
+    assert 0 < data["collected"]["user_cache_hit_ratio"] <= 1
+
+
+def test_admin_route_authorized_from_token_claims(client):
+    login = client.post(
+        "api/auth/login",
+        data={
+            "username": admin_user.get("username"),
+            "password": admin_user.get("password"),
+        },
+    )
+    token = login.json()["access_token"]
+
+    response = client.get("api/auth/admin", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200, response.text
+
+
+def test_update_avatar_forbidden_for_regular_user(client, get_token):
+    response = client.patch(
+        "api/users/avatar",
+        headers={"Authorization": f"Bearer {get_token}"},
+        files={"file": ("avatar.png", io.BytesIO(b"png"), "image/png")},
+    )
+    assert response.status_code == 403, response.text
+
+
+def test_pool_timeout_returns_503(client, get_token):
+    from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+    from main import app
+    from src.database.db import get_read_db
+
+    async def saturated_db():
+        raise PoolTimeoutError("QueuePool limit reached")
+        yield
+
+    original = app.dependency_overrides[get_read_db]
+    app.dependency_overrides[get_read_db] = saturated_db
+    try:
+        response = client.get(
+            "api/users/me", headers={"Authorization": f"Bearer {get_token}"}
+        )
+    finally:
+        app.dependency_overrides[get_read_db] = original
+
+    assert response.status_code == 503, response.text
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_metrics_require_admin(client, get_token):
+    assert client.get("api/metrics").status_code == 401
+    response = client.get(
+        "api/metrics", headers={"Authorization": f"Bearer {get_token}"}
+    )
+    assert response.status_code == 403, response.text
+
+
+def test_metrics_report_db_pool_stats(client):
+    data = client.get("api/metrics", headers=_admin_headers(client)).json()
+    assert {"size", "checked_out", "checked_in", "overflow"} <= set(
+        data["collected"]["db_pool"]
+    )
@@ -0,0 +1,105 @@
+import time
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.services.revocation import BloomFilter, RevocationList
+
+
+def _revocation_list():
+    return RevocationList(sync_interval=60, retention=3600, capacity=1000, error_rate=0.01)
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    keys = [f"jti-{i}" for i in range(1000)]
+    for key in keys:
+        bloom.add(key)
+
+    assert all(key in bloom for key in keys)
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+
+
+@pytest.mark.asyncio
+async def test_is_revoked_skips_redis_for_unknown_token():
+    revocations = _revocation_list()
+    with patch("src.services.revocation.redis_manager") as mock_manager:
+        mock_manager.client.xrange = AsyncMock(return_value=[])
+        mock_manager.client.xtrim = AsyncMock()
+        mock_manager.client.exists = AsyncMock()
+
+        assert not await revocations.is_revoked("never-revoked")
+        assert not await revocations.is_revoked("never-revoked")
+
+    mock_manager.client.xrange.assert_awaited_once()
+    mock_manager.client.exists.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_sync_pulls_new_revocations_and_confirms_hits():
+    revocations = _revocation_list()
+    with patch("src.services.revocation.redis_manager") as mock_manager:
+        mock_manager.client.xrange = AsyncMock(
+            return_value=[(b"1700000000000-3", {b"jti": b"revoked-elsewhere"})]
+        )
+        mock_manager.client.xtrim = AsyncMock()
+        mock_manager.client.exists = AsyncMock(return_value=1)
+
+        assert await revocations.is_revoked("revoked-elsewhere")
+
+        revocations._synced_at = 0.0
+        mock_manager.client.xrange = AsyncMock(return_value=[])
+        await revocations.sync()
+
+    mock_manager.client.xrange.assert_awaited_once_with(
+        RevocationList.log_key, min="(1700000000000-3"
+    )
+    mock_manager.client.exists.assert_awaited_once_with("revoked:revoked-elsewhere")
+
+
+@pytest.mark.asyncio
+async def test_rebuild_trims_log_and_skips_expired_entries():
+    revocations = _revocation_list()
+    now = 1_700_000_000.0
+    with patch("src.services.revocation.redis_manager") as mock_manager, patch(
+        "src.services.revocation.time.time", return_value=now
+    ):
+        mock_manager.client.xrange = AsyncMock(return_value=[])
+        mock_manager.client.xtrim = AsyncMock()
+        await revocations.sync()
+
+    horizon = int((now - 3600) * 1000)
+    mock_manager.client.xtrim.assert_awaited_once_with(
+        RevocationList.log_key, minid=horizon, approximate=True
+    )
+    mock_manager.client.xrange.assert_awaited_once_with(
+        RevocationList.log_key, min=f"{horizon}-0"
+    )
+
+
+@pytest.mark.asyncio
+async def test_revoke_skips_expired_tokens():
+    revocations = _revocation_list()
+    with patch("src.services.revocation.redis_manager") as mock_manager:
+        await revocations.revoke("stale", time.time() - 1)
+
+    mock_manager.client.pipeline.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_revoke_records_token_until_expiry():
+    revocations = _revocation_list()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    with patch("src.services.revocation.redis_manager") as mock_manager:
+        mock_manager.client.pipeline.return_value.__aenter__.return_value = pipe
+        await revocations.revoke("logged-out", time.time() + 120)
+
+    pipe.set.assert_called_once()
+    assert pipe.set.call_args.args[0] == "revoked:logged-out"
+    assert 119 <= pipe.set.call_args.kwargs["ex"] <= 120
+    assert "logged-out" in revocations._filter
+    pipe.xadd.assert_called_once()
+    assert pipe.xadd.call_args.args[:2] == (RevocationList.log_key, {"jti": "logged-out"})
+    pipe.zadd.assert_not_called()
@@ -1,9 +1,11 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database.models import Contact, User
+from src.database.models import Contact, User, UserRole
 from src.repository.users import UserRepository
+from src.schemas import UserCreate
 
 
 @pytest.fixture
@@ -44,3 +46,73 @@ async def test_get_user_by_username(user_repository, mock_session):
     assert user is not None
     assert user.id == 1
     assert user.username == "Test"
+
+
+@pytest.mark.asyncio
+async def test_update_avatar_url_invalidates_cache(user_repository, mock_session):
+    mock_result = MagicMock()
+    mock_result.scalar_one_or_none.return_value = User(
+        id=1, username="Test", email="test@test.com", avatar="http://a.url"
+    )
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    with patch("src.repository.users.user_cache") as mock_cache:
+        mock_cache.invalidate_after_write = AsyncMock()
+        user = await user_repository.update_avatar_url("test@test.com", "http://a.url")
+
+    assert user.avatar == "http://a.url"
+    mock_cache.invalidate_after_write.assert_awaited_once_with("Test")
+    mock_session.execute.assert_awaited_once()
+    mock_session.commit.assert_awaited_once()
+    mock_session.refresh.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_confirmed_email_single_update(user_repository, mock_session):
+    mock_result = MagicMock()
+    mock_result.scalar_one_or_none.return_value = User(
+        id=1, username="Test", email="test@test.com", confirmed=True
+    )
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    with patch("src.repository.users.user_cache") as mock_cache:
+        mock_cache.invalidate_after_write = AsyncMock()
+        user = await user_repository.confirmed_email("test@test.com")
+
+    assert user.confirmed is True
+    statement = str(mock_session.execute.await_args.args[0])
+    assert statement.startswith("UPDATE users") and "RETURNING" in statement
+    mock_session.execute.assert_awaited_once()
+    mock_session.commit.assert_awaited_once()
+    mock_cache.invalidate_after_write.assert_awaited_once_with("Test")
+
+
+@pytest.mark.asyncio
+async def test_update_password_unknown_email(user_repository, mock_session):
+    mock_result = MagicMock()
+    mock_result.scalar_one_or_none.return_value = None
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    with patch("src.repository.users.user_cache") as mock_cache:
+        mock_cache.invalidate_after_write = AsyncMock()
+        user = await user_repository.update_password("nobody@test.com", "hash")
+
+    assert user is None
+    mock_session.commit.assert_not_awaited()
+    mock_cache.invalidate_after_write.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_create_user_conflict_rolls_back(user_repository, mock_session):
+    mock_session.execute = AsyncMock(
+        side_effect=IntegrityError("INSERT", {}, Exception("UNIQUE constraint"))
+    )
+    body = UserCreate(
+        username="Test", email="test@test.com", password="hashed", role=UserRole.USER
+    )
+
+    with pytest.raises(IntegrityError):
+        await user_repository.create_user(body)
+
+    mock_session.rollback.assert_awaited_once()
+    mock_session.commit.assert_not_awaited()
@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.database.db import DatabaseSessionManager
+from src.database.models import Base
+from src.services.email import Mailer
+from src.services.metrics import metrics
+from src.services.warmup import prime_statement_cache, warm_up
+
+
+@pytest.mark.asyncio
+async def test_prime_statement_cache_compiles_repository_queries(tmp_path):
+    manager = DatabaseSessionManager(
+        f"sqlite+aiosqlite:///{tmp_path}/warm.db", name="db_warm"
+    )
+    async with manager._engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    compiled = manager._engine.sync_engine._compiled_cache
+    compiled.clear()
+
+    async with manager.session() as session:
+        await prime_statement_cache(session)
+
+    assert len(compiled) >= 7
+    await manager.warm_up(2)
+    assert manager.pool_stats()["checked_in"] >= 1
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_tolerates_failing_dependencies():
+    failures = metrics.get("warmup_failures")
+    with patch("src.services.warmup.sessionmanager") as mock_db, patch(
+        "src.services.warmup.redis_manager"
+    ) as mock_redis, patch("src.services.warmup.mailer") as mock_mailer:
+        mock_db.warm_up = AsyncMock(side_effect=OSError("db down"))
+        mock_db.session.side_effect = OSError("db down")
+        mock_redis.warm_up = AsyncMock(side_effect=ConnectionError("redis down"))
+        await warm_up()
+
+    assert metrics.get("warmup_failures") == failures + 3
+    mock_mailer.warm_up.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_gives_up_on_a_hanging_step(monkeypatch):
+    from src.conf.config import settings
+
+    async def hang(connections):
+        await asyncio.sleep(60)
+
+    monkeypatch.setattr(settings, "WARMUP_STEP_TIMEOUT_SECONDS", 0.05)
+    failures = metrics.get("warmup_failures")
+    with patch("src.services.warmup.sessionmanager") as mock_db, patch(
+        "src.services.warmup.redis_manager"
+    ) as mock_redis, patch("src.services.warmup.mailer") as mock_mailer:
+        mock_db.warm_up = hang
+        mock_db.replica_count = 0
+        mock_db.session.return_value.__aenter__ = AsyncMock()
+        mock_db.session.return_value.__aexit__ = AsyncMock(return_value=False)
+        mock_redis.warm_up = AsyncMock()
+        with patch("src.services.warmup.prime_statement_cache", AsyncMock()):
+            await asyncio.wait_for(warm_up(), 1)
+
+    assert metrics.get("warmup_failures") == failures + 1
+    mock_redis.warm_up.assert_awaited_once()
+    mock_mailer.warm_up.assert_called_once()
+
+
+def test_mailer_reuses_compiled_templates():
+    mailer = Mailer()
+    mailer.warm_up()
+    environment = mailer.client.config.template_engine()
+
+    assert environment is mailer.client.config.template_engine()
+    assert environment.get_template("verify_email.html") is environment.get_template(
+        "verify_email.html"
+    )
+    mailer.close()